@@ -9,13 +9,22 @@
  */
 
 import PythonBridge from './python-bridge.js';
+import PythonBridgePool from './python-bridge-pool.js';
 import MCPInterceptor from './mcp-interceptor.js';
 import { DataFilter } from './data-filter.js';
 import { PrivacyTokenizer } from './privacy-tokenizer.js';
 import { EventEmitter } from 'events';
 import SkillsManager from './skills-manager.js';
+import messageFraming from './message-framing.cjs';
 import { PythonShell } from 'python-shell';
 import path from 'path';
+import { fileURLToPath } from 'url';
+
+const { readSpooledMessage } = messageFraming;
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+
+// Chunks em fila no iterador de streamSkill() antes de pausar o stdout do Python
+const STREAM_HIGH_WATER_MARK = 64;
 
 export class MCPCodeExecutionFramework extends EventEmitter {
   constructor(options = {}) {
@@ -35,8 +44,11 @@ export class MCPCodeExecutionFramework extends EventEmitter {
       ...options
     };
 
-    // Componentes principais
-    this.pythonBridge = new PythonBridge(this);
+    // Componentes principais (pythonPool: { minWorkers, maxWorkers, ... } ativa modo pool)
+    // Python executor for execute()/importPython()/evalPython(); the skills bridge lives in this.pythonBridge
+    this.pythonExecutor = this.options.pythonPool
+      ? new PythonBridgePool(this, this.options.pythonPool === true ? {} : this.options.pythonPool)
+      : new PythonBridge(this);
     this.mcpInterceptor = new MCPInterceptor(this);
     this.dataFilter = new DataFilter(options.dataFilterOptions);
     this.privacyTokenizer = new PrivacyTokenizer(options.privacyOptions);
@@ -74,7 +86,7 @@ export class MCPCodeExecutionFramework extends EventEmitter {
     console.log('[Framework] Inicializando MCP Code Execution Framework...');
 
     // 1. Inicia Python Bridge
-    await this.pythonBridge.initialize();
+    await this.pythonExecutor.initialize();
 
     // 2. Ativa enforcement (se habilitado)
     if (this.options.autoEnforce) {
@@ -94,7 +106,7 @@ export class MCPCodeExecutionFramework extends EventEmitter {
    */
   _createPythonBridge() {
     return {
-      execute: async (skillName, params, timeout) => {
+      execute: async (skillName, params, timeout, options = {}) => {
         // Ensure bridge is initialized
         if (!this.pythonBridge || !this.pythonBridge.isRunning) {
           await this._initializePythonBridge();
@@ -109,10 +121,20 @@ export class MCPCodeExecutionFramework extends EventEmitter {
           timeout: timeout || 30,
           requestId: requestId
         };
+        if (options.resources) {
+          // Result carries "resources" (CPU, RSS, GC, bytes serialized)
+          message.resources = true;
+        }
+        if (options.profile) {
+          // Result carries "profile" (hot functions, optional collapsed stacks)
+          message.profile = options.profile;
+        }
 
         return await this._sendToPython(message, requestId);
       },
 
+      stream: (skillName, params, timeout) => this._streamFromPython(skillName, params, timeout),
+
       getStats: async () => {
         if (!this.pythonBridge || !this.pythonBridge.isRunning) {
           return {
@@ -130,6 +152,34 @@ export class MCPCodeExecutionFramework extends EventEmitter {
         };
 
         return await this._sendToPython(message, requestId);
+      },
+
+      // Per-skill latency histograms and error counts ('json' or 'prometheus' text)
+      getMetrics: async (format = 'json') => {
+        if (!this.pythonBridge || !this.pythonBridge.isRunning) {
+          await this._initializePythonBridge();
+        }
+
+        const requestId = this._generateRequestId();
+        const response = await this._sendToPython(
+          { action: 'metrics', format, requestId },
+          requestId
+        );
+        return response.metrics;
+      },
+
+      // Import skills ahead of their first execution (list or 'high-priority' from registry.json)
+      preload: async (skills = 'high-priority') => {
+        if (!this.pythonBridge || !this.pythonBridge.isRunning) {
+          await this._initializePythonBridge();
+        }
+
+        const requestId = this._generateRequestId();
+        const response = await this._sendToPython(
+          { action: 'preload', skills, requestId },
+          requestId
+        );
+        return response.preload;
       }
     };
   }
@@ -225,12 +275,105 @@ export class MCPCodeExecutionFramework extends EventEmitter {
     });
   }
 
+  /**
+   * Execute a skill with streaming and yield each chunk as it arrives
+   * @private
+   * @param {string} skillName - Name of the skill
+   * @param {Object} params - Parameters for the skill
+   * @param {number} timeout - Timeout in seconds (whole stream)
+   * @returns {AsyncGenerator<any, Object>} Chunks; returns the final result message
+   */
+  async *_streamFromPython(skillName, params, timeout) {
+    if (!this.pythonBridge || !this.pythonBridge.isRunning) {
+      await this._initializePythonBridge();
+    }
+
+    const bridge = this.pythonBridge;
+    const stdout = bridge.childProcess?.stdout;
+    const requestId = this._generateRequestId();
+    const queue = [];
+    let finalMessage = null;
+    let failure = null;
+    let paused = false;
+    let wake = null;
+
+    const notify = () => {
+      if (wake) {
+        const resolve = wake;
+        wake = null;
+        resolve();
+      }
+    };
+
+    bridge.pendingRequests.set(requestId, {
+      onChunk: (message) => {
+        queue.push(message.data);
+        // Backpressure: para de ler o stdout até o consumidor alcançar
+        if (stdout && !paused && queue.length >= STREAM_HIGH_WATER_MARK) {
+          stdout.pause();
+          paused = true;
+        }
+        notify();
+      },
+      resolve: (message) => {
+        finalMessage = message;
+        notify();
+      },
+      reject: (error) => {
+        failure = error;
+        notify();
+      }
+    });
+
+    try {
+      bridge.send({
+        action: 'execute',
+        skill: skillName,
+        params: params,
+        timeout: timeout || 30,
+        stream: true,
+        requestId: requestId
+      });
+
+      while (true) {
+        if (queue.length > 0) {
+          const chunk = queue.shift();
+          if (paused && queue.length <= STREAM_HIGH_WATER_MARK / 2) {
+            stdout.resume();
+            paused = false;
+          }
+          yield chunk;
+          continue;
+        }
+        if (failure) {
+          throw failure;
+        }
+        if (finalMessage) {
+          return finalMessage;
+        }
+        await new Promise((resolve) => { wake = resolve; });
+      }
+    } finally {
+      if (paused) {
+        stdout.resume();
+      }
+      bridge.pendingRequests.delete(requestId);
+    }
+  }
+
   /**
    * Handle messages from Python bridge
    * @private
    * @param {Object} message - Message from Python
    */
   _handlePythonMessage(message) {
+    if (message.type === 'spool') {
+      message = this._readSpool(message);
+      if (!message) {
+        return;
+      }
+    }
+
     const requestId = message.requestId;
 
     if (!requestId) {
@@ -239,6 +382,14 @@ export class MCPCodeExecutionFramework extends EventEmitter {
     }
 
     const pending = this.pythonBridge.pendingRequests.get(requestId);
+
+    // Partial result of a streaming execution (request stays pending)
+    if (message.type === 'chunk') {
+      // No pending entry: the consumer stopped iterating early
+      pending?.onChunk?.(message);
+      return;
+    }
+
     if (!pending) {
       console.warn('No pending request found for requestId:', requestId);
       return;
@@ -260,6 +411,30 @@ export class MCPCodeExecutionFramework extends EventEmitter {
     }
   }
 
+  /**
+   * Read a large message from its spool file and release the handle
+   * @private
+   * @param {Object} envelope - { type: 'spool', spool: {...}, requestId }
+   * @returns {Object|null} Original message (null if it could not be read)
+   */
+  _readSpool(envelope) {
+    try {
+      return readSpooledMessage(envelope);
+    } catch (error) {
+      const pending = this.pythonBridge.pendingRequests.get(envelope.requestId);
+      if (pending) {
+        clearTimeout(pending.timeout);
+        this.pythonBridge.pendingRequests.delete(envelope.requestId);
+        pending.reject(new Error(`Failed to read spooled result: ${error.message}`));
+      }
+      return null;
+    } finally {
+      if (this.pythonBridge.isRunning) {
+        this.pythonBridge.send({ action: 'spool_release', handle: envelope.spool.id });
+      }
+    }
+  }
+
   /**
    * Generate unique request ID
    * @private
@@ -294,7 +469,7 @@ export class MCPCodeExecutionFramework extends EventEmitter {
 
       if (language === 'python') {
         // Executa via Python Bridge
-        result = await this.pythonBridge.execute(code, context);
+        result = await this.pythonExecutor.execute(code, context);
       } else {
         // JavaScript - executa diretamente
         // Nota: Para produção, usar Sandbox (já implementado em IMPLEMENTACAO-COMPLETA.md)
@@ -378,6 +553,30 @@ export class MCPCodeExecutionFramework extends EventEmitter {
     }
   }
 
+  /**
+   * Execute a Claude Skill and iterate over its partial results
+   *
+   * Skills whose execute() is a generator (or async generator) deliver
+   * each yielded chunk as soon as it is produced.
+   *
+   * @param {string} skillName - Name of the skill to execute
+   * @param {Object} params - Parameters for the skill
+   * @param {Object} options - Execution options
+   * @param {number} [options.timeoutMs] - Deadline for the whole stream
+   * @returns {AsyncGenerator<any, Object>} Chunks; the generator's return
+   *   value is the final result message
+   * @throws {Error} If the skill fails or times out
+   *
+   * @example
+   * for await (const section of framework.streamSkill('report-generator', { topic })) {
+   *   process.stdout.write(section);
+   * }
+   */
+  streamSkill(skillName, params = {}, options = {}) {
+    const timeoutMs = options.timeoutMs || this.options.skillTimeoutMs;
+    return this._streamFromPython(skillName, params, Math.ceil(timeoutMs / 1000));
+  }
+
   /**
    * List available skills
    *
@@ -441,7 +640,7 @@ export class MCPCodeExecutionFramework extends EventEmitter {
       await this.initialize();
     }
 
-    return this.pythonBridge.import(modulePath);
+    return this.pythonExecutor.import(modulePath);
   }
 
   /**
@@ -452,7 +651,7 @@ export class MCPCodeExecutionFramework extends EventEmitter {
       await this.initialize();
     }
 
-    return this.pythonBridge.eval(expression);
+    return this.pythonExecutor.eval(expression);
   }
 
   /**
@@ -462,7 +661,7 @@ export class MCPCodeExecutionFramework extends EventEmitter {
     return {
       ...this.stats,
       initialized: this.initialized,
-      pythonBridge: this.pythonBridge.getStats(),
+      pythonBridge: this.pythonExecutor.getStats(),
       mcpInterceptor: this.mcpInterceptor.getStats()
     };
   }
@@ -528,7 +727,7 @@ export class MCPCodeExecutionFramework extends EventEmitter {
     }
 
     // Cleanup original Python bridge
-    await this.pythonBridge.cleanup();
+    await this.pythonExecutor.cleanup();
 
     if (this.options.autoEnforce) {
       this.mcpInterceptor.disable();
@@ -0,0 +1,251 @@
+/**
+ * @fileoverview Message Framing - Codificação das mensagens JS ↔ Python
+ * @module core/message-framing
+ * @description Implementa os framings aceitos por core/python_server.py e
+ * servers/skills/bridge.py (ver servers/skills/protocol.py):
+ * - 'jsonl': uma mensagem JSON por linha (padrão)
+ * - 'frame-json': prefixo de 4 bytes (big-endian) + payload JSON UTF-8
+ * - 'frame-msgpack': prefixo de 4 bytes + payload MessagePack
+ *   (requer o pacote opcional @msgpack/msgpack)
+ *
+ * Mensagens grandes chegam como envelope { type: 'spool', spool: { id, path,
+ * size, encoding } }: o conteúdo está no arquivo (em /dev/shm quando
+ * disponível) e deve ser lido com readSpooledMessage() e liberado com uma
+ * mensagem de release (ver servers/skills/spool.py).
+ * @author Claude AI
+ * @version 1.0.0
+ */
+
+const fs = require('fs');
+
+const FRAMINGS = {
+  JSONL: 'jsonl',
+  JSON: 'frame-json',
+  MSGPACK: 'frame-msgpack'
+};
+
+const HEADER_SIZE = 4;
+const NEWLINE = 0x0a;
+
+// Dependência opcional
+let msgpack = null;
+try {
+  msgpack = require('@msgpack/msgpack');
+} catch (error) {
+  msgpack = null;
+}
+
+/**
+ * Framings suportados por este processo
+ * @returns {Array<string>}
+ */
+function supportedFramings() {
+  const framings = [FRAMINGS.JSONL, FRAMINGS.JSON];
+  if (msgpack) {
+    framings.push(FRAMINGS.MSGPACK);
+  }
+  return framings;
+}
+
+/**
+ * Escolhe o framing a negociar
+ * @param {string} requested - Framing desejado ('jsonl', 'frame-json', 'frame-msgpack')
+ * @param {Array<string>} [remoteFramings=[]] - Framings anunciados no "ready" do Python
+ * @returns {string} Framing suportado pelos dois lados (fallback: 'frame-json', depois 'jsonl')
+ */
+function negotiateFraming(requested, remoteFramings = []) {
+  const local = supportedFramings();
+  const candidates = [requested, FRAMINGS.JSON, FRAMINGS.JSONL];
+
+  for (const framing of candidates) {
+    if (local.includes(framing) && (framing === FRAMINGS.JSONL || remoteFramings.includes(framing))) {
+      return framing;
+    }
+  }
+  return FRAMINGS.JSONL;
+}
+
+/**
+ * Codifica mensagem no framing informado
+ * @param {Object} message - Mensagem
+ * @param {string} [framing='jsonl'] - Framing
+ * @returns {Buffer|string} Dados prontos para stdin.write()
+ */
+function encodeMessage(message, framing = FRAMINGS.JSONL) {
+  if (framing === FRAMINGS.JSONL) {
+    return JSON.stringify(message) + '\n';
+  }
+
+  const payload = framing === FRAMINGS.MSGPACK
+    ? Buffer.from(msgpack.encode(message))
+    : Buffer.from(JSON.stringify(message), 'utf8');
+
+  const header = Buffer.allocUnsafe(HEADER_SIZE);
+  header.writeUInt32BE(payload.length, 0);
+  return Buffer.concat([header, payload], HEADER_SIZE + payload.length);
+}
+
+/**
+ * Decodificador incremental de mensagens vindas do stdout do Python
+ * @class MessageDecoder
+ * @description Acumula chunks sem reconcatenar a cada 'data' e só varre
+ * bytes novos em busca de '\n'; em modo frame lê o tamanho e aguarda o
+ * payload completo. O framing pode mudar entre mensagens (negociação).
+ * @example
+ * const decoder = new MessageDecoder();
+ * proc.stdout.on('data', (chunk) => decoder.push(chunk, (message) => handle(message)));
+ */
+class MessageDecoder {
+  /**
+   * @param {Object} [options={}]
+   * @param {string} [options.framing='jsonl'] - Framing inicial
+   * @param {Function} [options.onError] - Chamado com (error, raw) para mensagens inválidas
+   */
+  constructor(options = {}) {
+    this.framing = options.framing || FRAMINGS.JSONL;
+    this.onError = options.onError || (() => {});
+
+    this.chunks = [];
+    this.length = 0;
+    this.scanned = 0; // Bytes já varridos sem encontrar '\n'
+  }
+
+  /**
+   * Altera o framing (vale para os próximos bytes do buffer)
+   * @param {string} framing
+   */
+  setFraming(framing) {
+    this.framing = framing;
+    this.scanned = 0;
+  }
+
+  /**
+   * Adiciona chunk e entrega cada mensagem completa
+   * @param {Buffer|string} chunk - Dados recebidos
+   * @param {Function} onMessage - Callback por mensagem (pode chamar setFraming)
+   */
+  push(chunk, onMessage) {
+    if (typeof chunk === 'string') {
+      chunk = Buffer.from(chunk, 'utf8');
+    }
+    if (chunk.length === 0) {
+      return;
+    }
+
+    this.chunks.push(chunk);
+    this.length += chunk.length;
+
+    while (this.length > 0) {
+      const payload = this.framing === FRAMINGS.JSONL ? this._nextLine() : this._nextFrame();
+      if (payload === null) {
+        break;
+      }
+      if (payload === undefined) {
+        continue; // Linha vazia
+      }
+
+      let message;
+      try {
+        message = this._decode(payload);
+      } catch (error) {
+        this.onError(error, payload);
+        continue;
+      }
+      onMessage(message);
+    }
+  }
+
+  /**
+   * Remove os primeiros n bytes do buffer
+   * @private
+   */
+  _take(n) {
+    const data = this.chunks.length === 1 ? this.chunks[0] : Buffer.concat(this.chunks, this.length);
+    const rest = data.subarray(n);
+
+    this.chunks = rest.length > 0 ? [rest] : [];
+    this.length = rest.length;
+    this.scanned = 0;
+
+    return data.subarray(0, n);
+  }
+
+  /**
+   * Próxima linha completa (null: incompleta, undefined: vazia)
+   * @private
+   */
+  _nextLine() {
+    let base = 0;
+    for (const chunk of this.chunks) {
+      if (base + chunk.length > this.scanned) {
+        const index = chunk.indexOf(NEWLINE, Math.max(0, this.scanned - base));
+        if (index !== -1) {
+          const line = this._take(base + index + 1).subarray(0, base + index);
+          return line.toString('utf8').trim() ? line : undefined;
+        }
+      }
+      base += chunk.length;
+    }
+
+    this.scanned = this.length;
+    return null;
+  }
+
+  /**
+   * Próximo frame completo (null: incompleto)
+   * @private
+   */
+  _nextFrame() {
+    if (this.length < HEADER_SIZE) {
+      return null;
+    }
+
+    const head = this.chunks[0].length >= HEADER_SIZE
+      ? this.chunks[0]
+      : Buffer.concat(this.chunks, this.length);
+    const size = head.readUInt32BE(0);
+
+    if (this.length < HEADER_SIZE + size) {
+      return null;
+    }
+    return this._take(HEADER_SIZE + size).subarray(HEADER_SIZE);
+  }
+
+  /**
+   * @private
+   */
+  _decode(payload) {
+    if (this.framing === FRAMINGS.MSGPACK) {
+      return msgpack.decode(payload);
+    }
+    return JSON.parse(payload.toString('utf8'));
+  }
+}
+
+/**
+ * Lê a mensagem original de um envelope de spool
+ * @param {Object} envelope - Mensagem { type: 'spool', spool: {...} }
+ * @returns {Object} Mensagem como se tivesse chegado pelo pipe
+ * @throws {Error} Se o arquivo não puder ser lido ou decodificado
+ */
+function readSpooledMessage(envelope) {
+  const { path, encoding } = envelope.spool;
+  const data = fs.readFileSync(path);
+
+  if (encoding === 'msgpack') {
+    if (!msgpack) {
+      throw new Error('Spool em msgpack requer @msgpack/msgpack');
+    }
+    return msgpack.decode(data);
+  }
+  return JSON.parse(data.toString('utf8'));
+}
+
+module.exports = {
+  FRAMINGS,
+  MessageDecoder,
+  encodeMessage,
+  negotiateFraming,
+  readSpooledMessage,
+  supportedFramings
+};
@@ -7,11 +7,27 @@
  * @requires child_process
  * @requires path
  * @requires events
+ * @requires ./message-framing
  */
 
 const { spawn } = require('child_process');
 const path = require('path');
 const { EventEmitter } = require('events');
+const {
+  FRAMINGS,
+  MessageDecoder,
+  encodeMessage,
+  negotiateFraming,
+  readSpooledMessage
+} = require('./message-framing.cjs');
+
+// Raiz do projeto: o bridge usa imports relativos e é importado como pacote
+const PROJECT_ROOT = path.join(__dirname, '..');
+
+// Entry point do bridge (servers/skills/__init__.py já importa o módulo,
+// então `-m servers.skills.bridge` o executaria duas vezes)
+const BRIDGE_BOOTSTRAP =
+  'import asyncio; from servers.skills.bridge import PythonBridge; asyncio.run(PythonBridge().start())';
 
 /**
  * Gerencia pool de processos Python reutilizáveis
@@ -32,7 +48,8 @@ class PythonProcessPool extends EventEmitter {
    * @param {number} [options.maxRestarts=3] - Máximo de restarts por processo
    * @param {number} [options.restartDelay=1000] - Delay entre restarts em ms
    * @param {string} [options.pythonPath='python'] - Caminho do executável Python
-   * @param {string} [options.bridgePath] - Caminho do bridge.py (opcional)
+   * @param {string} [options.bridgePath] - Caminho de um bridge alternativo (padrão: servers.skills.bridge importado do projeto)
+   * @param {string} [options.framing='jsonl'] - Framing desejado ('jsonl', 'frame-json', 'frame-msgpack')
    */
   constructor(options = {}) {
     super();
@@ -43,7 +60,8 @@ class PythonProcessPool extends EventEmitter {
       maxRestarts: options.maxRestarts || 3,
       restartDelay: options.restartDelay || 1000,
       pythonPath: options.pythonPath || 'python',
-      bridgePath: options.bridgePath || path.join(__dirname, '..', 'servers', 'skills', 'bridge.py'),
+      bridgePath: options.bridgePath || null,
+      framing: options.framing || FRAMINGS.JSONL,
       ...options
     };
 
@@ -126,7 +144,7 @@ class PythonProcessPool extends EventEmitter {
 
     try {
       // Executar skill
-      const result = await process.execute(skillName, params, timeout);
+      const result = await this._executeInProcess(process, skillName, params, timeout);
 
       // Atualizar métricas de execução
       const executionTime = Date.now() - startTime - waitTime;
@@ -194,8 +212,13 @@ class PythonProcessPool extends EventEmitter {
   async _spawnProcess(id) {
     console.log(`[ProcessPool] Spawning process #${id}...`);
 
-    const pythonProcess = spawn(this.options.pythonPath, [this.options.bridgePath], {
+    const args = this.options.bridgePath
+      ? [this.options.bridgePath]
+      : ['-c', BRIDGE_BOOTSTRAP];
+
+    const pythonProcess = spawn(this.options.pythonPath, args, {
       stdio: ['pipe', 'pipe', 'pipe'],
+      cwd: PROJECT_ROOT,
       env: { ...process.env, PYTHONUNBUFFERED: '1' }
     });
 
@@ -205,35 +228,38 @@ class PythonProcessPool extends EventEmitter {
       isReady: false,
       restartCount: 0,
       totalExecutions: 0,
-      startTime: Date.now()
+      startTime: Date.now(),
+      framing: FRAMINGS.JSONL,
+      decoder: new MessageDecoder()
     };
 
+    // Mensagens stdout (linhas ou frames, conforme framing negociado)
+    pythonProcess.stdout.on('data', (data) => {
+      processObj.decoder.push(data, (message) => {
+        if (message.type === 'framing' && !message.error) {
+          processObj.decoder.setFraming(message.framing);
+        }
+        this.emit('message', { processId: processObj.id, message });
+      });
+    });
+
     // Aguardar ready signal
-    await new Promise((resolve, reject) => {
+    const ready = await new Promise((resolve, reject) => {
       const timeout = setTimeout(() => {
+        this.off('message', readyHandler);
         reject(new Error(`Process #${id} initialization timeout`));
       }, 10000);
 
-      const stdoutHandler = (data) => {
-        const lines = data.toString().split('\n');
-        for (const line of lines) {
-          if (line.trim()) {
-            try {
-              const message = JSON.parse(line.trim());
-              if (message.type === 'ready') {
-                clearTimeout(timeout);
-                processObj.isReady = true;
-                pythonProcess.stdout.off('data', stdoutHandler);
-                resolve();
-              }
-            } catch (e) {
-              // Ignorar linhas não-JSON
-            }
-          }
+      const readyHandler = ({ processId, message }) => {
+        if (processId === id && message.type === 'ready') {
+          clearTimeout(timeout);
+          processObj.isReady = true;
+          this.off('message', readyHandler);
+          resolve(message);
         }
       };
 
-      pythonProcess.stdout.on('data', stdoutHandler);
+      this.on('message', readyHandler);
 
       pythonProcess.on('error', (err) => {
         clearTimeout(timeout);
@@ -248,6 +274,10 @@ class PythonProcessPool extends EventEmitter {
       });
     });
 
+    if (this.options.framing !== FRAMINGS.JSONL) {
+      await this._negotiateFraming(processObj, ready.framings || []);
+    }
+
     // Configurar handlers
     this._setupProcessHandlers(processObj);
 
@@ -258,28 +288,76 @@ class PythonProcessPool extends EventEmitter {
   }
 
   /**
-   * Configura handlers de mensagens e erros do processo
+   * Negocia framing com o bridge.py
    * @private
+   * @async
    * @param {Object} processObj - Objeto do processo
+   * @param {Array<string>} remoteFramings - Framings anunciados no ready
    */
-  _setupProcessHandlers(processObj) {
-    const pythonProcess = processObj.process;
+  async _negotiateFraming(processObj, remoteFramings) {
+    const framing = negotiateFraming(this.options.framing, remoteFramings);
+    if (framing === FRAMINGS.JSONL) {
+      return;
+    }
 
-    // Mensagens stdout
-    pythonProcess.stdout.on('data', (data) => {
-      const lines = data.toString().split('\n');
-      for (const line of lines) {
-        if (line.trim()) {
-          try {
-            const message = JSON.parse(line.trim());
-            this.emit('message', { processId: processObj.id, message });
-          } catch (e) {
-            // Ignorar linhas não-JSON
-          }
+    const requestId = `framing_${processObj.id}_${Date.now()}`;
+    const ack = new Promise((resolve) => {
+      const handler = ({ processId, message }) => {
+        if (processId === processObj.id && message.requestId === requestId) {
+          this.off('message', handler);
+          resolve(message);
         }
-      }
+      };
+      this.on('message', handler);
     });
 
+    // Pedido em JSON lines; stdin passa ao novo framing logo em seguida
+    this._write(processObj, { action: 'set_framing', framing, requestId });
+    processObj.framing = framing;
+
+    const message = await ack;
+    if (message.type !== 'framing') {
+      processObj.framing = FRAMINGS.JSONL;
+      console.warn(`[ProcessPool] Framing recusado pelo process #${processObj.id}: ${message.error}`);
+    }
+  }
+
+  /**
+   * Envia mensagem ao processo no framing negociado
+   * @private
+   * @param {Object} processObj - Objeto do processo
+   * @param {Object} message - Mensagem
+   */
+  _write(processObj, message) {
+    processObj.process.stdin.write(encodeMessage(message, processObj.framing));
+  }
+
+  /**
+   * Lê a mensagem de um envelope de spool e libera o arquivo no bridge
+   * @private
+   * @param {Object} processObj - Objeto do processo
+   * @param {Object} envelope - Mensagem { type: 'spool', spool: {...} }
+   * @returns {Object} Mensagem original
+   * @throws {Error} Se o arquivo não puder ser lido
+   */
+  _readSpool(processObj, envelope) {
+    try {
+      return readSpooledMessage(envelope);
+    } finally {
+      if (processObj.process.exitCode === null) {
+        this._write(processObj, { action: 'spool_release', handle: envelope.spool.id });
+      }
+    }
+  }
+
+  /**
+   * Configura handlers de mensagens e erros do processo
+   * @private
+   * @param {Object} processObj - Objeto do processo
+   */
+  _setupProcessHandlers(processObj) {
+    const pythonProcess = processObj.process;
+
     // Mensagens stderr
     pythonProcess.stderr.on('data', (data) => {
       console.error(`[ProcessPool] Process #${processObj.id} STDERR:`, data.toString());
@@ -321,28 +399,44 @@ class PythonProcessPool extends EventEmitter {
       const requestId = `req_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
 
       const timeoutHandle = setTimeout(() => {
+        this.off('message', messageHandler);
         reject(new Error(`Execution timeout after ${timeout}ms`));
       }, timeout);
 
       const messageHandler = (data) => {
-        const { processId, message } = data;
+        const { processId } = data;
+        let { message } = data;
 
-        if (processId === processObj.id && message.requestId === requestId) {
-          clearTimeout(timeoutHandle);
+        if (processId !== processObj.id || message.requestId !== requestId) {
+          return;
+        }
 
-          if (message.type === 'result') {
-            processObj.totalExecutions++;
-            this.emit('executed', {
-              processId: processObj.id,
-              skillName,
-              executionTime: message.executionTime
-            });
-            resolve(message);
-          } else if (message.type === 'error') {
-            reject(new Error(message.error));
+        // Resultado grande: o bridge gravou em arquivo e enviou só o envelope
+        if (message.type === 'spool') {
+          try {
+            message = this._readSpool(processObj, message);
+          } catch (error) {
+            clearTimeout(timeoutHandle);
+            this.off('message', messageHandler);
+            reject(new Error(`Failed to read spooled result: ${error.message}`));
+            return;
           }
+        }
 
+        if (message.type === 'result') {
+          clearTimeout(timeoutHandle);
+          this.off('message', messageHandler);
+          processObj.totalExecutions++;
+          this.emit('executed', {
+            processId: processObj.id,
+            skillName,
+            executionTime: message.executionTime
+          });
+          resolve(message);
+        } else if (message.type === 'error') {
+          clearTimeout(timeoutHandle);
           this.off('message', messageHandler);
+          reject(new Error(message.error));
         }
       };
 
@@ -358,7 +452,7 @@ class PythonProcessPool extends EventEmitter {
           requestId
         };
 
-        processObj.process.stdin.write(JSON.stringify(message) + '\n');
+        this._write(processObj, message);
       } catch (error) {
         clearTimeout(timeoutHandle);
         this.off('message', messageHandler);
@@ -425,7 +519,7 @@ class PythonProcessPool extends EventEmitter {
         };
 
         // Enviar ping
-        processObj.process.stdin.write(JSON.stringify(healthMessage) + '\n');
+        this._write(processObj, healthMessage);
 
         // Aguardar resposta com timeout
         await new Promise((resolve, reject) => {
@@ -0,0 +1,401 @@
+/**
+ * Python Bridge Pool - Pool de interpretadores python_server.py
+ *
+ * Responsabilidades:
+ * - Manter N processos Python pré-iniciados (ready-check antes do uso)
+ * - Rotear cada requisição para o worker menos carregado
+ * - Escalar entre minWorkers e maxWorkers pela profundidade da fila
+ * - Reiniciar workers que caírem sem afetar requisições de outros workers
+ *
+ * Nota: cada worker tem seu próprio estado global; variáveis definidas em
+ * uma execução não ficam visíveis para execuções roteadas a outro worker.
+ * Sessões (createSession) ficam presas ao worker que as criou.
+ *
+ * @module core/python-bridge-pool
+ * @complexity HIGH
+ */
+
+import { EventEmitter } from 'events';
+import os from 'os';
+import { PythonBridge } from './python-bridge.js';
+
+export class PythonBridgePool extends EventEmitter {
+  /**
+   * @param {object} framework - Framework (módulos JS acessíveis via js.call)
+   * @param {object} [options={}] - Opções do pool
+   * @param {number} [options.minWorkers=2] - Workers sempre ativos
+   * @param {number} [options.maxWorkers=os.cpus().length] - Limite de workers
+   * @param {number} [options.scaleUpQueueDepth=4] - Requisições pendentes por worker que disparam scale-up
+   * @param {number} [options.idleTimeoutMs=60000] - Tempo ocioso antes de encerrar workers acima do mínimo
+   * @param {number} [options.restartDelay=1000] - Delay antes de reiniciar worker que caiu
+   */
+  constructor(framework, options = {}) {
+    super();
+
+    const cpus = os.cpus().length || 1;
+    // Opções passadas como undefined não apagam os padrões
+    const defined = Object.fromEntries(
+      Object.entries(options).filter(([, value]) => value !== undefined)
+    );
+
+    this.framework = framework;
+    this.options = {
+      minWorkers: options.minWorkers || Math.min(2, cpus),
+      maxWorkers: options.maxWorkers || Math.max(cpus, options.minWorkers || 1),
+      scaleUpQueueDepth: options.scaleUpQueueDepth || 4,
+      idleTimeoutMs: options.idleTimeoutMs || 60000,
+      restartDelay: options.restartDelay || 1000,
+      ...defined
+    };
+
+    this.workers = [];
+    this.starting = 0;
+    this.initialized = false;
+    this.shuttingDown = false;
+    this.idleTimer = null;
+    this.requestId = 0;
+
+    // Sessão -> worker que guarda seu namespace
+    this.sessionWorkers = new Map();
+
+    this.stats = {
+      spawned: 0,
+      restarts: 0,
+      scaleUps: 0,
+      scaleDowns: 0
+    };
+  }
+
+  /**
+   * Inicia minWorkers processos e aguarda o "ready" de todos
+   */
+  async initialize() {
+    if (this.initialized) {
+      return;
+    }
+
+    console.log(`[PythonBridgePool] Iniciando ${this.options.minWorkers} workers...`);
+
+    this.shuttingDown = false;
+    await Promise.all(
+      Array.from({ length: this.options.minWorkers }, () => this._spawnWorker())
+    );
+
+    this.idleTimer = setInterval(() => this._scaleDown(), this.options.idleTimeoutMs);
+    this.idleTimer.unref?.();
+
+    this.initialized = true;
+    console.log('[PythonBridgePool] Pool inicializado com sucesso');
+  }
+
+  /**
+   * Cria worker, aguarda ready-check e o adiciona ao pool
+   */
+  async _spawnWorker() {
+    this.starting++;
+
+    const bridge = new PythonBridge(this.framework);
+    const worker = { bridge, inFlight: 0, lastUsed: Date.now(), retired: false, sessions: 0 };
+
+    try {
+      await bridge.initialize();
+    } finally {
+      this.starting--;
+    }
+
+    bridge.on('exit', (code) => this._handleWorkerExit(worker, code));
+
+    this.workers.push(worker);
+    this.stats.spawned++;
+    return worker;
+  }
+
+  /**
+   * Worker terminou: remove do pool e repõe se não foi intencional
+   */
+  _handleWorkerExit(worker, code) {
+    this.workers = this.workers.filter(w => w !== worker);
+
+    // Sessões do worker morreram com ele
+    for (const [name, owner] of this.sessionWorkers) {
+      if (owner === worker) {
+        this.sessionWorkers.delete(name);
+      }
+    }
+
+    if (this.shuttingDown || worker.retired) {
+      return;
+    }
+
+    console.warn(`[PythonBridgePool] Worker terminou (código ${code}), reiniciando...`);
+    this.emit('workerExit', { code, processId: worker.bridge.pythonProcess?.pid });
+
+    setTimeout(async () => {
+      if (this.shuttingDown || this._size() >= this.options.minWorkers) {
+        return;
+      }
+      try {
+        await this._spawnWorker();
+        this.stats.restarts++;
+      } catch (error) {
+        console.error('[PythonBridgePool] Falha ao reiniciar worker:', error.message);
+      }
+    }, this.options.restartDelay);
+  }
+
+  /**
+   * Total de workers ativos ou iniciando
+   */
+  _size() {
+    return this.workers.length + this.starting;
+  }
+
+  /**
+   * Carga de um worker (requisições roteadas e ainda sem resposta)
+   */
+  _load(worker) {
+    return worker.inFlight;
+  }
+
+  /**
+   * Escolhe worker menos carregado e dispara scale-up se a fila crescer
+   */
+  async _selectWorker() {
+    if (!this.initialized) {
+      await this.initialize();
+    }
+
+    // Ignora workers cujo processo já caiu (evento exit ainda não tratado)
+    let alive = this.workers.filter(w => w.bridge.initialized);
+    if (alive.length === 0) {
+      // Todos caíram: sobe um worker antes de atender
+      alive = [await this._spawnWorker()];
+    }
+
+    let selected = alive[0];
+    for (const worker of alive) {
+      if (this._load(worker) < this._load(selected)) {
+        selected = worker;
+      }
+    }
+
+    if (this._load(selected) >= this.options.scaleUpQueueDepth &&
+        this._size() < this.options.maxWorkers) {
+      this.stats.scaleUps++;
+      this._spawnWorker().catch((error) => {
+        console.error('[PythonBridgePool] Falha no scale-up:', error.message);
+      });
+    }
+
+    selected.inFlight++;
+    selected.lastUsed = Date.now();
+    return selected;
+  }
+
+  /**
+   * Encerra workers ociosos acima de minWorkers
+   */
+  async _scaleDown() {
+    const now = Date.now();
+
+    for (const worker of [...this.workers]) {
+      if (this.workers.length <= this.options.minWorkers) {
+        break;
+      }
+
+      if (this._load(worker) !== 0 || now - worker.lastUsed < this.options.idleTimeoutMs) {
+        continue;
+      }
+
+      if (worker.sessions > 0) {
+        await this._reconcileSessions(worker);
+      }
+
+      if (this._load(worker) === 0 && worker.sessions === 0 &&
+          this.workers.length > this.options.minWorkers) {
+        worker.retired = true;
+        this.workers = this.workers.filter(w => w !== worker);
+        this.stats.scaleDowns++;
+        await worker.bridge.cleanup();
+      }
+    }
+  }
+
+  /**
+   * Executa código Python no worker menos carregado
+   *
+   * @param {string} code - Código Python a executar
+   * @param {object} context - Contexto disponível para o código
+   * @returns {Promise<any>} Resultado da execução
+   */
+  async execute(code, context = {}, options = {}) {
+    const worker = options.session
+      ? this._sessionWorker(options.session)
+      : await this._selectWorker();
+    this.requestId++;
+
+    try {
+      return await worker.bridge.execute(code, context, options);
+    } catch (error) {
+      if (options.session && error.message.includes('Sessão não encontrada')) {
+        // O python_server descartou a sessão (TTL ocioso ou LRU)
+        this._forgetSession(options.session, worker);
+      }
+      throw error;
+    } finally {
+      worker.inFlight--;
+      worker.lastUsed = Date.now();
+    }
+  }
+
+  /**
+   * Cria sessão no worker menos carregado (execuções nela vão sempre para ele)
+   *
+   * @param {string} name - Nome da sessão
+   * @returns {Promise<object>} Informações da sessão
+   */
+  async createSession(name) {
+    const owner = this.sessionWorkers.get(name);
+    const worker = owner && owner.bridge.initialized
+      ? this._sessionWorker(name)
+      : await this._selectWorker();
+
+    try {
+      const info = await worker.bridge.createSession(name);
+      if (!this.sessionWorkers.has(name)) {
+        this.sessionWorkers.set(name, worker);
+        worker.sessions++;
+      }
+      return info;
+    } finally {
+      worker.inFlight--;
+    }
+  }
+
+  /**
+   * Remove sessão do worker que a guarda
+   *
+   * @param {string} name - Nome da sessão
+   * @returns {Promise<object>} { name, dropped }
+   */
+  async dropSession(name) {
+    if (!this.sessionWorkers.has(name)) {
+      return { name, dropped: false };
+    }
+
+    const worker = this._sessionWorker(name);
+    this.sessionWorkers.delete(name);
+    worker.sessions--;
+
+    try {
+      return await worker.bridge.dropSession(name);
+    } finally {
+      worker.inFlight--;
+    }
+  }
+
+  /**
+   * Worker dono de uma sessão (já contabilizado em inFlight)
+   */
+  _sessionWorker(name) {
+    const worker = this.sessionWorkers.get(name);
+    if (!worker || !worker.bridge.initialized) {
+      throw new Error(`Sessão não encontrada: ${name} (use createSession)`);
+    }
+
+    worker.inFlight++;
+    worker.lastUsed = Date.now();
+    return worker;
+  }
+
+  /**
+   * Esquece sessão que o worker não guarda mais
+   */
+  _forgetSession(name, worker) {
+    if (this.sessionWorkers.get(name) === worker) {
+      this.sessionWorkers.delete(name);
+      worker.sessions--;
+    }
+  }
+
+  /**
+   * Remove do pool as sessões do worker que o python_server já descartou
+   */
+  async _reconcileSessions(worker) {
+    let stats;
+    try {
+      stats = await worker.bridge.getServerStats();
+    } catch (error) {
+      console.error('[PythonBridgePool] Falha ao consultar sessões do worker:', error.message);
+      return;
+    }
+
+    const alive = new Set(stats.sessions.sessions.map(session => session.name));
+    for (const [name, owner] of this.sessionWorkers) {
+      if (owner === worker && !alive.has(name)) {
+        this._forgetSession(name, worker);
+      }
+    }
+  }
+
+  /**
+   * Avalia expressão Python (retorna valor)
+   */
+  async eval(expression) {
+    return this.execute(`return ${expression}`);
+  }
+
+  /**
+   * Importa módulo Python (chamadas são roteadas pelo pool)
+   */
+  async import(modulePath) {
+    return PythonBridge.prototype.import.call(this, modulePath);
+  }
+
+  /**
+   * Obtém estatísticas dos processos Python (uma entrada por worker)
+   */
+  async getServerStats() {
+    return Promise.all(this.workers.map(w => w.bridge.getServerStats()));
+  }
+
+  /**
+   * Obtém estatísticas do pool
+   */
+  getStats() {
+    const workers = this.workers.map(w => ({
+      processId: w.bridge.pythonProcess?.pid,
+      pendingRequests: this._load(w)
+    }));
+
+    return {
+      ...this.stats,
+      initialized: this.initialized,
+      workers: workers.length,
+      starting: this.starting,
+      minWorkers: this.options.minWorkers,
+      maxWorkers: this.options.maxWorkers,
+      pendingRequests: workers.reduce((sum, w) => sum + w.pendingRequests, 0),
+      totalRequestsSent: this.requestId,
+      workerStats: workers
+    };
+  }
+
+  /**
+   * Finaliza todos os workers
+   */
+  async cleanup() {
+    this.shuttingDown = true;
+
+    if (this.idleTimer) {
+      clearInterval(this.idleTimer);
+      this.idleTimer = null;
+    }
+
+    await Promise.all(this.workers.map(w => w.bridge.cleanup()));
+    this.workers = [];
+    this.initialized = false;
+  }
+}
+
+export default PythonBridgePool;
@@ -16,10 +16,16 @@ import { spawn } from 'child_process';
 import { EventEmitter } from 'events';
 import path from 'path';
 import { fileURLToPath } from 'url';
+import messageFraming from './message-framing.cjs';
+
+const { FRAMINGS, MessageDecoder, encodeMessage, negotiateFraming, readSpooledMessage } = messageFraming;
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
+// Campos opcionais de execute() pedidos em options (resources, profile)
+const EXECUTION_EXTRAS = ['resources', 'profile'];
+
 export class PythonBridge extends EventEmitter {
   constructor(framework) {
     super();
@@ -30,9 +36,17 @@ export class PythonBridge extends EventEmitter {
     this.pendingRequests = new Map();
     this.initialized = false;
     this.pythonPath = process.env.PYTHON_PATH || 'python';
+    this.maxConcurrency = framework?.options?.pythonMaxConcurrency;
+
+    // Mensagens acima deste tamanho (bytes) chegam por arquivo de spool (0 desativa)
+    this.spoolThreshold = framework?.options?.pythonSpoolThreshold;
+
+    // Framing desejado ('jsonl' | 'frame-json' | 'frame-msgpack'), negociado após o ready
+    this.requestedFraming = framework?.options?.pythonFraming || FRAMINGS.JSONL;
+    this.framing = FRAMINGS.JSONL;
 
-    // Buffer para mensagens parciais
-    this.messageBuffer = '';
+    // Decodificador incremental (mensagens parciais ficam bufferizadas nele)
+    this.decoder = null;
   }
 
   /**
@@ -45,13 +59,22 @@ export class PythonBridge extends EventEmitter {
 
     const pythonServerPath = path.join(__dirname, 'python_server.py');
 
+    this.framing = FRAMINGS.JSONL;
+    this.decoder = new MessageDecoder({
+      onError: (error, raw) => {
+        console.error('[PythonBridge] Erro ao parsear mensagem:', raw.toString('utf8', 0, 200));
+        console.error(error);
+      }
+    });
+
     console.log('[PythonBridge] Iniciando processo Python...');
 
     this.pythonProcess = spawn(this.pythonPath, [
       '-u',  // Unbuffered output
       pythonServerPath
     ], {
-      stdio: ['pipe', 'pipe', 'pipe']
+      stdio: ['pipe', 'pipe', 'pipe'],
+      env: this._processEnv()
     });
 
     // Processa saída (STDOUT)
@@ -64,25 +87,84 @@ export class PythonBridge extends EventEmitter {
       console.error('[PythonBridge] Python STDERR:', data.toString());
     });
 
+    // Processo morto: escrita no stdin falha com EPIPE (tratado no exit)
+    this.pythonProcess.stdin.on('error', (error) => {
+      console.error('[PythonBridge] Erro no stdin do Python:', error.message);
+    });
+
     // Trata término do processo
     this.pythonProcess.on('exit', (code) => {
       console.log(`[PythonBridge] Processo Python terminou com código ${code}`);
       this.initialized = false;
 
       // Rejeita todas as requisições pendentes
-      for (const [, { reject }] of this.pendingRequests) {
+      for (const [, { reject, timer }] of this.pendingRequests) {
+        clearTimeout(timer);
         reject(new Error('Python process terminated'));
       }
       this.pendingRequests.clear();
+
+      this.emit('exit', code);
     });
 
     // Aguarda confirmação de inicialização
-    await this._waitForReady();
+    const ready = await this._waitForReady();
 
     this.initialized = true;
+
+    if (this.requestedFraming !== FRAMINGS.JSONL) {
+      await this._negotiateFraming(ready.framings || []);
+    }
+
     console.log('[PythonBridge] Processo Python inicializado com sucesso');
   }
 
+  /**
+   * Variáveis de ambiente do processo Python
+   */
+  _processEnv() {
+    const env = { ...process.env };
+    if (this.maxConcurrency) {
+      env.MCP_PYTHON_MAX_CONCURRENCY = String(this.maxConcurrency);
+    }
+    if (this.spoolThreshold !== undefined) {
+      env.MCP_SPOOL_THRESHOLD = String(this.spoolThreshold);
+    }
+    return env;
+  }
+
+  /**
+   * Negocia framing com o Python
+   *
+   * O pedido vai em JSON lines; a partir dele o stdin usa o novo framing.
+   * O ack chega em JSON lines e os bytes seguintes do stdout no novo framing.
+   */
+  async _negotiateFraming(remoteFramings) {
+    const framing = negotiateFraming(this.requestedFraming, remoteFramings);
+    if (framing === FRAMINGS.JSONL) {
+      return;
+    }
+
+    const ack = new Promise((resolve) => {
+      const ackHandler = (message) => {
+        if (message.type === 'framing') {
+          this.removeListener('message', ackHandler);
+          resolve(message);
+        }
+      };
+      this.on('message', ackHandler);
+    });
+
+    this._sendToPython({ type: 'set_framing', framing });
+    this.framing = framing;
+
+    const message = await ack;
+    if (message.error) {
+      this.framing = FRAMINGS.JSONL;
+      console.warn(`[PythonBridge] Framing recusado: ${message.error}`);
+    }
+  }
+
   /**
    * Aguarda mensagem de "ready" do Python
    */
@@ -96,7 +178,7 @@ export class PythonBridge extends EventEmitter {
         if (message.type === 'ready') {
           clearTimeout(timeout);
           this.removeListener('message', readyHandler);
-          resolve();
+          resolve(message);
         }
       };
 
@@ -108,29 +190,26 @@ export class PythonBridge extends EventEmitter {
    * Processa saída do Python (STDOUT)
    */
   _handleStdout(data) {
-    this.messageBuffer += data.toString();
-
-    // Processa mensagens completas (delimitadas por \n)
-    const lines = this.messageBuffer.split('\n');
-    this.messageBuffer = lines.pop(); // Última linha (possivelmente incompleta)
-
-    for (const line of lines) {
-      if (!line.trim()) continue;
-
-      try {
-        const message = JSON.parse(line);
-        this._handleMessage(message);
-      } catch (error) {
-        console.error('[PythonBridge] Erro ao parsear mensagem:', line);
-        console.error(error);
-      }
-    }
+    // Mensagens completas (linhas ou frames) são entregues uma a uma
+    this.decoder.push(data, (message) => this._handleMessage(message));
   }
 
   /**
    * Processa mensagem do Python
    */
   _handleMessage(message) {
+    if (message.type === 'spool') {
+      message = this._readSpool(message);
+      if (!message) {
+        return;
+      }
+    }
+
+    if (message.type === 'framing' && !message.error) {
+      // Bytes seguintes do stdout já chegam no novo framing
+      this.decoder.setFraming(message.framing);
+    }
+
     this.emit('message', message);
 
     if (message.type === 'response') {
@@ -138,11 +217,18 @@ export class PythonBridge extends EventEmitter {
       const pending = this.pendingRequests.get(message.id);
       if (pending) {
         this.pendingRequests.delete(message.id);
+        clearTimeout(pending.timer);
 
         if (message.error) {
-          pending.reject(new Error(message.error));
+          const error = new Error(message.error);
+          for (const key of EXECUTION_EXTRAS) {
+            if (message[key]) {
+              error[key] = message[key];
+            }
+          }
+          pending.reject(error);
         } else {
-          pending.resolve(message.result);
+          pending.resolve(pending.unwrap ? pending.unwrap(message) : message.result);
         }
       }
     } else if (message.type === 'js_call') {
@@ -154,6 +240,31 @@ export class PythonBridge extends EventEmitter {
     }
   }
 
+  /**
+   * Lê mensagem grande do arquivo de spool e libera o handle
+   *
+   * @returns {object|null} Mensagem original (null se a leitura falhou)
+   */
+  _readSpool(envelope) {
+    try {
+      return readSpooledMessage(envelope);
+    } catch (error) {
+      console.error('[PythonBridge] Erro ao ler spool:', error.message);
+
+      const pending = this.pendingRequests.get(envelope.id);
+      if (pending) {
+        this.pendingRequests.delete(envelope.id);
+        clearTimeout(pending.timer);
+        pending.reject(new Error(`Falha ao ler resultado do spool: ${error.message}`));
+      }
+      return null;
+    } finally {
+      if (this.initialized) {
+        this._sendToPython({ type: 'spool_release', handle: envelope.spool.id });
+      }
+    }
+  }
+
   /**
    * Trata chamada de função JS vinda do Python
    */
@@ -192,9 +303,16 @@ export class PythonBridge extends EventEmitter {
    *
    * @param {string} code - Código Python a executar
    * @param {object} context - Contexto disponível para o código
-   * @returns {Promise<any>} Resultado da execução
+   * @param {object} [options={}] - Opções da execução
+   * @param {string} [options.session] - Sessão (namespace isolado) criada com createSession()
+   * @param {boolean} [options.resources=false] - Inclui `resources`: CPU, pico de RSS,
+   *   pico do tracemalloc, coletas do GC e bytes serializados da execução
+   * @param {boolean|object} [options.profile] - Inclui `profile`: funções mais custosas
+   *   ({ mode: 'cprofile'|'sample', top, collapsed, interval }; ver servers/skills/profiler.py)
+   * @returns {Promise<any>} Resultado da execução ({ result, resources?, profile? } com
+   *   resources ou profile; nos erros os mesmos campos ficam no objeto Error)
    */
-  async execute(code, context = {}) {
+  async execute(code, context = {}, options = {}) {
     if (!this.initialized) {
       await this.initialize();
     }
@@ -212,25 +330,98 @@ export class PythonBridge extends EventEmitter {
       }
     };
 
-    // Envia requisição para Python
-    this._sendToPython({
+    // Envia requisição para Python e aguarda resposta
+    const message = {
       type: 'execute',
       id: requestId,
       code,
       context: enhancedContext
-    });
+    };
+    if (options.session) {
+      message.session = options.session;
+    }
+    const extras = EXECUTION_EXTRAS.filter((key) => options[key]);
+    if (extras.length > 0) {
+      for (const key of extras) {
+        message[key] = options[key];
+      }
+      return this._request(message, (response) => {
+        const value = { result: response.result };
+        for (const key of extras) {
+          value[key] = response[key];
+        }
+        return value;
+      });
+    }
 
-    // Aguarda resposta
-    return new Promise((resolve, reject) => {
-      this.pendingRequests.set(requestId, { resolve, reject });
+    return this._request(message);
+  }
+
+  /**
+   * Cria sessão com namespace próprio (variáveis não vazam entre sessões)
+   *
+   * Sessões ociosas, acima do limite ou do teto de memória são removidas
+   * pelo Python; execuções nelas falham até a sessão ser recriada.
+   *
+   * @param {string} name - Nome da sessão
+   * @returns {Promise<object>} Informações da sessão ({ name, created, ... })
+   */
+  async createSession(name) {
+    if (!this.initialized) {
+      await this.initialize();
+    }
+
+    return this._request({ type: 'create_session', id: this.requestId++, session: name });
+  }
 
+  /**
+   * Remove sessão e libera suas variáveis
+   *
+   * @param {string} name - Nome da sessão
+   * @returns {Promise<object>} { name, dropped }
+   */
+  async dropSession(name) {
+    if (!this.initialized) {
+      await this.initialize();
+    }
+
+    return this._request({ type: 'drop_session', id: this.requestId++, session: name });
+  }
+
+  /**
+   * Obtém estatísticas do processo Python (concorrência, cache de código)
+   *
+   * @returns {Promise<object>} Estatísticas do python_server
+   */
+  async getServerStats() {
+    if (!this.initialized) {
+      await this.initialize();
+    }
+
+    return this._request({ type: 'stats', id: this.requestId++ });
+  }
+
+  /**
+   * Envia requisição com id e aguarda a resposta correspondente
+   *
+   * @param {object} message - Requisição (com id)
+   * @param {Function} [unwrap] - Extrai o valor da resposta (padrão: response.result)
+   */
+  _request(message, unwrap = null) {
+    const requestId = message.id;
+
+    this._sendToPython(message);
+
+    return new Promise((resolve, reject) => {
       // Timeout de 5 minutos
-      setTimeout(() => {
+      const timer = setTimeout(() => {
         if (this.pendingRequests.has(requestId)) {
           this.pendingRequests.delete(requestId);
           reject(new Error('Python execution timeout (5 minutes)'));
         }
       }, 5 * 60 * 1000);
+
+      this.pendingRequests.set(requestId, { resolve, reject, timer, unwrap });
     });
   }
 
@@ -242,8 +433,7 @@ export class PythonBridge extends EventEmitter {
       throw new Error('Python process not initialized');
     }
 
-    const json = JSON.stringify(message) + '\n';
-    this.pythonProcess.stdin.write(json);
+    this.pythonProcess.stdin.write(encodeMessage(message, this.framing));
   }
 
   /**
@@ -310,7 +500,8 @@ return result
       initialized: this.initialized,
       pendingRequests: this.pendingRequests.size,
       totalRequestsSent: this.requestId,
-      processId: this.pythonProcess?.pid
+      processId: this.pythonProcess?.pid,
+      framing: this.framing
     };
   }
 
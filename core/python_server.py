@@ -6,19 +6,29 @@ Responsabilidades:
 - Receber e executar código Python do JavaScript
 - Permitir importação dinâmica de módulos MCP
 - Chamar funções JavaScript (callbacks)
-- Manter estado entre execuções
+- Manter estado entre execuções (namespaces isolados por sessão)
 
 @module core/python_server
 @complexity HIGH
 @architect Sonnet 4.5
 """
 
+import ast
+import builtins
+import dis
 import sys
 import json
+import time
 import asyncio
+import hashlib
+import contextlib
 import inspect
 import traceback
-from typing import Any, Dict, Optional
+import contextvars
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from types import CodeType
+from typing import Any, Callable, Dict, Optional, Tuple
 from io import StringIO
 import os
 
@@ -26,15 +36,493 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from servers.skills import serializer
+from servers.skills.protocol import MessageChannel, open_stdin_reader, supported_framings
+from servers.skills.profiler import ExecutionProfiler
+from servers.skills.resources import ResourceMeter, ResourceTotals, start_tracemalloc_from_env
+
+# Máximo de requisições executando simultaneamente (configurável via env)
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Máximo de códigos compilados em cache (configurável via env)
+DEFAULT_CODE_CACHE_SIZE = 256
+
+# Sessões de execução (namespaces isolados; configuráveis via env)
+DEFAULT_SESSION = 'default'
+DEFAULT_MAX_SESSIONS = 64
+DEFAULT_SESSION_IDLE_TTL = 1800
+
+# Elementos amostrados ao estimar o tamanho de coleções
+_SIZE_SAMPLE = 64
+
+# Variável que recebe a expressão final de um bloco de statements
+RESULT_NAME = '__result__'
+
+# Contexto da execução corrente (exposto como `context` nas sessões)
+_call_context: contextvars.ContextVar = contextvars.ContextVar('call_context', default=None)
+
+# Nomes de toda sessão que execuções não sobrescrevem
+_RESERVED_NAMES = ('context', 'js')
+
+# Marca de variável ausente da sessão (restauração após a execução)
+_MISSING = object()
+
+# Buffers de captura de stdout/stderr da execução corrente (isolados por task)
+_captured_stdout: contextvars.ContextVar = contextvars.ContextVar('captured_stdout', default=None)
+_captured_stderr: contextvars.ContextVar = contextvars.ContextVar('captured_stderr', default=None)
+
+
+class _ContextStream:
+    """
+    Stream que redireciona escritas para o buffer da task corrente
+
+    Permite capturar prints de várias execuções concorrentes sem trocar
+    sys.stdout globalmente (o que misturaria saídas e corromperia o protocolo).
+    """
+
+    def __init__(self, fallback, buffer_var: contextvars.ContextVar):
+        self._fallback = fallback
+        self._buffer_var = buffer_var
+
+    def _target(self):
+        buffer = self._buffer_var.get()
+        return self._fallback if buffer is None else buffer
+
+    def write(self, data: str) -> int:
+        return self._target().write(data)
+
+    def writelines(self, lines):
+        self._target().writelines(lines)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fallback, name)
+
+
+class CodeCache:
+    """
+    Cache LRU de código compilado
+
+    Cada código é analisado uma única vez (ast.parse) para decidir o modo:
+    - Uma única expressão: compilada em modo 'eval'
+    - Statements: compilados em modo 'exec'; se o último statement for uma
+      expressão (ou um `return` no nível do módulo), seu valor vira o
+      resultado através de __result__
+
+    `await` no nível do módulo é aceito (PyCF_ALLOW_TOP_LEVEL_AWAIT).
+    A chave é o hash do código-fonte. Junto do código fica a lista de nomes
+    globais que ele atribui ou remove (usada na contabilização da sessão).
+    """
+
+    FLAGS = ast.PyCF_ALLOW_TOP_LEVEL_AWAIT
+
+    def __init__(self, max_entries: int = DEFAULT_CODE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[str, Any, Tuple[str, ...]]]' = OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+    def get(self, code: str) -> Tuple[str, Any, Tuple[str, ...]]:
+        """
+        Obtém (modo, code object, nomes atribuídos) do código, compilando se necessário
+
+        Raises:
+            SyntaxError: Se o código for inválido (não é armazenado)
+        """
+        key = hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry
+
+        self.stats['misses'] += 1
+        entry = self._compile(code)
+
+        if self.max_entries > 0:
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+        return entry
+
+    def clear(self):
+        """Remove todos os códigos compilados"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estatísticas do cache"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': self.stats['hits'] / lookups if lookups > 0 else 0,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries
+        }
+
+    def _compile(self, code: str) -> Tuple[str, Any, Tuple[str, ...]]:
+        tree = ast.parse(code, '<string>', 'exec')
+        body = tree.body
+
+        if len(body) == 1 and isinstance(body[0], ast.Expr):
+            expression = ast.Expression(body[0].value)
+            compiled = compile(expression, '<string>', 'eval', flags=self.FLAGS)
+            return 'eval', compiled, _assigned_names(compiled)
+
+        if body and isinstance(body[-1], (ast.Expr, ast.Return)):
+            last = body[-1]
+            value = last.value if last.value is not None else ast.Constant(None)
+            # Expressão final (ou `return` no nível do módulo) -> __result__ = ...
+            body[-1] = ast.copy_location(
+                ast.Assign(targets=[ast.Name(RESULT_NAME, ast.Store())], value=value),
+                last
+            )
+            ast.fix_missing_locations(tree)
+
+        compiled = compile(tree, '<string>', 'exec', flags=self.FLAGS)
+        return 'exec', compiled, _assigned_names(compiled)
+
+
+def _assigned_names(code: CodeType) -> Tuple[str, ...]:
+    """
+    Nomes globais que um código atribui ou remove
+
+    STORE_NAME/DELETE_NAME do nível do módulo e STORE_GLOBAL/DELETE_GLOBAL
+    de qualquer função aninhada (declarações `global`).
+    """
+    names = set()
+    pending = [code]
+    while pending:
+        current = pending.pop()
+        for instruction in dis.get_instructions(current):
+            if instruction.opname in ('STORE_GLOBAL', 'DELETE_GLOBAL') or (
+                current is code and instruction.opname in ('STORE_NAME', 'DELETE_NAME')
+            ):
+                names.add(instruction.argval)
+        pending.extend(const for const in current.co_consts if isinstance(const, CodeType))
+
+    names.discard(RESULT_NAME)
+    return tuple(names)
+
+
+def _approx_size(value: Any) -> int:
+    """
+    Tamanho aproximado de um valor em bytes
+
+    Coleções são estimadas por amostragem dos primeiros elementos,
+    para que a contabilização não percorra dados grandes a cada execução.
+    """
+    size = sys.getsizeof(value, 0)
+    if isinstance(value, (str, bytes, bytearray)):
+        return size
+
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    else:
+        return size
+
+    count = len(value)
+    if count == 0:
+        return size
+
+    sample = 0
+    for taken, item in enumerate(items):
+        if taken >= _SIZE_SAMPLE:
+            break
+        if isinstance(item, tuple) and isinstance(value, dict):
+            sample += sys.getsizeof(item[0], 0) + sys.getsizeof(item[1], 0)
+        else:
+            sample += sys.getsizeof(item, 0)
+    return size + sample * count // min(count, _SIZE_SAMPLE)
+
+
+class _CallContext(MutableMapping):
+    """
+    Variável `context` das sessões
+
+    Aponta para o contexto da execução corrente (ContextVar por task), então
+    execuções concorrentes na mesma sessão não enxergam o contexto umas das outras.
+    """
+
+    __slots__ = ()
+
+    def _current(self) -> Dict[str, Any]:
+        current = _call_context.get()
+        return {} if current is None else current
+
+    def __getitem__(self, key):
+        return self._current()[key]
+
+    def __setitem__(self, key, value):
+        self._current()[key] = value
+
+    def __delitem__(self, key):
+        del self._current()[key]
+
+    def __iter__(self):
+        return iter(self._current())
+
+    def __len__(self) -> int:
+        return len(self._current())
+
+    def __repr__(self) -> str:
+        return repr(self._current())
+
+
+serializer.register_encoder(_CallContext, dict)
+
+
+class _ContextBuiltins(dict):
+    """
+    `__builtins__` das sessões: builtins reais + variáveis do contexto
+
+    Nomes ausentes do namespace e dos builtins são procurados no contexto
+    da execução corrente (ContextVar por task). Assim as variáveis do
+    contexto valem só para a execução que as recebeu, sem gravar no
+    namespace compartilhado da sessão.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, name: str) -> Any:
+        context = _call_context.get()
+        if context is not None and name in context and name not in _RESERVED_NAMES:
+            return context[name]
+        raise KeyError(name)
+
+
+class _SessionGate:
+    """
+    Acesso ao namespace de uma sessão: compartilhado ou exclusivo
+
+    Execuções comuns são compartilhadas e rodam em paralelo. Uma execução
+    cujo contexto sobrepõe uma variável da sessão (ou um builtin) precisa
+    gravar o valor no namespace: ela espera as compartilhadas terminarem e
+    roda sozinha. Exclusivas na fila têm prioridade sobre novas compartilhadas.
+    """
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._waiting = 0
+
+    @contextlib.asynccontextmanager
+    async def shared(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self._exclusive and not self._waiting)
+            self._shared += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._shared -= 1
+                self._condition.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def exclusive(self):
+        async with self._condition:
+            self._waiting += 1
+            try:
+                await self._condition.wait_for(lambda: not self._exclusive and self._shared == 0)
+            finally:
+                self._waiting -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._exclusive = False
+                self._condition.notify_all()
+
+
+class Session:
+    """
+    Namespace isolado de execução
+
+    Cada sessão guarda suas próprias variáveis entre execuções, com
+    contabilização aproximada de memória por variável.
+    """
+
+    def __init__(self, name: str, base: Dict[str, Any]):
+        self.name = name
+        self.namespace: Dict[str, Any] = dict(base)
+        self.created_at = time.time()
+        self.last_used = time.monotonic()
+        self.executions = 0
+        self.active = 0  # Execuções em andamento ou na fila (sessão não é removida)
+        self.bytes = 0
+        self._sizes: Dict[str, int] = {}
+        # Acesso compartilhado/exclusivo ao namespace (criado no loop em execução)
+        self.gate: Optional[_SessionGate] = None
+
+    def account(self, names):
+        """Atualiza a contabilização de memória das variáveis informadas"""
+        for name in names:
+            if name in self.namespace:
+                size = _approx_size(self.namespace[name])
+                self.bytes += size - self._sizes.get(name, 0)
+                self._sizes[name] = size
+            else:
+                self.bytes -= self._sizes.pop(name, 0)
+
+    def info(self) -> Dict[str, Any]:
+        """Resumo da sessão (para stats e respostas)"""
+        return {
+            'name': self.name,
+            'variables': len(self._sizes),
+            'approx_bytes': self.bytes,
+            'executions': self.executions,
+            'active': self.active,
+            'idle_seconds': round(time.monotonic() - self.last_used, 3),
+            'created_at': self.created_at
+        }
+
+
+class SessionManager:
+    """
+    Gerencia sessões de execução nomeadas
+
+    Características:
+    - Sessão 'default' sempre presente (requisições sem sessão)
+    - Remoção de sessões ociosas por mais de idle_ttl segundos
+    - Limite de sessões e de memória total (remove as menos usadas)
+    - Sessões com execução em andamento nunca são removidas
+    """
+
+    def __init__(
+        self,
+        base: Dict[str, Any],
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_ttl: float = DEFAULT_SESSION_IDLE_TTL,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Args:
+            base: Variáveis iniciais de toda sessão (__builtins__, js)
+            max_sessions: Máximo de sessões (além da padrão)
+            idle_ttl: Segundos sem uso antes de remover a sessão (0: nunca)
+            max_bytes: Memória total aproximada das sessões (None: sem limite)
+        """
+        self.base = base
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self._sessions: 'OrderedDict[str, Session]' = OrderedDict()
+        self.default = Session(DEFAULT_SESSION, base)
+        self.stats = {
+            'created': 0,
+            'dropped': 0,
+            'expired': 0,
+            'evicted': 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, name: Optional[str]) -> Optional[Session]:
+        """Obtém sessão (None ou 'default': sessão padrão) e a marca como usada"""
+        if name is None or name == DEFAULT_SESSION:
+            session = self.default
+        else:
+            session = self._sessions.get(name)
+            if session is None:
+                return None
+            self._sessions.move_to_end(name)
+        session.last_used = time.monotonic()
+        return session
+
+    def create(self, name: str) -> Tuple[Session, bool]:
+        """
+        Cria sessão (ou retorna a existente)
+
+        Returns:
+            (sessão, criada agora)
+        """
+        existing = self.get(name)
+        if existing is not None:
+            return existing, False
+
+        self.evict()
+        session = Session(name, self.base)
+        self._sessions[name] = session
+        self.stats['created'] += 1
+        self._enforce_limits(keep=name)
+        return session, True
+
+    def drop(self, name: str) -> bool:
+        """
+        Remove sessão
+
+        Raises:
+            ValueError: Para a sessão padrão
+        """
+        if name == DEFAULT_SESSION:
+            raise ValueError("A sessão padrão não pode ser removida")
+        if self._sessions.pop(name, None) is None:
+            return False
+        self.stats['dropped'] += 1
+        return True
+
+    def evict(self):
+        """Remove sessões ociosas e aplica os limites"""
+        if self.idle_ttl > 0:
+            now = time.monotonic()
+            for name, session in list(self._sessions.items()):
+                if session.active == 0 and now - session.last_used > self.idle_ttl:
+                    del self._sessions[name]
+                    self.stats['expired'] += 1
+        self._enforce_limits()
+
+    def total_bytes(self) -> int:
+        return self.default.bytes + sum(s.bytes for s in self._sessions.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estatísticas das sessões"""
+        return {
+            **self.stats,
+            'count': len(self._sessions),
+            'max_sessions': self.max_sessions,
+            'idle_ttl': self.idle_ttl,
+            'approx_bytes': self.total_bytes(),
+            'max_bytes': self.max_bytes,
+            'sessions': [self.default.info()] + [s.info() for s in self._sessions.values()]
+        }
+
+    def _enforce_limits(self, keep: Optional[str] = None):
+        """Remove as sessões menos usadas acima dos limites (sem tocar em `keep`)"""
+        while len(self._sessions) > self.max_sessions or (
+            self.max_bytes is not None and self.total_bytes() > self.max_bytes
+        ):
+            victim = next(
+                (name for name, session in self._sessions.items()
+                 if session.active == 0 and name != keep),
+                None
+            )
+            if victim is None:
+                break
+            del self._sessions[victim]
+            self.stats['evicted'] += 1
+
 
 class JSBridge:
     """
     Ponte para chamar funções JavaScript do Python
     """
 
-    def __init__(self):
+    def __init__(self, send_message: Callable[[Dict], None]):
         self.call_id = 0
         self.pending_calls = {}
+        self._send_message = send_message
 
     async def call(self, module: str, method: str, *args) -> Any:
         """
@@ -51,6 +539,10 @@ class JSBridge:
         call_id = self.call_id
         self.call_id += 1
 
+        # Registra future antes de enviar (resposta chega pelo loop de leitura)
+        future = asyncio.get_running_loop().create_future()
+        self.pending_calls[call_id] = future
+
         # Envia requisição para JS
         self._send_message({
             'type': 'js_call',
@@ -60,39 +552,73 @@ class JSBridge:
             'args': list(args)
         })
 
-        # Aguarda resposta
-        future = asyncio.Future()
-        self.pending_calls[call_id] = future
-
-        return await future
-
-    def _send_message(self, message: Dict):
-        """Envia mensagem para JavaScript"""
-        json_str = json.dumps(message)
-        print(json_str, flush=True)
+        try:
+            return await future
+        finally:
+            self.pending_calls.pop(call_id, None)
 
     def handle_response(self, call_id: int, result: Any = None, error: str = None):
         """Trata resposta de chamada JS"""
         if call_id in self.pending_calls:
             future = self.pending_calls.pop(call_id)
 
+            if future.done():
+                return
+
             if error:
                 future.set_exception(Exception(f"JS Error: {error}"))
             else:
                 future.set_result(result)
 
+    def cancel_all(self):
+        """Cancela chamadas pendentes (JS encerrou a comunicação)"""
+        for future in self.pending_calls.values():
+            if not future.done():
+                future.cancel()
+        self.pending_calls.clear()
+
 
 class PythonServer:
     """
     Servidor Python que executa código recebido do JavaScript
     """
 
-    def __init__(self):
-        self.js_bridge = JSBridge()
-        self.global_context = {
-            '__builtins__': __builtins__,
-            'js': self.js_bridge,  # Disponível para código Python
-        }
+    def __init__(self, max_concurrency: Optional[int] = None, code_cache_size: Optional[int] = None):
+        # Stream real do protocolo (sys.stdout é substituído durante run())
+        self._stdout = sys.stdout
+
+        self.max_concurrency = max_concurrency or int(
+            os.environ.get('MCP_PYTHON_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY)
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks = set()
+        self.channel: Optional[MessageChannel] = None
+
+        self.code_cache = CodeCache(
+            code_cache_size if code_cache_size is not None
+            else int(os.environ.get('MCP_PYTHON_CODE_CACHE_SIZE', DEFAULT_CODE_CACHE_SIZE))
+        )
+
+        self.js_bridge = JSBridge(self._send_message)
+
+        # Namespaces por sessão; requisições sem 'session' usam a sessão padrão
+        max_bytes = os.environ.get('MCP_PYTHON_SESSIONS_MAX_BYTES')
+        self.sessions = SessionManager(
+            {
+                '__builtins__': _ContextBuiltins(vars(builtins)),
+                'js': self.js_bridge,  # Disponível para código Python
+                'context': _CallContext(),  # Contexto da execução corrente
+            },
+            max_sessions=int(os.environ.get('MCP_PYTHON_MAX_SESSIONS', DEFAULT_MAX_SESSIONS)),
+            idle_ttl=float(os.environ.get('MCP_PYTHON_SESSION_IDLE_TTL', DEFAULT_SESSION_IDLE_TTL)),
+            max_bytes=int(max_bytes) if max_bytes else None
+        )
+        self.global_context = self.sessions.default.namespace
+        self._reaper: Optional[asyncio.Task] = None
+
+        # Uso de CPU/memória/GC acumulado das execuções (ver servers/skills/resources.py)
+        self.resource_totals = ResourceTotals()
+        start_tracemalloc_from_env()
 
     def log(self, message: str):
         """Envia log para JavaScript"""
@@ -103,87 +629,159 @@ class PythonServer:
 
     def _send_message(self, message: Dict):
         """Envia mensagem para JavaScript"""
-        json_str = json.dumps(message)
-        print(json_str, flush=True)
+        if self.channel is not None:
+            self.channel.send(message)
+            return
 
-    async def execute_code(self, code: str, context: Dict) -> Any:
+        json_str = serializer.dumps(message).decode('utf-8')
+        # Uma única escrita por mensagem: linhas nunca se intercalam
+        self._stdout.write(json_str + '\n')
+        self._stdout.flush()
+
+    async def execute_code(self, code: str, context: Dict, session: Optional[str] = None) -> Any:
         """
         Executa código Python com contexto fornecido
 
         Args:
             code: Código Python a executar
             context: Contexto/variáveis disponíveis
+            session: Nome da sessão (None: sessão padrão)
+
+        Execuções rodam em paralelo, também na mesma sessão. Só uma
+        execução cujo contexto sobrepõe uma variável da sessão ou um
+        builtin roda sozinha na sessão (ver _SessionGate).
 
         Returns:
             Resultado da execução (última expressão ou return)
+
+        Raises:
+            Exception: Se a sessão não existir (nunca criada, removida ou expirada)
         """
-        # Mescla contexto fornecido com contexto global
-        exec_context = {
-            **self.global_context,
-            'context': context,  # Disponibiliza 'context' como variável Python
-            **context  # Também injeta variáveis diretamente
-        }
+        state = self.sessions.get(session)
+        if state is None:
+            raise Exception(f"Sessão não encontrada: {session} (use create_session)")
+
+        if state.gate is None:
+            state.gate = _SessionGate()
 
+        builtin_names = state.namespace['__builtins__']
+        overrides = tuple(
+            key for key in context
+            if key not in _RESERVED_NAMES and (key in state.namespace or key in builtin_names)
+        )
+
+        # Na fila conta como ativa: a sessão não é removida enquanto espera
+        state.active += 1
         try:
-            # Captura stdout/stderr
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            sys.stdout = StringIO()
-            sys.stderr = StringIO()
+            access = state.gate.exclusive() if overrides else state.gate.shared()
+            async with access:
+                return await self._execute_in_session(state, code, context, overrides)
+        finally:
+            state.active -= 1
+            state.last_used = time.monotonic()
+            if self.sessions.max_bytes is not None:
+                # Sessão cresceu: aplica o limite de memória total
+                self.sessions.evict()
+
+    async def _execute_in_session(
+        self,
+        state: Session,
+        code: str,
+        context: Dict,
+        overrides: Tuple[str, ...] = ()
+    ) -> Any:
+        """
+        Executa código no namespace da sessão (chamador detém state.gate)
+
+        O código roda direto no namespace (sem cópia). As variáveis do
+        contexto são lidas do contexto desta execução (_ContextBuiltins);
+        só as de `overrides` (nomes que já existem na sessão ou nos
+        builtins, acesso exclusivo) são gravadas no namespace e, ao final,
+        voltam ao valor anterior, a menos que o código as tenha atribuído.
+        `context` aponta para o contexto desta execução.
+        """
+        namespace = state.namespace
+        previous = {key: namespace.get(key, _MISSING) for key in overrides}
+        for key in overrides:
+            namespace[key] = context[key]
+        context_token = _call_context.set(context)
 
+        # Captura stdout/stderr apenas desta execução
+        stdout_buffer = StringIO()
+        stderr_buffer = StringIO()
+        stdout_token = _captured_stdout.set(stdout_buffer)
+        stderr_token = _captured_stderr.set(stderr_buffer)
+
+        state.executions += 1
+        assigned = ()
+
+        try:
             result = None
 
-            try:
-                # Tenta compilar como expressão primeiro (para eval)
-                compiled = compile(code, '<string>', 'eval')
-                result = eval(compiled, exec_context)
-
-                # Se for coroutine, aguarda
-                if inspect.iscoroutine(result):
-                    result = await result
-
-            except SyntaxError:
-                # Não é expressão, executa como statements
-                compiled = compile(code, '<string>', 'exec')
-                exec(compiled, exec_context)
-
-                # IMPORTANTE: Preserva variáveis para próximas execuções
-                for key in list(exec_context.keys()):
-                    if not key.startswith('__') and key not in ['context', 'js']:
-                        self.global_context[key] = exec_context[key]
-
-                # Procura por 'return' no contexto
-                if 'return' in exec_context:
-                    result = exec_context['return']
-                # Ou verifica se última variável definida é o resultado
-                elif '__result__' in exec_context:
-                    result = exec_context['__result__']
-
-            # Captura output
-            stdout_value = sys.stdout.getvalue()
-            stderr_value = sys.stderr.getvalue()
-
-            # Restaura stdout/stderr
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+            # Uma única análise decide eval/exec (código compilado fica em cache)
+            mode, compiled, assigned = self.code_cache.get(code)
 
-            # Loga output se houver
-            if stdout_value:
-                self.log(f"STDOUT: {stdout_value}")
-            if stderr_value:
-                self.log(f"STDERR: {stderr_value}")
+            # Com await no nível do módulo, eval() devolve uma coroutine
+            value = eval(compiled, namespace)
+            if inspect.iscoroutine(value):
+                value = await value
+
+            if mode == 'eval':
+                result = value
+            # Procura por 'return' no contexto
+            elif 'return' in context:
+                result = context['return']
+            # Ou usa a expressão final do bloco
+            else:
+                result = namespace.pop(RESULT_NAME, None)
+
+            # Se for coroutine, aguarda
+            if inspect.iscoroutine(result):
+                result = await result
+
+            if isinstance(result, _CallContext):
+                # O proxy deixa de apontar para este contexto ao fim da execução
+                result = context
 
             return result
 
         except Exception as e:
-            # Restaura stdout/stderr em caso de erro
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
-
             # Captura traceback completo
             tb = traceback.format_exc()
             raise Exception(f"{str(e)}\n\nTraceback:\n{tb}")
 
+        finally:
+            namespace.pop(RESULT_NAME, None)
+            _call_context.reset(context_token)
+
+            # Nomes fixos da sessão não são sobrescritos por execuções
+            for name in _RESERVED_NAMES:
+                if name in assigned:
+                    namespace[name] = self.sessions.base[name]
+
+            # Variáveis do contexto gravadas no namespace não ficam na sessão
+            for key, value in previous.items():
+                if key in assigned:
+                    continue
+                if value is _MISSING:
+                    namespace.pop(key, None)
+                else:
+                    namespace[key] = value
+
+            # Contabiliza só o que esta execução gravou (custo independe do tamanho da sessão)
+            state.account(name for name in assigned if name not in _RESERVED_NAMES)
+
+            _captured_stdout.reset(stdout_token)
+            _captured_stderr.reset(stderr_token)
+
+            # Loga output se houver
+            stdout_value = stdout_buffer.getvalue()
+            stderr_value = stderr_buffer.getvalue()
+            if stdout_value:
+                self.log(f"STDOUT: {stdout_value}")
+            if stderr_value:
+                self.log(f"STDERR: {stderr_value}")
+
     async def handle_request(self, request: Dict):
         """
         Trata requisição do JavaScript
@@ -199,25 +797,44 @@ class PythonServer:
             code = request['code']
             context = request.get('context', {})
 
+            # Medição sempre ativa (totais do stats); na resposta só com 'resources'
+            # (tempo de CPU do processo: inclui execuções concorrentes no loop)
+            meter = ResourceMeter()
+            profiler = None
             try:
-                result = await self.execute_code(code, context)
-
-                # Serializa resultado
-                # (converte tipos não-serializáveis)
-                serialized_result = self._serialize(result)
-
-                self._send_message({
-                    'type': 'response',
-                    'id': req_id,
-                    'result': serialized_result
-                })
+                # Profiler só existe com 'profile' na requisição (custo zero sem ele)
+                profiler = ExecutionProfiler.from_request(request.get('profile'))
+                with meter, (profiler if profiler is not None else contextlib.nullcontext()):
+                    result = await self.execute_code(code, context, request.get('session'))
 
             except Exception as e:
-                self._send_message({
+                message = {
                     'type': 'response',
                     'id': req_id,
                     'error': str(e)
-                })
+                }
+                message.update(self._execution_extras(request, meter, profiler))
+                self._send_message(message)
+
+            else:
+                # Resultado vai direto: tipos não-serializáveis são convertidos
+                # pelo serializer na própria codificação da mensagem
+                self._send_response(req_id, result, self._execution_extras(request, meter, profiler))
+
+            finally:
+                if meter.usage is not None:
+                    self.resource_totals.add('execute', meter.usage)
+
+        elif req_type in ('create_session', 'drop_session'):
+            self._handle_session_request(request)
+
+        elif req_type == 'stats':
+            # Estatísticas do servidor
+            self._send_message({
+                'type': 'response',
+                'id': request['id'],
+                'result': self.get_stats()
+            })
 
         elif req_type == 'js_call_response':
             # Resposta de chamada JS
@@ -234,66 +851,213 @@ class PythonServer:
 
         return True  # Continua loop
 
-    def _serialize(self, obj: Any) -> Any:
+    def _handle_session_request(self, request: Dict):
+        """Trata create_session / drop_session"""
+        name = request.get('session')
+        try:
+            if not name or not isinstance(name, str):
+                raise ValueError("Informe o nome da sessão em 'session'")
+
+            if request['type'] == 'create_session':
+                state, created = self.sessions.create(name)
+                result = {**state.info(), 'created': created}
+            else:
+                result = {'name': name, 'dropped': self.sessions.drop(name)}
+
+            self._send_message({'type': 'response', 'id': request['id'], 'result': result})
+        except ValueError as e:
+            self._send_message({'type': 'response', 'id': request['id'], 'error': str(e)})
+
+    async def _reap_sessions(self):
+        """Remove periodicamente sessões ociosas"""
+        interval = min(max(self.sessions.idle_ttl / 2, 1), 60)
+        while True:
+            await asyncio.sleep(interval)
+            self.sessions.evict()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estatísticas do servidor (concorrência, cache de código, sessões, recursos e spool)"""
+        return {
+            'sessions': self.sessions.get_stats(),
+            'max_concurrency': self.max_concurrency,
+            'active_requests': len(self._tasks),
+            'code_cache': self.code_cache.get_stats(),
+            'resources': self.resource_totals.get_stats(),
+            'spool': self.channel.spool.get_stats() if self.channel is not None else None
+        }
+
+    def _execution_extras(
+        self,
+        request: Dict,
+        meter: ResourceMeter,
+        profiler: Optional[ExecutionProfiler]
+    ) -> Dict[str, Any]:
+        """Campos opcionais da resposta de execute ('resources' e 'profile')"""
+        extras = {}
+        if request.get('resources') and meter.usage is not None:
+            extras['resources'] = dict(meter.usage)
+        if profiler is not None and profiler.report is not None:
+            extras['profile'] = profiler.report
+        return extras
+
+    def _send_response(
+        self,
+        req_id: Any,
+        result: Any,
+        extras: Optional[Dict[str, Any]] = None
+    ):
         """
-        Serializa objeto para JSON
+        Envia resposta de execute
+
+        O resultado é codificado uma única vez, antes da mensagem, para
+        contabilizar os bytes serializados (totais do stats e
+        resources['bytes_serialized']).
+
+        Args:
+            req_id: Id da requisição
+            result: Resultado da execução
+            extras: Campos opcionais ('resources', 'profile')
 
-        Trata tipos especiais que não são serializáveis por padrão
+        Se o resultado não puder ser codificado (ex: referência circular),
+        a requisição recebe o erro em vez de ficar sem resposta.
         """
-        if obj is None or isinstance(obj, (bool, int, float, str)):
-            return obj
-        elif isinstance(obj, (list, tuple)):
-            return [self._serialize(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {key: self._serialize(value) for key, value in obj.items()}
-        elif hasattr(obj, '__dict__'):
-            # Objeto customizado - serializa atributos
-            return {
-                '__type__': type(obj).__name__,
-                '__dict__': self._serialize(obj.__dict__)
-            }
-        else:
-            # Fallback: converte para string
-            return str(obj)
+        message = {
+            'type': 'response',
+            'id': req_id,
+            'result': result,
+            **(extras or {})
+        }
+        try:
+            if self.channel is None:
+                self._send_message(message)
+                return
+
+            encoded = self.channel.encode_value(result)
+            self.resource_totals.add_serialized('execute', len(encoded))
+            if 'resources' in message:
+                message['resources']['bytes_serialized'] = len(encoded)
+            self.channel.send(message, {'result': encoded})
+        except (TypeError, ValueError, OverflowError, RecursionError) as e:
+            self._send_message({
+                'type': 'response',
+                'id': req_id,
+                'error': f"Resultado não serializável: {e}"
+            })
+
+    def _dispatch(self, request: Dict) -> bool:
+        """
+        Despacha requisição sem bloquear o loop de leitura
+
+        Respostas de js_call e shutdown são tratadas imediatamente; demais
+        requisições rodam em tasks próprias, limitadas por max_concurrency.
+
+        Returns:
+            False se o servidor deve parar de ler stdin
+        """
+        req_type = request.get('type')
+
+        if req_type == 'js_call_response':
+            # Nunca passa pelo semáforo: execuções em andamento aguardam isto
+            self.js_bridge.handle_response(
+                request['callId'], request.get('result'), request.get('error')
+            )
+            return True
+
+        if req_type == 'shutdown':
+            self.log("Recebido sinal de shutdown")
+            return False
+
+        if req_type == 'spool_release':
+            # JS terminou de ler uma mensagem do spool (sem resposta)
+            self.channel.spool.release(request.get('handle'))
+            return True
+
+        if req_type == 'set_framing':
+            # Ack vai no framing atual; próximos bytes (ambos os sentidos) no novo
+            framing = request.get('framing')
+            if framing not in supported_framings():
+                self._send_message({
+                    'type': 'framing',
+                    'framing': self.channel.framing,
+                    'error': f"Framing não suportado: {framing}"
+                })
+                return True
+
+            self._send_message({'type': 'framing', 'framing': framing})
+            self.channel.switch(framing)
+            return True
+
+        task = asyncio.ensure_future(self._run_request(request))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run_request(self, request: Dict):
+        """Executa requisição respeitando o limite de concorrência"""
+        async with self._semaphore:
+            try:
+                await self.handle_request(request)
+            except Exception as e:
+                self.log(f"Erro ao processar requisição: {e}")
 
     async def run(self):
         """
         Loop principal do servidor
         """
-        self.log("Python Server inicializado")
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Redireciona prints do código executado para buffers por task
+        sys.stdout = _ContextStream(self._stdout, _captured_stdout)
+        sys.stderr = _ContextStream(sys.stderr, _captured_stderr)
+
+        self._stdout.flush()
+        self.channel = MessageChannel(await open_stdin_reader(), self._stdout.buffer)
+        # Também em JSON lines: escritas diretas no fd 1 (threads do código do
+        # usuário, extensões C) não passam pela captura e corromperiam o protocolo
+        self.channel.isolate_stdout()
 
-        # Envia sinal de "ready"
-        self._send_message({'type': 'ready'})
+        self.log(f"Python Server inicializado (max_concurrency={self.max_concurrency})")
+
+        if self.sessions.idle_ttl > 0:
+            self._reaper = asyncio.ensure_future(self._reap_sessions())
+
+        # Envia sinal de "ready" (com framings aceitos para negociação)
+        self._send_message({'type': 'ready', 'framings': supported_framings()})
 
         # Loop de processamento
+        graceful = False
         while True:
             try:
-                # Lê linha do stdin (bloqueante)
-                line = sys.stdin.readline()
+                request = await self.channel.receive()
 
-                if not line:
+                if request is None:
                     # EOF - JavaScript terminou
                     break
 
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Parseia JSON
-                request = json.loads(line)
-
-                # Processa requisição
-                should_continue = await self.handle_request(request)
-
-                if not should_continue:
+                # Despacha requisição (não aguarda execução)
+                if not self._dispatch(request):
+                    graceful = True
                     break
 
             except json.JSONDecodeError as e:
                 self.log(f"Erro ao parsear JSON: {e}")
+            except ValueError as e:
+                # Mensagem acima do limite ou payload inválido
+                self.log(f"Requisição descartada: {e}")
             except Exception as e:
                 self.log(f"Erro no loop principal: {e}")
                 traceback.print_exc()
 
+        if not graceful:
+            # Sem JS do outro lado, callbacks pendentes nunca serão respondidos
+            self.js_bridge.cancel_all()
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        if self._reaper is not None:
+            self._reaper.cancel()
+
         self.log("Python Server finalizando")
 
 
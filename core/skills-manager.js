@@ -4,12 +4,17 @@
  */
 
 import path from 'path';
-import SkillLoaderModule from '../skills/loader.js';
-import SkillValidatorModule from '../skills/validator.js';
+import { createRequire } from 'module';
+import { fileURLToPath } from 'url';
+import SkillLoaderModule from '../skills/loader.cjs';
+import SkillValidatorModule from '../skills/validator.cjs';
 
 const SkillLoader = SkillLoaderModule;
 const SkillValidator = SkillValidatorModule;
 
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const require = createRequire(import.meta.url);
+
 /**
  * Gerenciador centralizado de Skills do MCP Framework
  * Responsável por carregar, validar e executar skills
@@ -23,7 +23,7 @@ REGISTRY = {
             'name': 'Guardrails AI',
             'version': '0.6.7',
             'description': 'LLM validation and security guardrails',
-            'functions': ['validate', 'scan']
+            'functions': ['validate', 'validate_many', 'validate_stream', 'scan', 'scan_many', 'scan_stream']
         },
         'garak': {
             'name': 'NVIDIA Garak',
@@ -43,7 +43,7 @@ REGISTRY = {
             'name': 'Apify',
             'version': '0.5.1',
             'description': 'Web scraping and automation',
-            'functions': ['run_actor', 'get_dataset']
+            'functions': ['run_actor', 'get_dataset', 'iter_dataset', 'cached_dataset']
         },
         'crawl4ai': {
             'name': 'Crawl4AI',
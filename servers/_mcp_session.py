@@ -0,0 +1,554 @@
+"""
+MCP Sessions - Long-lived stdio MCP server processes
+(Private module - used by the MCP wrappers, not exported)
+
+One process per backend is started on first use and kept alive. Concurrent
+calls are multiplexed over it as JSON-RPC 2.0 requests (one JSON message
+per line) and matched by id. Dead sessions are restarted on the next call,
+idle ones are shut down.
+
+Sessions belong to the event loop that started them (their pipes and locks
+are bound to it): each loop gets its own sessions, and they are closed when
+the loop shuts down (asyncio.run cancels the idle reaper, which closes them)
+or, for a loop closed some other way, killed on the next use of the manager.
+
+Backend commands can be overridden with MCP_SESSION_<BACKEND>_COMMAND,
+e.g. MCP_SESSION_APIFY_COMMAND="node /opt/apify-mcp/index.js".
+"""
+
+import os
+import json
+import time
+import shlex
+import signal
+import asyncio
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+
+PROTOCOL_VERSION = "2024-11-05"
+
+# Default commands per backend (previously spawned once per call)
+BACKENDS: Dict[str, List[str]] = {
+    "apify": ["npx", "-y", "@apify/mcp-server"],
+    "guardrails": ["npx", "-y", "guardrails-ai"],
+}
+
+# Default idle time before a session is shut down (seconds)
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+# Seconds before retrying a backend whose session failed to start
+START_RETRY_DELAY = 60.0
+
+# Bytes per write to a server (large arguments are sent in pieces)
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# Max size of one message from a server
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+
+class MCPSessionError(Exception):
+    """Session could not be started or died while a call was pending"""
+
+
+class MCPToolError(Exception):
+    """The server returned a JSON-RPC error or a tool result with isError"""
+
+
+class MCPSession:
+    """
+    One stdio MCP server process with multiplexed JSON-RPC calls
+    """
+
+    def __init__(
+        self,
+        command: List[str],
+        name: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        startup_timeout: float = 60.0
+    ):
+        """
+        Args:
+            command: Server command line
+            name: Backend name (logs, errors)
+            env: Extra environment variables for the server
+            startup_timeout: Max seconds for process start + initialize
+        """
+        self.command = command
+        self.name = name or command[0]
+        self.env = env
+        self.startup_timeout = startup_timeout
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.server_info: Dict[str, Any] = {}
+        self.last_used = time.monotonic()
+
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._stderr_tail: deque = deque(maxlen=20)
+        self._write_lock = asyncio.Lock()
+        self._closed = False
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            self.process is not None
+            and self.process.returncode is None
+            and not self._closed
+        )
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def start(self):
+        """
+        Spawn the server and perform the MCP initialize handshake
+
+        Raises:
+            MCPSessionError: If the process cannot start or does not answer
+        """
+        env = {**os.environ, **self.env} if self.env else None
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                limit=MAX_MESSAGE_SIZE
+            )
+        except OSError as e:
+            raise MCPSessionError(f"Cannot start MCP server '{self.name}': {e}") from e
+
+        self._reader_task = asyncio.ensure_future(self._read_loop())
+        self._stderr_task = asyncio.ensure_future(self._read_stderr())
+
+        try:
+            result = await self.request(
+                "initialize",
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "mcp-code-execution-framework", "version": "1.0.0"}
+                },
+                timeout=self.startup_timeout
+            )
+        except Exception as e:
+            await self.close()
+            raise MCPSessionError(
+                f"MCP server '{self.name}' failed to initialize: {e}{self._stderr_hint()}"
+            ) from e
+
+        self.server_info = result.get("serverInfo", {}) if isinstance(result, dict) else {}
+        await self.notify("notifications/initialized")
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Send a JSON-RPC request and wait for its response
+
+        Raises:
+            MCPSessionError: If the session died before answering
+            MCPToolError: If the server answered with an error
+            asyncio.TimeoutError: If timeout passed (the request is cancelled)
+        """
+        if not self.is_alive:
+            raise MCPSessionError(f"MCP session '{self.name}' is not running")
+
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.last_used = time.monotonic()
+
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+
+        try:
+            await self._write(message)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            await self.notify(
+                "notifications/cancelled",
+                {"requestId": request_id, "reason": "timeout"}
+            )
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+            self.last_used = time.monotonic()
+            # The write may fail after the reader already failed the future
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                future.exception()
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """Send a JSON-RPC notification (no response)"""
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            await self._write(message)
+        except MCPSessionError:
+            pass
+
+    async def call_tool(
+        self,
+        tool: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Call an MCP tool
+
+        Returns:
+            The tool output: JSON-decoded text content when possible, else
+            the text, else the raw result
+
+        Raises:
+            MCPToolError: If the tool reported an error
+        """
+        result = await self.request(
+            "tools/call",
+            {"name": tool, "arguments": arguments or {}},
+            timeout=timeout
+        )
+        return _tool_output(result)
+
+    async def close(self, timeout: float = 2.0):
+        """Close stdin, wait for the process and fail pending calls"""
+        self._closed = True
+        process = self.process
+
+        if process is not None and process.returncode is None:
+            try:
+                process.stdin.close()
+            except (OSError, RuntimeError):
+                pass
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+        for task in (self._reader_task, self._stderr_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._fail_pending(MCPSessionError(f"MCP session '{self.name}' closed"))
+
+    async def _write(self, message: Dict[str, Any]):
+        if not self.is_alive:
+            raise MCPSessionError(f"MCP session '{self.name}' is not running")
+        data = json.dumps(message).encode("utf-8") + b"\n"
+        stdin = self.process.stdin
+        try:
+            # Large messages go out in pieces (bounded pipe buffer); the
+            # lock keeps concurrent messages from interleaving
+            async with self._write_lock:
+                view = memoryview(data)
+                for start in range(0, len(view), WRITE_CHUNK_SIZE):
+                    stdin.write(view[start:start + WRITE_CHUNK_SIZE])
+                    await stdin.drain()
+        except (ConnectionError, OSError) as e:
+            raise MCPSessionError(f"MCP session '{self.name}' write failed: {e}") from e
+
+    async def _read_loop(self):
+        """Route responses to pending calls until the server exits"""
+        stdout = self.process.stdout
+        try:
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue  # Log output on stdout
+                await self._dispatch(message)
+        except (ConnectionError, ValueError, asyncio.LimitOverrunError) as e:
+            self._fail_pending(MCPSessionError(f"MCP session '{self.name}' read error: {e}"))
+        finally:
+            self._closed = True
+            self._fail_pending(MCPSessionError(
+                f"MCP server '{self.name}' exited{self._stderr_hint()}"
+            ))
+
+    async def _dispatch(self, message: Dict[str, Any]):
+        if "method" in message:
+            # Server -> client request: answer pings, refuse the rest
+            if "id" in message:
+                if message["method"] == "ping":
+                    response = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+                else:
+                    response = {
+                        "jsonrpc": "2.0",
+                        "id": message["id"],
+                        "error": {"code": -32601, "message": "Method not found"}
+                    }
+                try:
+                    await self._write(response)
+                except MCPSessionError:
+                    pass
+            return
+
+        future = self._pending.get(message.get("id"))
+        if future is None or future.done():
+            return
+
+        if "error" in message:
+            error = message["error"] or {}
+            future.set_exception(MCPToolError(error.get("message", "Unknown MCP error")))
+        else:
+            future.set_result(message.get("result"))
+
+    async def _read_stderr(self):
+        while True:
+            line = await self.process.stderr.readline()
+            if not line:
+                break
+            self._stderr_tail.append(line.decode("utf-8", "replace").rstrip())
+
+    def _fail_pending(self, error: Exception):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _stderr_hint(self) -> str:
+        return f": {self._stderr_tail[-1]}" if self._stderr_tail else ""
+
+
+def _tool_output(result: Any) -> Any:
+    """Decode a tools/call result"""
+    if not isinstance(result, dict) or "content" not in result:
+        return result
+
+    texts = [
+        item.get("text", "")
+        for item in result.get("content") or []
+        if isinstance(item, dict) and item.get("type") == "text"
+    ]
+    text = "\n".join(texts)
+
+    if result.get("isError"):
+        raise MCPToolError(text or "MCP tool error")
+
+    if "structuredContent" in result:
+        return result["structuredContent"]
+    if not texts:
+        return result
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+class _LoopSessions:
+    """Sessions, start locks and idle reaper of one event loop"""
+
+    def __init__(self):
+        self.sessions: Dict[str, MCPSession] = {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.reaper: Optional[asyncio.Task] = None
+
+
+class MCPSessionManager:
+    """
+    Keeps one MCPSession per backend and event loop
+
+    Features:
+    - Lazy start on first call, restart if the process died
+    - Sessions are closed when their event loop shuts down
+    - Idle sessions (no pending calls) are shut down after idle_timeout
+    - A backend that failed to start is not retried for START_RETRY_DELAY
+      seconds, so callers can fall back without paying the startup again
+    """
+
+    def __init__(
+        self,
+        backends: Optional[Dict[str, List[str]]] = None,
+        idle_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            backends: Backend name -> command (default: BACKENDS)
+            idle_timeout: Seconds before an idle session is closed
+                (default: MCP_SESSION_IDLE_TIMEOUT env or 300)
+        """
+        self.backends = dict(BACKENDS if backends is None else backends)
+        self.idle_timeout = idle_timeout or float(
+            os.environ.get("MCP_SESSION_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT)
+        )
+        self._loops: Dict[asyncio.AbstractEventLoop, _LoopSessions] = {}
+        self._failed: Dict[str, Tuple[float, str]] = {}
+        self.stats = {
+            "started": 0,
+            "restarts": 0,
+            "idle_closed": 0,
+            "calls": 0
+        }
+
+    def register(self, backend: str, command: List[str]):
+        """Add or replace a backend command"""
+        self.backends[backend] = command
+
+    def _command(self, backend: str) -> List[str]:
+        override = os.environ.get(f"MCP_SESSION_{backend.upper()}_COMMAND")
+        if override:
+            return shlex.split(override)
+        if backend not in self.backends:
+            raise MCPSessionError(f"Unknown MCP backend: {backend}")
+        return self.backends[backend]
+
+    def _loop_sessions(self) -> _LoopSessions:
+        """
+        State of the running event loop (created on first use)
+
+        Sessions of loops closed without shutting them down can no longer
+        be awaited: their processes are killed and the state dropped.
+        """
+        for loop in [loop for loop in self._loops if loop.is_closed()]:
+            for session in self._loops.pop(loop).sessions.values():
+                if session.process is not None and session.process.returncode is None:
+                    try:
+                        os.kill(session.process.pid, signal.SIGTERM)
+                    except OSError:
+                        pass
+
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = _LoopSessions()
+        return state
+
+    async def get(self, backend: str) -> MCPSession:
+        """
+        Get the running session for a backend, starting it if needed
+
+        Raises:
+            MCPSessionError: If the session cannot be started
+        """
+        state = self._loop_sessions()
+        session = state.sessions.get(backend)
+        if session is not None and session.is_alive:
+            return session
+
+        failed = self._failed.get(backend)
+        if failed is not None and time.monotonic() < failed[0]:
+            raise MCPSessionError(failed[1])
+
+        lock = state.locks.get(backend)
+        if lock is None:
+            lock = state.locks[backend] = asyncio.Lock()
+        async with lock:
+            session = state.sessions.get(backend)
+            if session is not None and session.is_alive:
+                return session
+
+            restarted = session is not None
+            session = MCPSession(self._command(backend), name=backend)
+            try:
+                await session.start()
+            except MCPSessionError as e:
+                self._failed[backend] = (time.monotonic() + START_RETRY_DELAY, str(e))
+                raise
+            self._failed.pop(backend, None)
+
+            state.sessions[backend] = session
+            self.stats["started"] += 1
+            if restarted:
+                self.stats["restarts"] += 1
+
+        if state.reaper is None or state.reaper.done():
+            state.reaper = asyncio.ensure_future(self._reap_idle(state))
+        return session
+
+    async def call_tool(
+        self,
+        backend: str,
+        tool: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Call a tool on a backend's session (see MCPSession.call_tool)"""
+        session = await self.get(backend)
+        self.stats["calls"] += 1
+        return await session.call_tool(tool, arguments, timeout)
+
+    async def close(self, backend: str):
+        """Close one backend's session (of the running event loop)"""
+        await self._close(self._loop_sessions(), backend)
+
+    async def close_all(self):
+        """Close every session of the running event loop and stop its idle reaper"""
+        state = self._loop_sessions()
+        if state.reaper is not None:
+            state.reaper.cancel()
+            state.reaper = None
+        await self._close_sessions(state)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session statistics (sessions of every open event loop)"""
+        return {
+            **self.stats,
+            "sessions": {
+                backend: {
+                    "alive": session.is_alive,
+                    "pid": session.process.pid if session.process else None,
+                    "pending": session.pending,
+                    "idle_seconds": time.monotonic() - session.last_used
+                }
+                for loop, state in list(self._loops.items())
+                if not loop.is_closed()
+                for backend, session in state.sessions.items()
+            }
+        }
+
+    async def _close(self, state: _LoopSessions, backend: str):
+        session = state.sessions.pop(backend, None)
+        if session is not None:
+            await session.close()
+
+    async def _close_sessions(self, state: _LoopSessions):
+        await asyncio.gather(
+            *(self._close(state, backend) for backend in list(state.sessions)),
+            return_exceptions=True
+        )
+
+    async def _reap_idle(self, state: _LoopSessions):
+        interval = max(0.05, min(self.idle_timeout / 2, 30.0))
+        try:
+            while any(session.is_alive for session in state.sessions.values()):
+                await asyncio.sleep(interval)
+                now = time.monotonic()
+                for backend, session in list(state.sessions.items()):
+                    if not session.is_alive:
+                        continue  # Restarted by the next get()
+                    if session.pending == 0 and now - session.last_used >= self.idle_timeout:
+                        self.stats["idle_closed"] += 1
+                        await self._close(state, backend)
+        except asyncio.CancelledError:
+            # Loop shutting down (asyncio.run cancels pending tasks) or close_all()
+            await self._close_sessions(state)
+            raise
+
+
+_manager: Optional[MCPSessionManager] = None
+
+
+def get_session_manager() -> MCPSessionManager:
+    """Process-wide session manager shared by the MCP wrappers"""
+    global _manager
+    if _manager is None:
+        _manager = MCPSessionManager()
+    return _manager
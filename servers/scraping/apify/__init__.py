@@ -4,15 +4,23 @@ Apify
 Web scraping and automation
 
 Exemplo de uso:
-    from servers.scraping.apify import run_actor
+    from servers.scraping.apify import run_actor, iter_dataset, cached_dataset
 
     result = await run_actor('web-scraper', config)
+
+    # Datasets grandes: páginas sob demanda com read-ahead
+    async for item in iter_dataset(dataset_id, page_size=1000):
+        process(item)
+
+    # Cache local: só os itens novos são baixados a cada abertura
+    with await cached_dataset(dataset_id) as dataset:
+        print(len(dataset), dataset[0])
 """
 
 from .run_actor import run_actor
-from .get_dataset import get_dataset
+from .get_dataset import get_dataset, iter_dataset, cached_dataset
 
-__all__ = ['run_actor', 'get_dataset']
+__all__ = ['run_actor', 'get_dataset', 'iter_dataset', 'cached_dataset']
 
 # Metadata
 __version__ = '0.5.1'
@@ -0,0 +1,275 @@
+"""
+Local on-disk cache of Apify datasets
+(Private module - not exported)
+
+Each dataset is stored as two append-only files:
+
+    <key>.jsonl  one JSON item per line
+    <key>.idx    little-endian uint64 end offset of every line
+
+The index makes item `i` the byte range [end[i-1], end[i]) of the JSONL
+file, which is memory-mapped, so random access by index does not read
+or parse anything else. New items are always appended after the last
+cached one; the index is written after the data, so a sync interrupted
+midway leaves at most an unindexed tail that is dropped on the next open.
+
+Several instances (in one or more processes) may share a cache: writers
+hold an exclusive flock on the index while appending and first pick up
+the items other instances added, so offsets always follow the real end
+of the data file.
+"""
+
+import os
+import sys
+import json
+import mmap
+import fcntl
+import hashlib
+import itertools
+from array import array
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+# Default cache directory (override with APIFY_DATASET_CACHE_DIR)
+DEFAULT_CACHE_DIR = os.path.join('~', '.cache', 'mcp-framework', 'apify-datasets')
+
+_OFFSET_SIZE = 8
+
+
+def cache_dir_from_env() -> str:
+    return os.path.expanduser(os.environ.get('APIFY_DATASET_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+
+def cache_key(dataset_id: str, options: Optional[dict] = None) -> str:
+    """
+    File name of a cached dataset
+
+    Options that change the items (fields, clean, ...) get their own cache,
+    keyed by a hash of their canonical JSON.
+    """
+    safe_id = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in dataset_id)
+    if not options:
+        return safe_id
+    canonical = json.dumps(options, sort_keys=True, separators=(',', ':'))
+    return f"{safe_id}-{hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]}"
+
+
+class DatasetCache:
+    """
+    Append-only JSONL + offset index with memory-mapped reads
+
+    Usage:
+        cache = DatasetCache(path_prefix)
+        cache.append(items)
+        cache[1234]            # parsed item
+        cache.raw(1234)        # memoryview of its JSON bytes (no copy)
+    """
+
+    def __init__(self, path_prefix: str):
+        """
+        Args:
+            path_prefix: Path without extension (.jsonl / .idx are added)
+        """
+        self.data_path = path_prefix + '.jsonl'
+        self.index_path = path_prefix + '.idx'
+        self._ends = array('Q')
+        self._map: Optional[mmap.mmap] = None
+
+        os.makedirs(os.path.dirname(path_prefix) or '.', exist_ok=True)
+        self._data = open(self.data_path, 'a+b')
+        self._index = open(self.index_path, 'a+b')
+        with self._locked():
+            self._recover()
+        self._remap()
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, index: int) -> Any:
+        start, end = self._span(index)
+        return json.loads(self._map[start:end])
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self._ends)):
+            yield self[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def raw(self, index: int) -> memoryview:
+        """
+        JSON bytes of one item, as a view over the mapped file
+
+        The view is only valid until the next append() or close().
+        """
+        start, end = self._span(index)
+        return memoryview(self._map)[start:end]
+
+    def _span(self, index: int):
+        """Byte range of an item's JSON (without the trailing newline)"""
+        count = len(self._ends)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('dataset item index out of range')
+
+        start = self._ends[index - 1] if index > 0 else 0
+        return start, self._ends[index] - 1
+
+    def slice(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Any]:
+        """Parsed items in [start, stop)"""
+        for index in range(*slice(start, stop).indices(len(self._ends))):
+            yield self[index]
+
+    def append(self, items, start: Optional[int] = None) -> int:
+        """
+        Append items to the end of the cache
+
+        Args:
+            items: Items to append
+            start: Index of the first item in the dataset; items another
+                writer already cached are skipped (default: append all)
+
+        Returns:
+            Number of items appended
+        """
+        with self._locked():
+            self._load_new_ends()
+            if start is not None and start < len(self._ends):
+                items = itertools.islice(items, len(self._ends) - start, None)
+
+            position = os.fstat(self._data.fileno()).st_size
+            if position != self._data_size():
+                # Unindexed tail of an interrupted append
+                self._data.truncate(self._data_size())
+                position = self._data_size()
+
+            ends = array('Q')
+            lines = []
+            for item in items:
+                line = json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+                position += len(line)
+                lines.append(line)
+                ends.append(position)
+
+            if lines:
+                # Data first, then the index that makes it visible
+                self._data.write(b''.join(lines))
+                self._data.flush()
+                self._index.write(_to_le(ends).tobytes())
+                self._index.flush()
+                self._ends.extend(ends)
+
+        self._remap()
+        return len(lines)
+
+    def refresh(self) -> int:
+        """
+        Pick up the items other writers appended since open / the last refresh
+
+        Returns:
+            Number of new items
+        """
+        count = len(self._ends)
+        with self._locked():
+            self._load_new_ends()
+        if len(self._ends) != count:
+            self._remap()
+        return len(self._ends) - count
+
+    def clear(self):
+        """Drop every cached item"""
+        self._close_map()
+        with self._locked():
+            self._data.truncate(0)
+            self._index.truncate(0)
+        self._ends = array('Q')
+
+    def close(self):
+        """Unmap and close the files"""
+        self._close_map()
+        self._data.close()
+        self._index.close()
+
+    def _data_size(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock on the index, shared by every process using the cache"""
+        fcntl.flock(self._index.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._index.fileno(), fcntl.LOCK_UN)
+
+    def _load_new_ends(self):
+        """Read index entries written by other writers (call with the lock held)"""
+        known = len(self._ends) * _OFFSET_SIZE
+        index_size = os.fstat(self._index.fileno()).st_size
+        if index_size < known:
+            # Cleared by another writer
+            self._recover()
+            return
+
+        whole = index_size - index_size % _OFFSET_SIZE
+        if whole != index_size:
+            # Partial entry of an interrupted append
+            self._index.truncate(whole)
+        if whole == known:
+            return
+        self._index.seek(known)
+        ends = array('Q')
+        ends.frombytes(self._index.read(whole - known))
+        self._ends.extend(_to_le(ends))
+
+    def _recover(self):
+        """Load the index and drop anything written after the last complete item"""
+        index_size = os.fstat(self._index.fileno()).st_size
+        whole = index_size - index_size % _OFFSET_SIZE
+        if whole != index_size:
+            self._index.truncate(whole)
+
+        self._index.seek(0)
+        ends = array('Q')
+        ends.frombytes(self._index.read(whole))
+        ends = _to_le(ends)  # Byte swap back on big-endian hosts
+
+        data_size = os.fstat(self._data.fileno()).st_size
+        # Drop index entries past the data (lost data writes)
+        count = len(ends)
+        while count and ends[count - 1] > data_size:
+            count -= 1
+        if count != len(ends):
+            del ends[count:]
+            self._index.truncate(count * _OFFSET_SIZE)
+
+        self._ends = ends
+        if data_size > self._data_size():
+            # Unindexed tail of an interrupted append
+            self._data.truncate(self._data_size())
+
+    def _remap(self):
+        self._close_map()
+        if self._ends:
+            self._map = mmap.mmap(self._data.fileno(), self._data_size(), access=mmap.ACCESS_READ)
+
+    def _close_map(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # A raw() view is still alive; the map is freed with it
+                pass
+            self._map = None
+
+
+def _to_le(offsets: array) -> array:
+    """Offsets in on-disk (little-endian) byte order"""
+    if sys.byteorder == 'big':
+        offsets = array('Q', offsets)
+        offsets.byteswap()
+    return offsets
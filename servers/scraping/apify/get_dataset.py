@@ -1,46 +1,45 @@
 """
 Get Dataset function for Apify
 """
+import os
 import subprocess
 import json
 import asyncio
+import weakref
+from collections import deque
 
-async def get_dataset(dataset_id, options=None):
+from ..._mcp_session import MCPSessionError, get_session_manager
+from ._dataset_cache import DatasetCache, cache_dir_from_env, cache_key
+
+DEFAULT_PAGE_SIZE = 1000
+
+# Sync locks by event loop, then cache file (asyncio locks belong to one loop)
+_sync_locks = weakref.WeakKeyDictionary()
+
+async def get_dataset(dataset_id, options=None, cache=False):
     """
     Get dataset from Apify via MCP real
 
+    Uses the long-lived Apify MCP session; falls back to a one-off
+    `npx` process if the session cannot be started.
+
     Args:
         dataset_id: ID of the dataset
         options: Optional parameters (offset, limit, etc.)
+        cache: Serve the items from the local dataset cache, fetching
+            only those added since the last call (see cached_dataset)
 
     Returns:
         dict: Dataset contents
     """
     try:
-        # 1. Build npx command
-        cmd = ['npx', '-y', '@apify/mcp-server', 'get-dataset', dataset_id]
-
-        if options:
-            # Add options as JSON string
-            cmd.extend(['--options', json.dumps(options)])
-
-        # 2. Execute via subprocess
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-
-        stdout, stderr = await process.communicate()
-
-        # 3. Validate result
-        if process.returncode != 0:
-            raise Exception(f"Apify dataset error: {stderr.decode()}")
+        if cache:
+            result = await _read_cached(dataset_id, options)
+        else:
+            # 1. Call the tool on the shared session
+            result = await _fetch(dataset_id, options)
 
-        # 4. Parse JSON
-        result = json.loads(stdout.decode())
-
-        # 5. Return data
+        # 2. Return data
         return {
             'success': True,
             'data': result,
@@ -52,4 +51,185 @@ async def get_dataset(dataset_id, options=None):
             'error': str(e),
             'dataset_id': dataset_id,
             'success': False
-        }
\ No newline at end of file
+        }
+
+async def iter_dataset(dataset_id, page_size=DEFAULT_PAGE_SIZE, options=None, prefetch=1):
+    """
+    Iterate over a dataset's items page by page
+
+    Fetches `page_size` items at a time (offset/limit) and requests the
+    next `prefetch` pages while the caller works on the current one, so
+    only a few pages are ever in memory.
+
+    Args:
+        dataset_id: ID of the dataset
+        page_size: Items per request
+        options: Extra parameters for every request (fields, clean, etc.)
+        prefetch: Pages requested ahead of the one being consumed
+
+    Yields:
+        Dataset items
+
+    Raises:
+        Exception: If a page cannot be fetched
+    """
+    options = dict(options or {})
+    offset = options.pop('offset', 0)
+    limit = options.pop('limit', None)  # Total items to read (None: all)
+
+    def request(page_offset):
+        size = page_size if limit is None else min(page_size, offset + limit - page_offset)
+        page_options = {**options, 'offset': page_offset, 'limit': size}
+        return asyncio.ensure_future(_fetch(dataset_id, page_options)), size
+
+    pages = deque()
+    next_offset = offset
+
+    def fill():
+        nonlocal next_offset
+        while len(pages) <= prefetch and (limit is None or next_offset < offset + limit):
+            pages.append(request(next_offset))
+            next_offset += page_size
+
+    try:
+        fill()
+        while pages:
+            task, size = pages.popleft()
+            items = _page_items(await task)
+            if len(items) < size:
+                # Last page: drop read-ahead requests past the end
+                for extra, _ in pages:
+                    extra.cancel()
+                pages.clear()
+            else:
+                fill()
+
+            for item in items:
+                yield item
+    finally:
+        for task, _ in pages:
+            task.cancel()
+
+async def cached_dataset(dataset_id, options=None, cache_dir=None, page_size=DEFAULT_PAGE_SIZE, sync=True):
+    """
+    Open the local cache of a dataset, syncing new items first
+
+    Items are kept on disk (JSONL + offset index, memory-mapped) under
+    `cache_dir` (default: APIFY_DATASET_CACHE_DIR or
+    ~/.cache/mcp-framework/apify-datasets). Syncing only requests the
+    items past the last cached one, so re-reading a dataset costs one
+    short request instead of a full download.
+
+    Args:
+        dataset_id: ID of the dataset
+        options: Item-shaping parameters (fields, clean, etc.); each
+            combination is cached separately. offset/limit are not allowed.
+        cache_dir: Cache directory
+        page_size: Items per request while syncing
+        sync: Fetch new items before returning (False: cached items only)
+
+    Returns:
+        DatasetCache: len(), cache[i], cache.raw(i), iteration; close() when done
+
+    Raises:
+        ValueError: If options contain offset or limit
+        Exception: If new items cannot be fetched
+    """
+    options = dict(options or {})
+    if 'offset' in options or 'limit' in options:
+        raise ValueError('offset/limit are not supported for cached datasets (index the cache instead)')
+
+    directory = cache_dir or cache_dir_from_env()
+    dataset = DatasetCache(os.path.join(directory, cache_key(dataset_id, options)))
+    if sync:
+        try:
+            await sync_dataset(dataset, dataset_id, options, page_size)
+        except BaseException:
+            dataset.close()
+            raise
+    return dataset
+
+async def sync_dataset(dataset, dataset_id, options=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Append the items added to a dataset since the last sync
+
+    Syncs of one cache run one at a time in a process; other processes
+    may sync the same cache, items they cached first are not duplicated.
+
+    Returns:
+        int: Number of new items
+    """
+    async with _sync_lock(dataset.data_path):
+        dataset.refresh()
+        start = len(dataset)
+        page = []
+        added = 0
+        async for item in iter_dataset(
+            dataset_id, page_size=page_size, options={**(options or {}), 'offset': start}
+        ):
+            page.append(item)
+            if len(page) >= page_size:
+                added += dataset.append(page, start=start)
+                start += len(page)
+                page = []
+        added += dataset.append(page, start=start)
+        return added
+
+def _sync_lock(path):
+    """Lock serializing the syncs of one cache file"""
+    locks = _sync_locks.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.get(path)
+    if lock is None:
+        lock = locks[path] = asyncio.Lock()
+    return lock
+
+async def _read_cached(dataset_id, options=None):
+    """get_dataset(cache=True): sync, then slice offset/limit from the cache"""
+    options = dict(options or {})
+    offset = options.pop('offset', 0)
+    limit = options.pop('limit', None)
+
+    with await cached_dataset(dataset_id, options) as dataset:
+        stop = len(dataset) if limit is None else min(len(dataset), offset + limit)
+        items = list(dataset.slice(offset, stop))
+        return {'items': items, 'offset': offset, 'count': len(items), 'total': len(dataset)}
+
+def _page_items(result):
+    """Items of one page (plain list or Apify's {"items": [...], ...})"""
+    if isinstance(result, dict):
+        return result.get('items', [])
+    return result or []
+
+async def _fetch(dataset_id, options=None):
+    """Request from the shared session, falling back to a one-off npx process"""
+    try:
+        return await get_session_manager().call_tool(
+            'apify', 'get-dataset', {'datasetId': dataset_id, **(options or {})}
+        )
+    except MCPSessionError:
+        return await _get_dataset_cli(dataset_id, options)
+
+async def _get_dataset_cli(dataset_id, options=None):
+    """Fetch the dataset through a one-off npx process (fallback)"""
+    # 1. Build npx command
+    cmd = ['npx', '-y', '@apify/mcp-server', 'get-dataset', dataset_id]
+
+    if options:
+        # Add options as JSON string
+        cmd.extend(['--options', json.dumps(options)])
+
+    # 2. Execute via subprocess
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+
+    stdout, stderr = await process.communicate()
+
+    # 3. Validate result
+    if process.returncode != 0:
+        raise Exception(f"Apify dataset error: {stderr.decode()}")
+
+    # 4. Parse JSON
+    return json.loads(stdout.decode())
@@ -7,10 +7,15 @@ import asyncio
 import tempfile
 import os
 
+from ..._mcp_session import MCPSessionError, get_session_manager
+
 async def run_actor(actor_name, config=None):
     """
     Execute an Apify Actor via MCP real
 
+    Uses the long-lived Apify MCP session; falls back to a one-off
+    `npx` process if the session cannot be started.
+
     Args:
         actor_name: Name of the actor to run (ex: 'apify/web-scraper')
         config: Configuration for the actor (dict)
@@ -19,16 +24,42 @@ async def run_actor(actor_name, config=None):
         dict: Actor execution results
     """
     try:
-        # 1. Build npx command
-        cmd = ['npx', '-y', '@apify/mcp-server', 'run-actor', actor_name]
+        # 1. Call the tool on the shared session
+        try:
+            result = await get_session_manager().call_tool(
+                'apify', 'run-actor', {'actor': actor_name, 'input': config or {}}
+            )
+        except MCPSessionError:
+            result = await _run_actor_cli(actor_name, config)
+
+        # 2. Return data
+        return {
+            'success': True,
+            'data': result,
+            'actor': actor_name
+        }
+
+    except Exception as e:
+        return {
+            'error': str(e),
+            'actor': actor_name,
+            'success': False
+        }
 
-        if config:
-            # Create temporary file for config
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-                json.dump(config, f)
-                config_path = f.name
-            cmd.extend(['--config', config_path])
+async def _run_actor_cli(actor_name, config=None):
+    """Run the actor through a one-off npx process (fallback)"""
+    # 1. Build npx command
+    cmd = ['npx', '-y', '@apify/mcp-server', 'run-actor', actor_name]
 
+    config_path = None
+    if config:
+        # Create temporary file for config
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            json.dump(config, f)
+            config_path = f.name
+        cmd.extend(['--config', config_path])
+
+    try:
         # 2. Execute via subprocess
         process = await asyncio.create_subprocess_exec(
             *cmd,
@@ -37,28 +68,14 @@ async def run_actor(actor_name, config=None):
         )
 
         stdout, stderr = await process.communicate()
-
+    finally:
         # Clean up temporary file
-        if config:
+        if config_path:
             os.unlink(config_path)
 
-        # 3. Validate result
-        if process.returncode != 0:
-            raise Exception(f"Apify error: {stderr.decode()}")
-
-        # 4. Parse JSON
-        result = json.loads(stdout.decode())
+    # 3. Validate result
+    if process.returncode != 0:
+        raise Exception(f"Apify error: {stderr.decode()}")
 
-        # 5. Return data
-        return {
-            'success': True,
-            'data': result,
-            'actor': actor_name
-        }
-
-    except Exception as e:
-        return {
-            'error': str(e),
-            'actor': actor_name,
-            'success': False
-        }
\ No newline at end of file
+    # 4. Parse JSON
+    return json.loads(stdout.decode())
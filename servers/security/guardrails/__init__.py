@@ -4,15 +4,24 @@ Guardrails AI
 LLM validation and security guardrails
 
 Exemplo de uso:
-    from servers.security.guardrails import validate
+    from servers.security.guardrails import validate, validate_many, validate_stream
 
     result = await validate(text, rules)
+
+    # Conteúdo grande: envio em chunks, resultados conforme chegam
+    with open('output.txt', 'rb') as f:
+        async for partial in validate_stream(f, rules):
+            print(partial)
+
+    # Muitos textos: lotes concorrentes, resultados na ordem de entrada
+    async for index, result in validate_many(chunks, rules, batch_size=32, concurrency=4):
+        print(index, result['valid'])
 """
 
-from .validate import validate
-from .scan import scan
+from .validate import validate, validate_many, validate_stream
+from .scan import scan, scan_many, scan_stream
 
-__all__ = ['validate', 'scan']
+__all__ = ['validate', 'validate_many', 'validate_stream', 'scan', 'scan_many', 'scan_stream']
 
 # Metadata
 __version__ = '0.6.7'
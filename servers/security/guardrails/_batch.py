@@ -0,0 +1,132 @@
+"""
+Batch runner for Guardrails validate/scan
+(Private module - not exported)
+
+A batch is checked in one of two ways:
+- Over the shared Guardrails MCP session, when it is available: the MCP
+  tools take one text, so the items are pipelined as concurrent calls on
+  the session (no process per item)
+- Otherwise, every text of the batch goes to a single checker process
+  (see _stream.run_checker_batch), or one process per text when that
+  run fails (e.g. a checker without --batch)
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Tuple
+
+from ..._mcp_session import MCPSessionError, get_session_manager
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_CONCURRENCY = 4
+
+
+async def _aiter(items):
+    """Iterate a sync or async iterable"""
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _next_batch(iterator, batch_size) -> List[Any]:
+    batch = []
+    async for item in iterator:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            break
+    return batch
+
+
+async def session_available() -> bool:
+    """True if the Guardrails MCP session is running or can be started"""
+    try:
+        await get_session_manager().get('guardrails')
+    except MCPSessionError:
+        return False
+    return True
+
+
+async def run_many(
+    call_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+    items,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Run call_batch(batch) over an iterable in batches
+
+    Items are read lazily, batch_size at a time; up to `concurrency`
+    batches are in flight.
+
+    Args:
+        call_batch: Coroutine function returning one result per item of a batch
+        items: Iterable or async iterable of items
+        batch_size: Items per batch
+        concurrency: Max batches in flight
+        ordered: Yield in input order (True) or as batches complete (False)
+
+    Yields:
+        (index, result) for every item; when call_batch fails, every item
+        of the batch yields {'success': False, 'error': ...}
+    """
+    if batch_size < 1 or concurrency < 1:
+        raise ValueError('batch_size and concurrency must be >= 1')
+
+    iterator = _aiter(items).__aiter__()
+    results: asyncio.Queue = asyncio.Queue()
+    tasks = set()
+    remaining = {}  # batch number -> items without a result yet
+    buffered = {}
+    next_index = 0
+    submitted = 0
+    exhausted = False
+
+    async def run_batch(batch_number, start, batch):
+        try:
+            batch_results = await call_batch(batch)
+        except Exception as e:
+            batch_results = [{'success': False, 'error': str(e)} for _ in batch]
+        for i, result in enumerate(batch_results):
+            await results.put((batch_number, start + i, result))
+
+    try:
+        while True:
+            # Keep `concurrency` batches in flight (and the reorder buffer bounded)
+            while (
+                not exhausted
+                and len(remaining) < concurrency
+                and len(buffered) < concurrency * batch_size
+            ):
+                batch = await _next_batch(iterator, batch_size)
+                if not batch:
+                    exhausted = True
+                    break
+                batch_number = submitted
+                remaining[batch_number] = len(batch)
+                task = asyncio.ensure_future(run_batch(batch_number, submitted, batch))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                submitted += len(batch)
+
+            if not remaining:
+                break  # Source exhausted and every result delivered
+
+            batch_number, index, result = await results.get()
+            remaining[batch_number] -= 1
+            if remaining[batch_number] == 0:
+                del remaining[batch_number]
+
+            if not ordered:
+                yield index, result
+                continue
+
+            buffered[index] = result
+            while next_index in buffered:
+                yield next_index, buffered.pop(next_index)
+                next_index += 1
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,363 @@
+"""
+Streaming I/O for the Guardrails checker
+(Private module - not exported)
+
+Input is written to the checker's stdin in fixed-size chunks (`--input -`)
+and its JSON output is parsed as it arrives, so peak memory does not grow
+with the size of the content. A temporary file (also written in chunks)
+is only used when the checker does not read stdin, or when
+GUARDRAILS_INPUT_MODE=file.
+"""
+
+import os
+import re
+import json
+import codecs
+import asyncio
+import tempfile
+from typing import Any, AsyncIterator, List, Optional
+
+CHECKER_CMD = ['npx', '-y', 'guardrails-ai']
+
+# Bytes per write to the checker / read from it
+CHUNK_SIZE = 64 * 1024
+
+INPUT_MODES = ('stdin', 'file')
+
+# Characters that change the parser state outside / inside a JSON string
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NON_SPACE = re.compile(r'\S')
+_SCALAR_END = re.compile(r'[\s{}\[\]"]')
+
+
+class _StdinUnsupported(Exception):
+    """Checker failed on stdin input without producing any result"""
+
+
+def _is_replayable(source):
+    return isinstance(source, (str, bytes, bytearray, memoryview))
+
+
+async def iter_chunks(source, chunk_size=CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Yield UTF-8 chunks of a text source
+
+    Args:
+        source: str, bytes, binary/text file object, or (async) iterable
+            of str/bytes pieces
+        chunk_size: Max characters/bytes per chunk for str, bytes and files
+    """
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size].encode('utf-8')
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+    elif hasattr(source, 'read'):
+        while True:
+            piece = source.read(chunk_size)
+            if not piece:
+                break
+            yield piece.encode('utf-8') if isinstance(piece, str) else piece
+    elif hasattr(source, '__aiter__'):
+        async for piece in source:
+            yield piece.encode('utf-8') if isinstance(piece, str) else piece
+    else:
+        for piece in source:
+            yield piece.encode('utf-8') if isinstance(piece, str) else piece
+
+
+class JSONStreamParser:
+    """
+    Incremental parser for a stream of concatenated / line-separated JSON values
+
+    Every character is scanned once: nesting depth and string state carry
+    over between chunks, and a value is decoded only when it is complete,
+    so a large value split into many chunks is parsed in linear time.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._pieces: List[str] = []  # Text of the value in progress
+        self._active = False  # Inside a value
+        self._scalar = False  # The value in progress is a number or literal
+        self._depth = 0
+        self._in_string = False
+        self._escape = False  # Last chunk ended on a backslash inside a string
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Add bytes and return every JSON value completed by them
+
+        Raises:
+            ValueError: If a completed value is not valid JSON
+        """
+        return self._consume(self._decoder.decode(data))
+
+    def close(self) -> List[Any]:
+        """
+        End the stream
+
+        Returns:
+            Values completed by the end of the stream (a trailing number or literal)
+
+        Raises:
+            ValueError: If the stream ended inside a JSON value
+        """
+        values = self._consume(self._decoder.decode(b'', final=True))
+        if self._active:
+            # Decodes a trailing scalar, or surfaces the real parse error
+            values.append(json.loads(''.join(self._pieces)))
+            self._pieces = []
+            self._active = False
+        return values
+
+    def _consume(self, text: str) -> List[Any]:
+        values = []
+        start = position = 0  # start: where the value in progress begins in text
+
+        while True:
+            if not self._active:
+                match = _NON_SPACE.search(text, position)
+                if match is None:
+                    return values
+                start = position = match.start()
+                self._active = True
+                char = text[position]
+                if char in '{[':
+                    self._depth = 1
+                    position += 1
+                elif char == '"':
+                    self._in_string = True
+                    position += 1
+                else:
+                    self._scalar = True
+
+            end = self._find_end(text, position)
+            if end is None:
+                self._pieces.append(text[start:])
+                return values
+
+            self._pieces.append(text[start:end])
+            values.append(json.loads(''.join(self._pieces)))
+            self._pieces = []
+            self._active = False
+            position = end
+
+    def _find_end(self, text: str, position: int) -> Optional[int]:
+        """Advance the scan state through text; return where the value ends, if it does"""
+        if self._scalar:
+            match = _SCALAR_END.search(text, position)
+            if match is None:
+                return None
+            self._scalar = False
+            return match.start()
+
+        while True:
+            if self._in_string:
+                if self._escape:
+                    if position >= len(text):
+                        return None
+                    self._escape = False
+                    position += 1
+                match = _STRING_SPECIAL.search(text, position)
+                if match is None:
+                    return None
+                position = match.end()
+                if match.group() == '\\':
+                    self._escape = True
+                    continue
+                self._in_string = False
+                if self._depth == 0:
+                    return position
+            else:
+                match = _STRUCTURAL.search(text, position)
+                if match is None:
+                    return None
+                position = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in '{[':
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return position
+
+
+def merge_results(values: List[Any]) -> Any:
+    """
+    Combine the values emitted by the checker into one result
+
+    A single value is returned as is; with several (one per part of the
+    input), issues are concatenated and the other keys come from the last.
+    """
+    if not values:
+        raise Exception('Guardrails returned no result')
+    if len(values) == 1:
+        return values[0]
+
+    merged = dict(values[-1])
+    merged['issues'] = [
+        issue
+        for value in values
+        if isinstance(value, dict)
+        for issue in value.get('issues', [])
+    ]
+    return merged
+
+
+async def run_checker(args, source, input_mode=None, chunk_size=CHUNK_SIZE) -> AsyncIterator[Any]:
+    """
+    Run the checker on a source and yield each JSON value it outputs
+
+    Args:
+        args: Checker arguments (ex: ['validate', '--rules', '{...}'])
+        source: Content (see iter_chunks)
+        input_mode: 'stdin' or 'file' (default: GUARDRAILS_INPUT_MODE env or 'stdin')
+        chunk_size: Bytes per write/read
+
+    Raises:
+        Exception: If the checker fails
+    """
+    mode = input_mode or os.environ.get('GUARDRAILS_INPUT_MODE', 'stdin')
+    if mode not in INPUT_MODES:
+        raise ValueError(f"Invalid input mode '{mode}' (expected one of: {', '.join(INPUT_MODES)})")
+
+    if mode == 'stdin':
+        try:
+            async for value in _run_with_stdin(args, source, chunk_size):
+                yield value
+            return
+        except _StdinUnsupported as e:
+            if not _is_replayable(source):
+                raise Exception(f"Guardrails error: {e}")
+
+    async for value in _run_with_file(args, source, chunk_size):
+        yield value
+
+
+async def run_checker_batch(args, texts, input_mode=None) -> List[Any]:
+    """
+    Check several texts in a single checker run
+
+    The texts are sent as JSON Lines (one JSON string per line) with
+    `--batch`; the checker answers with one result per text, in order.
+
+    Args:
+        args: Checker arguments (ex: ['validate', '--rules', '{...}'])
+        texts: List of str/bytes
+        input_mode: 'stdin' or 'file' (see run_checker)
+
+    Returns:
+        One result per text
+
+    Raises:
+        Exception: If the checker fails or the result count does not match
+    """
+    source = ''.join(
+        json.dumps(text.decode('utf-8') if isinstance(text, (bytes, bytearray)) else text) + '\n'
+        for text in texts
+    )
+    values = [value async for value in run_checker([*args, '--batch'], source, input_mode)]
+    if len(values) != len(texts):
+        raise Exception(f'Guardrails returned {len(values)} results for a batch of {len(texts)}')
+    return values
+
+
+async def _feed(stdin, source, chunk_size):
+    """Write the source to stdin (stops quietly if the checker closes it)"""
+    try:
+        async for chunk in iter_chunks(source, chunk_size):
+            stdin.write(chunk)
+            await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    finally:
+        try:
+            stdin.close()
+        except (OSError, RuntimeError):
+            pass
+
+
+async def _read_output(process, chunk_size):
+    """Yield JSON values from stdout as they complete"""
+    parser = JSONStreamParser()
+    while True:
+        data = await process.stdout.read(chunk_size)
+        if not data:
+            break
+        for value in parser.feed(data):
+            yield value
+    for value in parser.close():
+        yield value
+
+
+async def _run_with_stdin(args, source, chunk_size):
+    process = await asyncio.create_subprocess_exec(
+        *CHECKER_CMD, *args, '--input', '-',
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    feeder = asyncio.ensure_future(_feed(process.stdin, source, chunk_size))
+    stderr = asyncio.ensure_future(process.stderr.read())
+    produced = False
+
+    try:
+        async for value in _read_output(process, chunk_size):
+            produced = True
+            yield value
+
+        await feeder
+        await process.wait()
+        if process.returncode != 0:
+            message = (await stderr).decode(errors='replace')
+            if not produced:
+                # Possibly a checker without stdin support: retry from a file
+                raise _StdinUnsupported(message)
+            raise Exception(f"Guardrails error: {message}")
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        feeder.cancel()
+        stderr.cancel()
+
+
+async def _run_with_file(args, source, chunk_size):
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.txt') as f:
+        temp_path = f.name
+        try:
+            async for chunk in iter_chunks(source, chunk_size):
+                f.write(chunk)
+        except BaseException:
+            f.close()
+            os.unlink(temp_path)
+            raise
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *CHECKER_CMD, *args, '--input', temp_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr = asyncio.ensure_future(process.stderr.read())
+        try:
+            async for value in _read_output(process, chunk_size):
+                yield value
+
+            await process.wait()
+            if process.returncode != 0:
+                raise Exception(f"Guardrails error: {(await stderr).decode(errors='replace')}")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stderr.cancel()
+    finally:
+        # Clean up temporary file
+        os.unlink(temp_path)
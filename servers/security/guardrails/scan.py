@@ -1,68 +1,121 @@
 """
 Scan function for Guardrails AI
 """
-import subprocess
-import json
 import asyncio
-import tempfile
-import os
+
+from ..._mcp_session import MCPSessionError, get_session_manager
+from ._batch import DEFAULT_BATCH_SIZE, DEFAULT_CONCURRENCY, run_many, session_available
+from ._stream import merge_results, run_checker, run_checker_batch
 
 async def scan(content, scan_type='security'):
     """
     Scan content for security issues using Guardrails AI via MCP real
 
+    Strings go through the long-lived Guardrails MCP session. File objects
+    and (async) iterables of chunks, or any input when the session cannot
+    be started, are streamed to the checker's stdin instead.
+
     Args:
-        content: Content to scan
+        content: Content to scan (str, bytes, file object or iterable of chunks)
         scan_type: Type of scan (security, privacy, etc.)
 
     Returns:
         dict: Scan results
     """
     try:
-        # 1. Build command
-        cmd = ['npx', '-y', 'guardrails-ai', 'scan']
+        result = None
+        if isinstance(content, str):
+            # 1. Call the tool on the shared session
+            try:
+                result = await get_session_manager().call_tool(
+                    'guardrails', 'scan', {'content': content, 'type': scan_type}
+                )
+            except MCPSessionError:
+                pass
 
-        # Create temporary file with content
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write(content)
-            temp_path = f.name
+        if result is None:
+            result = merge_results([value async for value in scan_stream(content, scan_type)])
 
-        cmd.extend(['--input', temp_path])
-        cmd.extend(['--type', scan_type])
+        # 2. Return data
+        return _result(result)
 
-        # 2. Execute via subprocess
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+    except Exception as e:
+        return _error(e)
 
-        stdout, stderr = await process.communicate()
+def _result(result):
+    return {
+        'success': True,
+        'issues': result.get('issues', []),
+        'risk_level': result.get('risk_level', 'unknown'),
+        'recommendations': result.get('recommendations', []),
+        'data': result
+    }
 
-        # Clean up temporary file
-        os.unlink(temp_path)
+def _error(error):
+    return {
+        'error': str(error),
+        'issues': [],
+        'risk_level': 'error',
+        'recommendations': [],
+        'success': False
+    }
+
+async def scan_stream(content, scan_type='security', input_mode=None):
+    """
+    Stream content to the Guardrails checker and yield results as they arrive
 
-        # 3. Validate result
-        if process.returncode != 0:
-            raise Exception(f"Guardrails scan error: {stderr.decode()}")
+    Args:
+        content: Content to scan (str, bytes, file object or iterable of chunks)
+        scan_type: Type of scan (security, privacy, etc.)
+        input_mode: 'stdin' (default) or 'file' (see GUARDRAILS_INPUT_MODE)
 
-        # 4. Parse JSON
-        result = json.loads(stdout.decode())
+    Yields:
+        dict: Each JSON result emitted by the checker
 
-        # 5. Return data
-        return {
-            'success': True,
-            'issues': result.get('issues', []),
-            'risk_level': result.get('risk_level', 'unknown'),
-            'recommendations': result.get('recommendations', []),
-            'data': result
-        }
+    Raises:
+        Exception: If the checker fails
+    """
+    async for value in run_checker(['scan', '--type', scan_type], content, input_mode):
+        yield value
 
-    except Exception as e:
-        return {
-            'error': str(e),
-            'issues': [],
-            'risk_level': 'error',
-            'recommendations': [],
-            'success': False
-        }
\ No newline at end of file
+async def _scan_batch(contents, scan_type):
+    """
+    Scan one batch of scan_many: concurrent calls on the shared session,
+    or a single checker process for the whole batch (one process per item
+    if the batch run fails)
+    """
+    if all(isinstance(content, (str, bytes)) for content in contents) and not await session_available():
+        try:
+            values = await run_checker_batch(['scan', '--type', scan_type], contents)
+        except Exception:
+            # Checker without --batch, unparsable output or a failed run
+            pass
+        else:
+            return [_result(value) for value in values]
+
+    return await asyncio.gather(*(scan(content, scan_type) for content in contents))
+
+async def scan_many(contents, scan_type='security', batch_size=DEFAULT_BATCH_SIZE,
+                    concurrency=DEFAULT_CONCURRENCY, ordered=True):
+    """
+    Scan many contents, batch_size at a time, with up to `concurrency` batches in flight
+
+    With the Guardrails MCP session, the contents of a batch are pipelined
+    as concurrent calls on it (batch_size * concurrency calls in flight at
+    most). Without it, each batch of strings is scanned by one checker
+    process (one process per item if that run fails).
+
+    Args:
+        contents: Iterable or async iterable of contents
+        scan_type: Type of scan (same for every content)
+        batch_size: Contents per batch
+        concurrency: Max batches in flight
+        ordered: Yield in input order (True) or as batches complete (False)
+
+    Yields:
+        tuple: (index, result) where result is what scan() returns
+    """
+    async for index, result in run_many(
+        lambda batch: _scan_batch(batch, scan_type), contents, batch_size, concurrency, ordered
+    ):
+        yield index, result
@@ -1,68 +1,127 @@
 """
 Validate function for Guardrails AI
 """
-import subprocess
 import json
 import asyncio
-import tempfile
-import os
+
+from ..._mcp_session import MCPSessionError, get_session_manager
+from ._batch import DEFAULT_BATCH_SIZE, DEFAULT_CONCURRENCY, run_many, session_available
+from ._stream import merge_results, run_checker, run_checker_batch
 
 async def validate(text, rules=None):
     """
     Validate text using Guardrails AI via MCP real
 
+    Strings go through the long-lived Guardrails MCP session. File objects
+    and (async) iterables of chunks, or any input when the session cannot
+    be started, are streamed to the checker's stdin instead.
+
     Args:
-        text: Text to validate
+        text: Text to validate (str, bytes, file object or iterable of chunks)
         rules: Optional validation rules/config
 
     Returns:
         dict: Validation result
     """
     try:
-        # 1. Build command
-        cmd = ['npx', '-y', 'guardrails-ai', 'validate']
+        result = None
+        if isinstance(text, str):
+            # 1. Call the tool on the shared session
+            arguments = {'text': text}
+            if rules:
+                arguments['rules'] = rules
+            try:
+                result = await get_session_manager().call_tool('guardrails', 'validate', arguments)
+            except MCPSessionError:
+                pass
 
-        # Create temporary file with text
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write(text)
-            temp_path = f.name
+        if result is None:
+            result = merge_results([value async for value in validate_stream(text, rules)])
 
-        cmd.extend(['--input', temp_path])
+        # 2. Return data
+        return _result(result)
 
-        if rules:
-            cmd.extend(['--rules', json.dumps(rules)])
+    except Exception as e:
+        return _error(e)
 
-        # 2. Execute via subprocess
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+def _result(result):
+    return {
+        'success': True,
+        'valid': result.get('valid', False),
+        'issues': result.get('issues', []),
+        'score': result.get('score', 0.0),
+        'data': result
+    }
 
-        stdout, stderr = await process.communicate()
+def _error(error):
+    return {
+        'error': str(error),
+        'valid': False,
+        'success': False
+    }
 
-        # Clean up temporary file
-        os.unlink(temp_path)
+def _checker_args(rules):
+    args = ['validate']
+    if rules:
+        args.extend(['--rules', json.dumps(rules)])
+    return args
+
+async def validate_stream(text, rules=None, input_mode=None):
+    """
+    Stream text to the Guardrails checker and yield results as they arrive
 
-        # 3. Validate result
-        if process.returncode != 0:
-            raise Exception(f"Guardrails error: {stderr.decode()}")
+    Args:
+        text: Text to validate (str, bytes, file object or iterable of chunks)
+        rules: Optional validation rules/config
+        input_mode: 'stdin' (default) or 'file' (see GUARDRAILS_INPUT_MODE)
 
-        # 4. Parse JSON
-        result = json.loads(stdout.decode())
+    Yields:
+        dict: Each JSON result emitted by the checker
 
-        # 5. Return data
-        return {
-            'success': True,
-            'valid': result.get('valid', False),
-            'issues': result.get('issues', []),
-            'score': result.get('score', 0.0),
-            'data': result
-        }
+    Raises:
+        Exception: If the checker fails
+    """
+    async for value in run_checker(_checker_args(rules), text, input_mode):
+        yield value
 
-    except Exception as e:
-        return {
-            'error': str(e),
-            'valid': False,
-            'success': False
-        }
\ No newline at end of file
+async def _validate_batch(texts, rules):
+    """
+    Validate one batch of validate_many: concurrent calls on the shared
+    session, or a single checker process for the whole batch (one process
+    per item if the batch run fails)
+    """
+    if all(isinstance(text, (str, bytes)) for text in texts) and not await session_available():
+        try:
+            values = await run_checker_batch(_checker_args(rules), texts)
+        except Exception:
+            # Checker without --batch, unparsable output or a failed run
+            pass
+        else:
+            return [_result(value) for value in values]
+
+    return await asyncio.gather(*(validate(text, rules) for text in texts))
+
+async def validate_many(texts, rules=None, batch_size=DEFAULT_BATCH_SIZE,
+                        concurrency=DEFAULT_CONCURRENCY, ordered=True):
+    """
+    Validate many texts, batch_size at a time, with up to `concurrency` batches in flight
+
+    With the Guardrails MCP session, the texts of a batch are pipelined as
+    concurrent calls on it (batch_size * concurrency calls in flight at
+    most). Without it, each batch of strings is checked by one checker
+    process (one process per item if that run fails).
+
+    Args:
+        texts: Iterable or async iterable of texts
+        rules: Optional validation rules/config (same for every text)
+        batch_size: Texts per batch
+        concurrency: Max batches in flight
+        ordered: Yield in input order (True) or as batches complete (False)
+
+    Yields:
+        tuple: (index, result) where result is what validate() returns
+    """
+    async for index, result in run_many(
+        lambda batch: _validate_batch(batch, rules), texts, batch_size, concurrency, ordered
+    ):
+        yield index, result
@@ -3,12 +3,22 @@ Python Bridge - JavaScript ↔ Python communication
 Handles stdin/stdout communication for MCP integration
 """
 
-import sys
-import json
+import os
+import time
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .executor import SkillExecutor
+from .protocol import MessageChannel, open_stdin_reader, supported_framings
+from .resources import start_tracemalloc_from_env
+from . import serializer
+
+
+# Default cap on concurrently running "execute" requests
+DEFAULT_MAX_CONCURRENCY = 8
+
+# "skills" value of a preload selecting registry.json's high-priority skills
+HIGH_PRIORITY = "high-priority"
 
 
 class PythonBridge:
@@ -19,13 +29,19 @@ class PythonBridge:
     - Input: JSON via stdin (one message per line)
     - Output: JSON via stdout
     - Errors: JSON via stdout with success=false
+    - Framing: "ready" lists supported framings; {"action": "set_framing",
+      "framing": "frame-json"} switches both directions to length-prefixed
+      frames after the acknowledgement (see protocol.py)
 
     Message Format (Input):
     {
-        "action": "execute" | "stats" | "ping",
+        "action": "execute" | "stats" | "metrics" | "preload" | "ping" | "set_framing" | "spool_release",
         "skill": "skill-name",
         "params": {...},
         "timeout": 30,
+        "stream": false,
+        "resources": false,
+        "profile": false | {"mode": "cprofile" | "sample", "top": 20, "collapsed": false},
         "requestId": "unique-id"
     }
 
@@ -36,18 +52,67 @@ class PythonBridge:
         "error": "error message" | null,
         "requestId": "unique-id"
     }
+
+    Streaming: with "stream": true, each chunk yielded by a generator skill
+    is sent as {"type": "chunk", "requestId", "index", "data"} before the
+    final "result" (whose "result" is the generator's return value).
+    Without it, generator skills return the list of chunks.
+
+    Resources: with "resources": true the result carries "resources"
+    (cpu_user, cpu_system, max_rss_delta, alloc_peak, gc_collections and
+    bytes_serialized, see resources.py); per-skill totals are always kept
+    and returned by "stats" under "resources". alloc_peak needs
+    MCP_TRACEMALLOC=1.
+
+    Profiling: with "profile" set the result carries "profile" (top
+    functions by cumulative and self time, optional collapsed stacks for
+    flamegraphs, see profiler.py). Without it no profiler code runs.
+
+    Metrics: {"action": "metrics", "format": "json" | "prometheus"} returns
+    per-skill latency histograms of the queue, load, execute, serialize and
+    total phases plus error counts by error_type (see metrics.py), as
+    {"type": "metrics", "format", "metrics": <dict or Prometheus text>}.
+
+    Preload: {"action": "preload", "skills": [...] | "high-priority"} imports
+    the skills concurrently in the background (default: the high-priority
+    skills of registry.json) and answers {"type": "preload", "preload":
+    {"skills": {name: {"status", "load_time", ...}}, "loaded", "failed",
+    "total_time"}} when all are done. MCP_SKILLS_PRELOAD (same values,
+    comma-separated) starts one right after "ready"; its report is kept
+    in "stats" under "preload".
+
+    Large messages: above MCP_SPOOL_THRESHOLD bytes a message is written to
+    a spool file and replaced by {"type": "spool", "spool": {...}}; read it,
+    then send {"action": "spool_release", "handle": <id>} (see spool.py).
+
+    "execute" requests run concurrently (up to max_concurrency), so results
+    may arrive out of order; match them by requestId.
     """
 
-    def __init__(self, skills_path: str = None):
+    def __init__(self, skills_path: str = None, max_concurrency: Optional[int] = None):
         """
         Initialize the Python Bridge
 
         Args:
             skills_path: Path to skills/packages directory
+            max_concurrency: Max concurrent skill executions
+                (default: MCP_SKILLS_MAX_CONCURRENCY env or 8)
         """
         self.executor = SkillExecutor(skills_path)
         self.running = False
 
+        self.max_concurrency = max_concurrency or int(
+            os.environ.get("MCP_SKILLS_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.startup_preload = os.environ.get("MCP_SKILLS_PRELOAD")
+        self._tasks = set()
+        self._queued = 0
+        self._in_flight = 0
+        self.channel: Optional[MessageChannel] = None
+
+        start_tracemalloc_from_env()
+
         # Setup error logging
         self._setup_error_logging()
 
@@ -64,47 +129,71 @@ class PythonBridge:
     async def start(self):
         """Start the bridge (listen to stdin)"""
         self.running = True
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.channel = MessageChannel(await open_stdin_reader())
 
         # Send ready signal
         self._send_message({
             "type": "ready",
             "message": "Python Bridge ready",
-            "version": "1.0.0"
+            "version": "1.0.0",
+            "framings": supported_framings()
         })
 
+        # Startup warm set: imported in the background, report kept for "stats"
+        if self.startup_preload:
+            skills = self.startup_preload.strip()
+            self._schedule_preload(
+                {"skills": skills if skills == HIGH_PRIORITY else skills.split(",")}, None
+            )
+
         # Process messages from stdin
         while self.running:
             try:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                message = await self.channel.receive()
 
-                if not line:
+                if message is None:
                     break
 
-                await self._process_message(line.strip())
+                await self._process_message(message)
 
             except KeyboardInterrupt:
                 break
+            except ValueError as e:
+                self._send_error(f"Invalid message: {e}", request_id=None)
             except Exception as e:
                 self._send_error(str(e), request_id=None)
 
-    async def _process_message(self, message_str: str):
-        """Process incoming JSON message"""
+        # Let in-flight executions deliver their results before exiting
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        self.executor.shutdown()
+
+    async def _process_message(self, message: Dict[str, Any]):
+        """Process incoming decoded message"""
         try:
-            message = json.loads(message_str)
             request_id = message.get("requestId")
             action = message.get("action")
 
             if action == "execute":
-                await self._handle_execute(message, request_id)
+                self._schedule_execute(message, request_id)
             elif action == "stats":
                 await self._handle_stats(request_id)
+            elif action == "metrics":
+                self._handle_metrics(message, request_id)
+            elif action == "preload":
+                self._schedule_preload(message, request_id)
             elif action == "ping":
                 self._send_message({
                     "type": "pong",
                     "requestId": request_id
                 })
+            elif action == "set_framing":
+                self._handle_set_framing(message, request_id)
+            elif action == "spool_release":
+                # Receiver finished reading a spooled message (no reply)
+                self.channel.spool.release(message.get("handle"))
             elif action == "shutdown":
                 self.running = False
                 self._send_message({
@@ -118,13 +207,88 @@ class PythonBridge:
                     request_id=request_id
                 )
 
-        except json.JSONDecodeError as e:
-            self._send_error(f"Invalid JSON: {e}", request_id=None)
         except Exception as e:
             self._send_error(str(e), request_id=None)
 
-    async def _handle_execute(self, message: Dict[str, Any], request_id: str):
-        """Handle skill execution request"""
+    def _schedule_execute(self, message: Dict[str, Any], request_id: str):
+        """Run an execute request in its own task without blocking stdin"""
+        task = asyncio.ensure_future(
+            self._run_execute(message, request_id, time.perf_counter_ns())
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _schedule_preload(self, message: Dict[str, Any], request_id: Optional[str]):
+        """Run a preload in its own task (request_id None: startup warm set, no reply)"""
+        task = asyncio.ensure_future(self._handle_preload(message, request_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle_preload(self, message: Dict[str, Any], request_id: Optional[str]):
+        """Handle preload request"""
+        skills = message.get("skills", HIGH_PRIORITY)
+        if skills == HIGH_PRIORITY:
+            skills = None
+        elif isinstance(skills, list) and all(isinstance(name, str) for name in skills):
+            skills = [name.strip() for name in skills if name.strip()]
+        else:
+            self._send_error(
+                f"'skills' must be a list of skill names or \"{HIGH_PRIORITY}\"", request_id
+            )
+            return
+
+        report = await self.executor.preload(skills)
+
+        if request_id is None:
+            for name, outcome in report["skills"].items():
+                if outcome["status"] == "failed":
+                    logging.error(f"Preload of skill '{name}' failed: {outcome['error']}")
+            return
+
+        self._send_message({
+            "type": "preload",
+            "requestId": request_id,
+            "preload": report
+        })
+
+    async def _run_execute(self, message: Dict[str, Any], request_id: str, received_ns: int):
+        """Wait for a concurrency slot, then execute (received_ns: perf_counter_ns() at arrival)"""
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        self._in_flight += 1
+        try:
+            await self._handle_execute(
+                message, request_id, received_ns, time.perf_counter_ns() - received_ns
+            )
+        except Exception as e:
+            self._send_error(str(e), request_id=request_id)
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    async def _handle_execute(
+        self,
+        message: Dict[str, Any],
+        request_id: str,
+        received_ns: Optional[int] = None,
+        queue_ns: int = 0
+    ):
+        """
+        Handle skill execution request
+
+        Args:
+            message: The execute message
+            request_id: Request id to answer
+            received_ns: perf_counter_ns() when the request arrived (default: now)
+            queue_ns: Time spent waiting for a concurrency slot
+        """
+        if received_ns is None:
+            received_ns = time.perf_counter_ns()
+
         skill = message.get("skill")
         params = message.get("params", {})
         timeout = message.get("timeout", 30)
@@ -133,19 +297,90 @@ class PythonBridge:
             self._send_error("Missing 'skill' parameter", request_id)
             return
 
+        on_chunk = None
+        if message.get("stream"):
+            index = 0
+
+            def on_chunk(chunk):
+                nonlocal index
+                self._send_message({
+                    "type": "chunk",
+                    "requestId": request_id,
+                    "index": index,
+                    "data": chunk
+                })
+                index += 1
+
         # Execute skill
-        result = await self.executor.execute_skill(skill, params, timeout)
+        result = await self.executor.execute_skill(
+            skill, params, timeout, on_chunk,
+            resources=bool(message.get("resources")),
+            profile=message.get("profile")
+        )
 
         # Send response
+        self.executor.observe(skill, "queue", queue_ns)
+        self._send_result(request_id, result)
+        self.executor.observe(skill, "total", time.perf_counter_ns() - received_ns)
+
+    def _send_result(self, request_id: str, result: Dict[str, Any]):
+        """
+        Send an execute result
+
+        The skill's return value is encoded once, ahead of the message, so
+        its size is known for the resource totals and "bytes_serialized",
+        and its encoding time is the "serialize" phase.
+        """
+        if self.channel is None:
+            self._send_message({"type": "result", "requestId": request_id, **result})
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            encoded = self.channel.encode_value(result.get("result"))
+        except Exception as e:
+            logging.error(f"Failed to encode result: {e}")
+            self._send_error(f"Result is not serializable: {e}", request_id)
+            return
+
+        self.executor.observe(result["skill"], "serialize", time.perf_counter_ns() - start)
+        self.executor.record_serialized(result["skill"], len(encoded))
+        if "resources" in result:
+            result["resources"]["bytes_serialized"] = len(encoded)
+
+        self._send_message(
+            {"type": "result", "requestId": request_id, **result},
+            fragments={"result": encoded}
+        )
+
+    def _handle_set_framing(self, message: Dict[str, Any], request_id: str):
+        """Acknowledge in the current framing, then switch both directions"""
+        framing = message.get("framing")
+
+        if framing not in supported_framings():
+            self._send_error(
+                f"Unsupported framing: {framing} "
+                f"(supported: {', '.join(supported_framings())})",
+                request_id
+            )
+            return
+
         self._send_message({
-            "type": "result",
-            "requestId": request_id,
-            **result
+            "type": "framing",
+            "framing": framing,
+            "requestId": request_id
         })
+        self.channel.switch(framing)
 
     async def _handle_stats(self, request_id: str):
         """Handle stats request"""
-        stats = self.executor.get_stats()
+        stats = {
+            **self.executor.get_stats(),
+            "queue_depth": self._queued,
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "spool": self.channel.spool.get_stats() if self.channel is not None else None
+        }
 
         self._send_message({
             "type": "stats",
@@ -153,14 +388,40 @@ class PythonBridge:
             "stats": stats
         })
 
-    def _send_message(self, data: Dict[str, Any]):
-        """Send JSON message to stdout"""
+    def _handle_metrics(self, message: Dict[str, Any], request_id: str):
+        """Handle metrics request (JSON or Prometheus text)"""
+        output = message.get("format", "json")
+        if output == "json":
+            metrics = self.executor.metrics.to_json()
+        elif output == "prometheus":
+            metrics = self.executor.metrics.to_prometheus()
+        else:
+            self._send_error(
+                f"Unsupported metrics format: {output} (supported: json, prometheus)",
+                request_id
+            )
+            return
+
+        self._send_message({
+            "type": "metrics",
+            "requestId": request_id,
+            "format": output,
+            "metrics": metrics
+        })
+
+    def _send_message(self, data: Dict[str, Any], fragments: Optional[Dict[str, bytes]] = None):
+        """Send message to stdout in the negotiated framing (fragments: see protocol.py)"""
         try:
-            message = json.dumps(data)
-            print(message, flush=True)
+            if self.channel is not None:
+                self.channel.send(data, fragments)
+            else:
+                print(serializer.dumps(data).decode("utf-8"), flush=True)
         except Exception as e:
             # Last resort error logging to file
             logging.error(f"Failed to send message: {e}")
+            if data.get("type") == "result" and data.get("success") is not False:
+                # Result could not be encoded: fail the request instead of leaving it pending
+                self._send_error(f"Result is not serializable: {e}", data.get("requestId"))
 
     def _send_error(self, error: str, request_id: str = None):
         """Send error message"""
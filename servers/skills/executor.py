@@ -3,15 +3,88 @@ Skill Executor - Executes Claude Skills in Python environment
 Integrates with MCP Code Execution Framework
 """
 
+import os
 import sys
 import json
+import time
+import inspect
+import contextlib
 import traceback
+import functools
 import importlib.util
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional
 import asyncio
 from datetime import datetime
 
+from .metrics import SkillMetrics
+from .module_cache import DEFAULT_MAX_ENTRIES, ModuleCache
+from .profiler import ExecutionProfiler
+from .resources import ResourceMeter, ResourceTotals
+from .result_cache import (
+    DEFAULT_MAX_ENTRIES as DEFAULT_RESULT_CACHE_SIZE,
+    DEFAULT_TTL,
+    ResultCache,
+    make_key
+)
+from .worker_pool import (
+    SkillTimeoutError,
+    SkillWorkerPool,
+    _call_entry_function,
+    _get_entry_function
+)
+
+
+# Supported values for "executionMode" in skill.json / registry.json
+EXECUTION_MODES = ("inline", "thread", "process")
+
+# Metrics label for requests naming a skill that does not exist (keeps
+# arbitrary names out of the metric labels)
+UNRESOLVED_SKILL = "_unresolved"
+
+
+class _ChunkRelay:
+    """
+    Deliver chunks yielded in a pool thread to on_chunk on the event loop
+
+    The producing thread waits until each chunk has been handed over, so a
+    slow consumer slows the generator down instead of buffering chunks.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, on_chunk: Callable[[Any], None]):
+        self._loop = loop
+        self._on_chunk = on_chunk
+        self.closed = False
+
+    def __call__(self, chunk: Any):
+        if self.closed:
+            raise RuntimeError("Stream closed (execution timed out or was cancelled)")
+
+        delivered = concurrent.futures.Future()
+
+        def deliver():
+            try:
+                if self.closed:
+                    raise RuntimeError("Stream closed (execution timed out or was cancelled)")
+                self._on_chunk(chunk)
+            except BaseException as e:
+                delivered.set_exception(e)
+            else:
+                delivered.set_result(None)
+
+        self._loop.call_soon_threadsafe(deliver)
+        delivered.result()
+
+    def close(self):
+        self.closed = True
+
+
+def _is_async(execute_fn: Callable) -> bool:
+    """True for async functions and async generators (run inline by default)"""
+    return asyncio.iscoroutinefunction(execute_fn) or inspect.isasyncgenfunction(execute_fn)
+
 
 class SkillExecutor:
     """
@@ -23,36 +96,137 @@ class SkillExecutor:
     - Timeout handling
     - Error capture and formatting
     - MCP-compatible output
+    - Per-skill execution backend ("executionMode" in skill.json or
+      registry.json): inline on the event loop, shared thread pool, or
+      supervised worker processes. Without a setting, async skills run
+      inline and sync skills run in the thread pool.
+    - Hard timeouts in "process" mode: stuck workers are killed and
+      replaced ("kill_time" in the response; the background respawn is
+      timed in the pool stats). Inline and thread timeouts only stop waiting for the skill:
+      a timed-out thread keeps running (the response has
+      "timeout_enforced": false and get_stats() counts the thread in
+      pools.abandoned_threads until it finishes); give skills that may hang
+      "executionMode": "process".
+      Workers are forked from a zygote that preloaded the framework and
+      the hot skills (see zygote.py)
+    - LRU module cache (entry and approximate memory caps) invalidated when
+      a skill's file changes; evicted modules leave sys.modules too
+    - Result memoization for skills marked "cacheable" (key: name, version
+      and canonical params; "ttl" in seconds), in memory plus an optional
+      SQLite file
+    - Streaming: generator / async generator skills deliver each yielded
+      chunk to on_chunk as it is produced; without on_chunk the chunks are
+      collected into a list result
+    - Resource accounting: CPU, peak RSS, tracemalloc peak and GC
+      collections of every execution, summed per skill in get_stats()
+      and optionally returned in the response (see resources.py)
+    - Preloading: preload() imports skills concurrently ahead of their
+      first execution, reporting per-skill load times and failures
+    - Opt-in profiling (cProfile or stack sampling) returning the hottest
+      functions and collapsed stacks (see profiler.py)
+    - Per-skill latency histograms of the load and execute phases and
+      error counts by error_type (see metrics.py)
     """
 
-    def __init__(self, skills_path: str = None, max_retries: int = 3):
+    def __init__(
+        self,
+        skills_path: str = None,
+        max_retries: int = 3,
+        thread_workers: Optional[int] = None,
+        process_workers: Optional[int] = None,
+        default_mode: Optional[str] = None,
+        module_cache_size: Optional[int] = None,
+        module_cache_bytes: Optional[int] = None,
+        result_cache_size: Optional[int] = None,
+        result_cache_path: Optional[str] = None,
+        process_preload: Optional[List[str]] = None
+    ):
         """
         Initialize the Skill Executor
 
         Args:
             skills_path: Path to skills/packages directory
+                (default: MCP_SKILLS_PATH env, else skills/packages)
+            max_retries: Attempts when resolving a skill module
+            thread_workers: Thread pool size (default: min(32, CPUs + 4))
+            process_workers: Worker process count (default: CPU count)
+            default_mode: Mode for skills without "executionMode"
+                (default: MCP_SKILLS_EXECUTION_MODE env, else by function type)
+            module_cache_size: Max cached skill modules
+                (default: MCP_SKILLS_MODULE_CACHE_SIZE env or 128)
+            module_cache_bytes: Max approximate size of cached modules
+                (default: MCP_SKILLS_MODULE_CACHE_BYTES env, else no limit)
+            result_cache_size: Max results of cacheable skills kept in memory
+                (default: MCP_SKILLS_RESULT_CACHE_SIZE env or 256)
+            result_cache_path: SQLite file for cached results
+                (default: MCP_SKILLS_RESULT_CACHE_PATH env, else memory only)
+            process_preload: Hot skills imported by the worker zygote
+                (default: MCP_SKILLS_ZYGOTE_PRELOAD env, comma-separated)
         """
+        skills_path = skills_path or os.environ.get("MCP_SKILLS_PATH")
         if skills_path is None:
             # Default: skills/packages relative to project root
             self.skills_path = Path(__file__).parent.parent.parent / "skills" / "packages"
         else:
             self.skills_path = Path(skills_path)
 
-        self.loaded_modules = {}
-        self._cache_ttl = 3600  # 1 hour default
+        cache_bytes = module_cache_bytes or os.environ.get("MCP_SKILLS_MODULE_CACHE_BYTES")
+        self.module_cache = ModuleCache(
+            max_entries=module_cache_size or int(
+                os.environ.get("MCP_SKILLS_MODULE_CACHE_SIZE", DEFAULT_MAX_ENTRIES)
+            ),
+            max_bytes=int(cache_bytes) if cache_bytes else None
+        )
+        self.result_cache = ResultCache(
+            max_entries=result_cache_size or int(
+                os.environ.get("MCP_SKILLS_RESULT_CACHE_SIZE", DEFAULT_RESULT_CACHE_SIZE)
+            ),
+            path=result_cache_path or os.environ.get("MCP_SKILLS_RESULT_CACHE_PATH")
+        )
         self.execution_stats = {
             "total_executions": 0,
             "successful": 0,
             "failed": 0,
             "total_time": 0
         }
+        self.resource_totals = ResourceTotals()
+        self.metrics = SkillMetrics()
+        self._known_skills = set()
         self.max_retries = max_retries
 
+        cpu_count = os.cpu_count() or 1
+        self.thread_workers = thread_workers or min(32, cpu_count + 4)
+        self.process_workers = process_workers or cpu_count
+        if process_preload is None:
+            process_preload = os.environ.get("MCP_SKILLS_ZYGOTE_PRELOAD", "").split(",")
+        self.process_preload = [name.strip() for name in process_preload if name.strip()]
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[SkillWorkerPool] = None
+        # Timed-out "thread" executions still running in the pool
+        self._abandoned_threads = 0
+        self.default_mode = default_mode or os.environ.get("MCP_SKILLS_EXECUTION_MODE")
+        if self.default_mode is not None and self.default_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid default execution mode '{self.default_mode}' "
+                f"(expected one of: {', '.join(EXECUTION_MODES)})"
+            )
+
+        self.registry_path = self.skills_path.parent / "registry.json"
+        self._registry: Optional[Dict[str, Dict[str, Any]]] = None
+        self._skill_configs: Dict[str, Dict[str, Any]] = {}
+
+        # Imports started by preload() (skill name -> future) and its last report
+        self._preloading: Dict[str, asyncio.Future] = {}
+        self.last_preload: Optional[Dict[str, Any]] = None
+
     async def execute_skill(
         self,
         skill_name: str,
         params: Dict[str, Any],
-        timeout: int = 30
+        timeout: int = 30,
+        on_chunk: Optional[Callable[[Any], None]] = None,
+        resources: bool = False,
+        profile: Any = None
     ) -> Dict[str, Any]:
         """
         Execute a skill with given parameters
@@ -60,10 +234,21 @@ class SkillExecutor:
         Args:
             skill_name: Name of the skill to execute
             params: Parameters for the skill
-            timeout: Maximum execution time in seconds
+            timeout: Maximum execution time in seconds (covers the whole stream)
+            on_chunk: Called on the event loop with each chunk yielded by a
+                generator skill; the result is then the generator's return value
+            resources: Include the measured usage as "resources" (usage is
+                always added to the per-skill totals)
+            profile: True or profiler options ({"mode", "top", "collapsed",
+                "interval"}) to return a "profile" report; None/False runs
+                no profiler at all
 
         Returns:
-            Dict with execution result in MCP format
+            Dict with execution result in MCP format ("chunks" holds the
+            number of streamed chunks when on_chunk is given, "cached" is
+            set when a memoized result was returned; cached results and
+            timeouts in "thread"/"process" mode carry no "resources" or
+            "profile")
 
         Raises:
             TimeoutError: If execution exceeds timeout
@@ -71,62 +256,172 @@ class SkillExecutor:
             Exception: For skill execution errors
         """
         start_time = datetime.now()
+        meter = ResourceMeter()
+        profiler = None
 
-        # Cleanup expired cache entries
-        self._cleanup_expired_cache()
+        chunk_count = 0
+        if on_chunk is not None:
+            deliver = on_chunk
+
+            def on_chunk(chunk):
+                nonlocal chunk_count
+                chunk_count += 1
+                deliver(chunk)
 
         try:
+            profiler = ExecutionProfiler.from_request(profile)
+
             # Validate skill exists
             skill_path = self._resolve_skill_path(skill_name)
-
-            # Load skill module
-            skill_module = await self._load_skill(skill_name, skill_path)
-
-            # Execute with timeout
-            result = await asyncio.wait_for(
-                self._execute_skill_module(skill_module, params),
-                timeout=timeout
-            )
+            self._known_skills.add(skill_name)
+            mode = self._get_execution_mode(skill_name, skill_path)
+
+            # Memoized result (streaming calls always run the skill); a hit
+            # is counted and accounted (lookup + decode) like an execution
+            cache_key = None
+            cached = False
+            config = self._get_skill_config(skill_name, skill_path)
+            if config.get("cacheable") and on_chunk is None:
+                cache_key = make_key(skill_name, config.get("version"), params)
+                if cache_key is not None:
+                    with meter:
+                        cached, result = self.result_cache.get(cache_key)
+                    if not cached:
+                        meter.usage = None
+
+            if cached:
+                pass  # Memoized result: nothing to run
+            elif mode == "process":
+                # Module is imported inside the workers only; the pool
+                # enforces the timeout by killing the worker
+                with self._phase(skill_name, "execute"):
+                    result = await self._execute_in_process(
+                        skill_name, skill_path, params, timeout, on_chunk, meter, profiler
+                    )
+            else:
+                # Load skill module
+                with self._phase(skill_name, "load"):
+                    skill_module = await self._load_skill(skill_name, skill_path)
+                if mode is None:
+                    mode = "inline" if _is_async(_get_entry_function(skill_module)) else "thread"
+
+                # Execute with timeout
+                with self._phase(skill_name, "execute"):
+                    result = await asyncio.wait_for(
+                        self._execute_skill_module(
+                            skill_module, params, mode, on_chunk, meter, profiler
+                        ),
+                        timeout=timeout
+                    )
+
+            if cache_key is not None and not cached:
+                self.result_cache.put(
+                    cache_key, result, config.get("ttl", DEFAULT_TTL), executor=self._get_thread_pool()
+                )
 
             # Update stats
             execution_time = (datetime.now() - start_time).total_seconds()
             self.execution_stats["total_executions"] += 1
             self.execution_stats["successful"] += 1
             self.execution_stats["total_time"] += execution_time
+            self.metrics.success(self.metrics_label(skill_name))
 
-            return {
+            response = {
                 "success": True,
                 "result": result,
                 "execution_time": execution_time,
                 "skill": skill_name
             }
+            if cached:
+                response["cached"] = True
+            if on_chunk is not None:
+                response["chunks"] = chunk_count
+            return self._account(response, meter, resources, profiler)
 
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as e:
             execution_time = (datetime.now() - start_time).total_seconds()
             self.execution_stats["total_executions"] += 1
             self.execution_stats["failed"] += 1
+            self.metrics.error(self.metrics_label(skill_name), "TimeoutError")
 
-            return {
+            response = {
                 "success": False,
                 "error": f"Skill execution timed out after {timeout}s",
                 "error_type": "TimeoutError",
                 "execution_time": execution_time,
-                "skill": skill_name
+                "skill": skill_name,
+                # A pool thread cannot be stopped: the skill keeps running
+                "timeout_enforced": mode != "thread"
             }
+            if isinstance(e, SkillTimeoutError):
+                # Worker was killed; its replacement starts in the background
+                response["kill_time"] = e.kill_time
+            elif mode == "thread":
+                response["error"] += (
+                    " (the skill is still running in its thread; use "
+                    "executionMode \"process\" to enforce the timeout)"
+                )
+            return self._account(response, meter, resources, profiler)
 
         except Exception as e:
             execution_time = (datetime.now() - start_time).total_seconds()
             self.execution_stats["total_executions"] += 1
             self.execution_stats["failed"] += 1
+            error_type = getattr(e, "error_type", type(e).__name__)
+            self.metrics.error(self.metrics_label(skill_name), error_type)
 
-            return {
+            return self._account({
                 "success": False,
                 "error": str(e),
-                "error_type": type(e).__name__,
-                "traceback": traceback.format_exc(),
+                "error_type": error_type,
+                "traceback": getattr(e, "remote_traceback", None) or traceback.format_exc(),
                 "execution_time": execution_time,
                 "skill": skill_name
-            }
+            }, meter, resources, profiler)
+
+    def _account(
+        self,
+        response: Dict[str, Any],
+        meter: ResourceMeter,
+        resources: bool,
+        profiler: Optional[ExecutionProfiler] = None
+    ) -> Dict[str, Any]:
+        """
+        Add the measured usage to the skill totals (and to the response if
+        requested), plus the profiler report when profiling was on
+        """
+        usage = meter.usage
+        if usage is not None:
+            self.resource_totals.add(self.metrics_label(response["skill"]), usage)
+            if resources:
+                response["resources"] = dict(usage)
+        if profiler is not None and profiler.report is not None:
+            response["profile"] = profiler.report
+        return response
+
+    def metrics_label(self, skill_name: str) -> str:
+        """
+        Skill name for metrics and resource totals (UNRESOLVED_SKILL for
+        skills never found, so request names cannot grow the stats)
+        """
+        return skill_name if skill_name in self._known_skills else UNRESOLVED_SKILL
+
+    def observe(self, skill_name: str, phase: str, value_ns: int):
+        """Record a phase duration measured outside the executor (queue, serialize, total)"""
+        self.metrics.observe(self.metrics_label(skill_name), phase, value_ns)
+
+    @contextlib.contextmanager
+    def _phase(self, skill_name: str, phase: str):
+        """Time the enclosed block as a phase of skill_name (also on failure)"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.metrics.observe(self.metrics_label(skill_name), phase, time.perf_counter_ns() - start)
+
+    def record_serialized(self, skill_name: str, size: int):
+        """Count the encoded size of a result sent for a skill (called by the bridge)"""
+        self.resource_totals.add_serialized(self.metrics_label(skill_name), size)
 
     def _resolve_skill_path(self, skill_name: str) -> Path:
         """
@@ -159,6 +454,127 @@ class SkillExecutor:
 
         return skill_path
 
+    def _get_entry_point(self, skill_path: Path) -> Path:
+        """Return index.py, falling back to __init__.py"""
+        index_py = skill_path / "index.py"
+        return index_py if index_py.exists() else skill_path / "__init__.py"
+
+    def _load_registry(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load registry.json entries indexed by skill name
+
+        Returns:
+            Empty dict if the registry is missing or invalid
+        """
+        if self._registry is None:
+            try:
+                with open(self.registry_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self._registry = {
+                    entry["name"]: entry
+                    for entry in data.get("skills", [])
+                    if "name" in entry
+                }
+            except (OSError, ValueError):
+                self._registry = {}
+        return self._registry
+
+    def _get_skill_config(self, skill_name: str, skill_path: Path) -> Dict[str, Any]:
+        """
+        Get skill settings: registry.json entry overridden by skill.json
+
+        Args:
+            skill_name: Name of the skill
+            skill_path: Path to skill package
+
+        Returns:
+            Merged settings dict
+        """
+        if skill_name not in self._skill_configs:
+            config = dict(self._load_registry().get(skill_name, {}))
+            skill_json = skill_path / "skill.json"
+            if skill_json.exists():
+                try:
+                    with open(skill_json, encoding="utf-8") as f:
+                        config.update(json.load(f))
+                except (OSError, ValueError):
+                    pass
+            self._skill_configs[skill_name] = config
+        return self._skill_configs[skill_name]
+
+    def _get_execution_mode(self, skill_name: str, skill_path: Path) -> Optional[str]:
+        """
+        Get the configured execution mode of a skill
+
+        Returns:
+            "inline", "thread", "process" or None (decide by function type)
+
+        Raises:
+            ValueError: If the configured mode is unknown
+        """
+        mode = self._get_skill_config(skill_name, skill_path).get(
+            "executionMode", self.default_mode
+        )
+        if mode is not None and mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid executionMode '{mode}' for skill '{skill_name}' "
+                f"(expected one of: {', '.join(EXECUTION_MODES)})"
+            )
+        return mode
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Shared thread pool (created on first use)"""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix="skill"
+            )
+        return self._thread_pool
+
+    def _get_process_pool(self) -> SkillWorkerPool:
+        """Supervised worker processes (started on demand, reused while healthy)"""
+        if self._process_pool is None:
+            # Missing skills fail in the zygote and show up in its report
+            preload = {
+                name: str(self._get_entry_point(self.skills_path / name))
+                for name in self.process_preload
+            }
+            self._process_pool = SkillWorkerPool(self.process_workers, preload=preload)
+        return self._process_pool
+
+    async def _execute_in_process(
+        self,
+        skill_name: str,
+        skill_path: Path,
+        params: Dict[str, Any],
+        timeout: float,
+        on_chunk: Optional[Callable[[Any], None]] = None,
+        meter: Optional[ResourceMeter] = None,
+        profiler: Optional[ExecutionProfiler] = None
+    ) -> Any:
+        """
+        Execute a skill in a supervised worker process
+
+        Args:
+            skill_name: Name of the skill
+            skill_path: Path to skill package
+            params: Execution parameters (must be picklable)
+            timeout: Hard deadline in seconds
+            on_chunk: Receives chunks yielded by generator skills (chunks must be picklable)
+            meter: Receives the usage measured inside the worker
+            profiler: Receives the report of the profile taken inside the worker
+
+        Returns:
+            Skill execution result (must be picklable)
+
+        Raises:
+            SkillTimeoutError: If the worker was killed at the deadline
+        """
+        entry_point = str(self._get_entry_point(skill_path))
+        return await self._get_process_pool().run(
+            skill_name, entry_point, params, timeout, on_chunk, meter, profiler
+        )
+
     async def _load_skill(self, skill_name: str, skill_path: Path) -> Any:
         """
         Load skill module dynamically
@@ -170,21 +586,18 @@ class SkillExecutor:
         Returns:
             Loaded module
         """
-        # Check cache
-        if skill_name in self.loaded_modules:
-            module_data = self.loaded_modules[skill_name]
-            # Check if cache is still valid
-            if datetime.now().timestamp() - module_data["timestamp"] < self._cache_ttl:
-                return module_data["module"]
-            else:
-                # Cache expired, remove it
-                del self.loaded_modules[skill_name]
-
         # Determine entry point
-        index_py = skill_path / "index.py"
-        init_py = skill_path / "__init__.py"
+        entry_point = str(self._get_entry_point(skill_path))
+
+        # A preload of this skill is running: wait for it instead of importing twice
+        pending = self._preloading.get(skill_name)
+        if pending is not None:
+            await asyncio.wait([pending])
 
-        entry_point = index_py if index_py.exists() else init_py
+        # Check cache (invalidated if the file changed)
+        module = self.module_cache.get(skill_name, entry_point)
+        if module is not None:
+            return module
 
         # Load module with retry
         last_exception = None
@@ -212,22 +625,113 @@ class SkillExecutor:
                         f"Failed to load skill '{skill_name}' after {self.max_retries} attempts: {last_exception}"
                     ) from last_exception
 
+        module = self._exec_skill_module(skill_name, spec)
+        self.module_cache.put(skill_name, entry_point, module)
+
+        return module
+
+    @staticmethod
+    def _exec_skill_module(skill_name: str, spec) -> Any:
+        """Create and run a skill module from its spec (blocking; no caching)"""
         module = importlib.util.module_from_spec(spec)
         sys.modules[f"skills.{skill_name}"] = module
-        spec.loader.exec_module(module)
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(f"skills.{skill_name}", None)
+            raise
+        return module
 
-        # Cache module with timestamp
-        self.loaded_modules[skill_name] = {
-            "module": module,
-            "timestamp": datetime.now().timestamp()
+    def _import_skill(self, skill_name: str, entry_point: str) -> Any:
+        """Import a skill's entry point (blocking; run in the thread pool)"""
+        spec = importlib.util.spec_from_file_location(f"skills.{skill_name}", entry_point)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load skill '{skill_name}'")
+        return self._exec_skill_module(skill_name, spec)
+
+    def high_priority_skills(self) -> List[str]:
+        """Skills marked "priority": "high" in registry.json"""
+        return [
+            name for name, entry in self._load_registry().items()
+            if entry.get("priority") == "high"
+        ]
+
+    async def preload(self, skills: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Import skills ahead of their first execution, concurrently
+
+        Modules are imported in the thread pool, so the event loop keeps
+        serving requests; an execution that needs a skill being preloaded
+        waits for it instead of importing it again. Skills in "process"
+        mode are skipped: they load inside the workers (see zygote.py).
+
+        Args:
+            skills: Skill names (default: high-priority skills of registry.json)
+
+        Returns:
+            {"skills": {name: {"status": "loaded" | "cached" | "skipped" |
+            "failed", "load_time", "error_type"?, "error"?}}, "loaded",
+            "failed", "total_time"}; also kept in last_preload
+        """
+        if skills is None:
+            skills = self.high_priority_skills()
+
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(self._preload_skill(name) for name in skills))
+        results = dict(zip(skills, outcomes))
+
+        self.last_preload = {
+            "skills": results,
+            "loaded": sum(1 for r in outcomes if r["status"] in ("loaded", "cached")),
+            "failed": sum(1 for r in outcomes if r["status"] == "failed"),
+            "total_time": time.perf_counter() - start
         }
+        return self.last_preload
+
+    async def _preload_module(self, skill_name: str, entry_point: str):
+        """Import a skill in the thread pool, then cache it (on the event loop)"""
+        module = await asyncio.get_running_loop().run_in_executor(
+            self._get_thread_pool(), self._import_skill, skill_name, entry_point
+        )
+        self.module_cache.put(skill_name, entry_point, module)
+
+    async def _preload_skill(self, skill_name: str) -> Dict[str, Any]:
+        """Preload one skill (never raises; failures are reported)"""
+        start = time.perf_counter()
+        try:
+            skill_path = self._resolve_skill_path(skill_name)
+            if self._get_execution_mode(skill_name, skill_path) == "process":
+                return {"status": "skipped", "load_time": 0.0, "reason": "process mode"}
 
-        return module
+            entry_point = str(self._get_entry_point(skill_path))
+            if self.module_cache.get(skill_name, entry_point) is not None:
+                return {"status": "cached", "load_time": 0.0}
+
+            pending = self._preloading.get(skill_name)
+            if pending is None:
+                pending = asyncio.ensure_future(self._preload_module(skill_name, entry_point))
+                self._preloading[skill_name] = pending
+                pending.add_done_callback(lambda _: self._preloading.pop(skill_name, None))
+            await pending
+
+            return {"status": "loaded", "load_time": time.perf_counter() - start}
+
+        except Exception as e:
+            return {
+                "status": "failed",
+                "load_time": time.perf_counter() - start,
+                "error_type": type(e).__name__,
+                "error": str(e)
+            }
 
     async def _execute_skill_module(
         self,
         module: Any,
-        params: Dict[str, Any]
+        params: Dict[str, Any],
+        mode: Optional[str] = None,
+        on_chunk: Optional[Callable[[Any], None]] = None,
+        meter: Optional[ResourceMeter] = None,
+        profiler: Optional[ExecutionProfiler] = None
     ) -> Any:
         """
         Execute the skill module's main function
@@ -235,25 +739,89 @@ class SkillExecutor:
         Args:
             module: Loaded skill module
             params: Execution parameters
+            mode: "inline", "thread" or None (async inline, sync in thread)
+            on_chunk: Receives chunks yielded by generator skills
+            meter: Measures the call (thread CPU time in "thread" mode)
+            profiler: Profiles the call in the thread that runs it (None: off)
 
         Returns:
             Skill execution result
         """
         # Look for execute() or main() function
-        if hasattr(module, "execute"):
-            execute_fn = module.execute
-        elif hasattr(module, "main"):
-            execute_fn = module.main
-        else:
-            raise AttributeError(
-                "Skill module must have 'execute' or 'main' function"
-            )
-
-        # Execute (handle both sync and async)
-        if asyncio.iscoroutinefunction(execute_fn):
-            result = await execute_fn(**params)
-        else:
+        execute_fn = _get_entry_function(module)
+
+        if mode is None:
+            mode = "inline" if _is_async(execute_fn) else "thread"
+        if meter is None:
+            meter = ResourceMeter()
+
+        if mode == "thread":
+            # Keep the event loop free while the skill runs
+            loop = asyncio.get_running_loop()
+            relay = _ChunkRelay(loop, on_chunk) if on_chunk is not None else None
+            call = _call_entry_function
+            if profiler is not None:
+                call = functools.partial(profiler.call, _call_entry_function)
+            future = self._get_thread_pool().submit(meter.call, call, execute_fn, params, relay)
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                if not future.cancel():
+                    # Timed out (or cancelled) while running: count the
+                    # thread until the skill returns
+                    self._abandoned_threads += 1
+                    future.add_done_callback(
+                        lambda _: loop.call_soon_threadsafe(self._thread_finished)
+                    )
+                raise
+            finally:
+                if relay is not None:
+                    relay.close()
+
+        # Inline: handle sync, async and generator functions
+        # (process CPU time: overlaps with other inline executions)
+        with meter, (profiler if profiler is not None else contextlib.nullcontext()):
             result = execute_fn(**params)
+            if inspect.isawaitable(result):
+                result = await result
+
+            return await self._drain_inline(result, on_chunk)
+
+    async def _drain_inline(
+        self,
+        result: Any,
+        on_chunk: Optional[Callable[[Any], None]]
+    ) -> Any:
+        """
+        Consume a generator result on the event loop
+
+        Returns:
+            The list of chunks (no on_chunk), the generator's return value
+            (on_chunk), or result unchanged if it is not a generator
+        """
+        if inspect.isasyncgen(result):
+            chunks = []
+            async for chunk in result:
+                if on_chunk is None:
+                    chunks.append(chunk)
+                else:
+                    on_chunk(chunk)
+                    # Let the output be flushed between chunks
+                    await asyncio.sleep(0)
+            return chunks if on_chunk is None else None
+
+        if inspect.isgenerator(result):
+            chunks = []
+            while True:
+                try:
+                    chunk = next(result)
+                except StopIteration as stop:
+                    return chunks if on_chunk is None else stop.value
+                if on_chunk is None:
+                    chunks.append(chunk)
+                else:
+                    on_chunk(chunk)
+                    await asyncio.sleep(0)
 
         return result
 
@@ -272,25 +840,44 @@ class SkillExecutor:
                 self.execution_stats["total_executions"]
                 if self.execution_stats["total_executions"] > 0
                 else 0
-            )
+            ),
+            "resources": self.resource_totals.get_stats(),
+            "module_cache": self.module_cache.get_stats(),
+            "result_cache": self.result_cache.get_stats(),
+            "pools": {
+                "thread_workers": self.thread_workers,
+                "process_workers": self.process_workers,
+                "thread_pool_started": self._thread_pool is not None,
+                "abandoned_threads": self._abandoned_threads,
+                "process_pool": (
+                    self._process_pool.get_stats()
+                    if self._process_pool is not None
+                    else None
+                )
+            },
+            "preload": self.last_preload
         }
 
-    def clear_cache(self):
-        """Clear loaded modules cache"""
-        self.loaded_modules.clear()
-
-    def _cleanup_expired_cache(self):
-        """
-        Remove expired entries from cache
-        """
-        current_time = datetime.now().timestamp()
-        expired_keys = [
-            key for key, data in self.loaded_modules.items()
-            if current_time - data["timestamp"] > self._cache_ttl
-        ]
+    def _thread_finished(self):
+        """An abandoned (timed-out) thread execution returned"""
+        self._abandoned_threads -= 1
 
-        for key in expired_keys:
-            del self.loaded_modules[key]
+    def clear_cache(self):
+        """Clear loaded modules and memoized results"""
+        self.module_cache.clear()
+        self.result_cache.clear()
+        self._skill_configs.clear()
+        self._registry = None
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the thread pool, worker processes and result cache"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        self.result_cache.close()
 
 
 # CLI interface for testing
@@ -310,5 +897,6 @@ if __name__ == "__main__":
     result = asyncio.run(
         executor.execute_skill(args.skill, params, args.timeout)
     )
+    executor.shutdown()
 
     print(json.dumps(result, indent=2))
\ No newline at end of file
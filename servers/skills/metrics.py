@@ -0,0 +1,213 @@
+"""
+Skill Metrics - Per-skill latency histograms and error counts
+Used by servers/skills/executor.py and bridge.py ("metrics" action)
+
+Latencies are recorded with time.perf_counter_ns() per skill and phase:
+- "queue": waiting for a concurrency slot in the bridge
+- "load": importing the skill module (cache hits included; skills in
+  "process" mode load inside the worker, so it counts as "execute")
+- "execute": running the skill (whole stream for generator skills)
+- "serialize": encoding the result for the pipe
+- "total": from the request arriving at the bridge to the result sent
+
+Histograms are log-bucketed: 4 buckets per power of two from 1 µs to
+~134 s (values above go to an overflow bucket), so percentiles are within
+~19% of the true value whatever the scale, at a fixed memory cost. They
+are exported as JSON (percentiles) or in the Prometheus text format
+(cumulative buckets at powers of two, plus _sum and _count).
+"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+PHASES = ("queue", "load", "execute", "serialize", "total")
+
+# Histogram layout: bucket i holds values up to _MIN_NS * 2 ** (i / _PER_OCTAVE)
+_MIN_NS = 1000
+_PER_OCTAVE = 4
+_OCTAVES = 27
+_BUCKETS = _OCTAVES * _PER_OCTAVE + 1
+
+# Upper bound of every bucket, in nanoseconds (last: overflow)
+_BOUNDS_NS = [_MIN_NS * 2 ** (i / _PER_OCTAVE) for i in range(_BUCKETS)] + [math.inf]
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+_NAMESPACE = "mcp_skill"
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (nanosecond input)"""
+
+    __slots__ = ("counts", "count", "sum_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * len(_BOUNDS_NS)
+        self.count = 0
+        self.sum_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    def record(self, value_ns: int):
+        """Add one observation"""
+        if value_ns <= _MIN_NS:
+            index = 0
+        else:
+            index = min(
+                math.ceil(math.log2(value_ns / _MIN_NS) * _PER_OCTAVE),
+                len(_BOUNDS_NS) - 1
+            )
+            if _BOUNDS_NS[index] < value_ns:
+                # Float rounding right at a bucket bound
+                index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, p: float) -> int:
+        """
+        Value at or below which p% of the observations fall (nanoseconds)
+
+        Returns the upper bound of the bucket holding that rank, capped by
+        the largest value seen (0 without observations).
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return int(min(_BOUNDS_NS[index], self.max_ns))
+        return self.max_ns
+
+    def cumulative(self, bounds_ns: List[float]) -> List[int]:
+        """Observations <= each bound (bounds must be bucket bounds, ascending)"""
+        result = []
+        seen = 0
+        index = 0
+        for bound in bounds_ns:
+            while index < len(self.counts) and _BOUNDS_NS[index] <= bound:
+                seen += self.counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """count, sum, min, max, mean and percentiles (seconds)"""
+        summary = {
+            "count": self.count,
+            "sum": self.sum_ns / 1e9,
+            "min": (self.min_ns or 0) / 1e9,
+            "max": self.max_ns / 1e9,
+            "mean": self.sum_ns / self.count / 1e9 if self.count else 0
+        }
+        for p in PERCENTILES:
+            summary[f"p{p:g}"] = self.percentile(p) / 1e9
+        return summary
+
+
+# Prometheus "le" bounds: one per power of two (a subset of the bucket bounds)
+_EXPORT_BOUNDS_NS = _BOUNDS_NS[:-1:_PER_OCTAVE]
+
+
+class SkillMetrics:
+    """Latency histograms per skill and phase, plus outcome counters"""
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+        self._errors: Dict[str, Dict[str, int]] = {}
+
+    def observe(self, skill: str, phase: str, value_ns: int):
+        """
+        Record a phase duration
+
+        Raises:
+            ValueError: If the phase is unknown
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Unknown phase '{phase}' (expected one of: {', '.join(PHASES)})")
+        phases = self._histograms.get(skill)
+        if phases is None:
+            phases = self._histograms[skill] = {}
+        histogram = phases.get(phase)
+        if histogram is None:
+            histogram = phases[phase] = LatencyHistogram()
+        histogram.record(value_ns)
+
+    def success(self, skill: str):
+        """Count a successful execution"""
+        outcomes = self._outcomes.setdefault(skill, {"success": 0, "error": 0})
+        outcomes["success"] += 1
+
+    def error(self, skill: str, error_type: str):
+        """Count a failed execution by error type"""
+        outcomes = self._outcomes.setdefault(skill, {"success": 0, "error": 0})
+        outcomes["error"] += 1
+        errors = self._errors.setdefault(skill, {})
+        errors[error_type] = errors.get(error_type, 0) + 1
+
+    def clear(self):
+        self._histograms.clear()
+        self._outcomes.clear()
+        self._errors.clear()
+
+    def to_json(self) -> Dict[str, Any]:
+        """Per-skill phase summaries (seconds), outcomes and errors by type"""
+        skills = sorted(set(self._histograms) | set(self._outcomes))
+        return {
+            skill: {
+                "phases": {
+                    phase: histogram.summary()
+                    for phase, histogram in self._histograms.get(skill, {}).items()
+                },
+                **self._outcomes.get(skill, {"success": 0, "error": 0}),
+                "errors": dict(self._errors.get(skill, {}))
+            }
+            for skill in skills
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        histogram_name = f"{_NAMESPACE}_phase_duration_seconds"
+        lines = [
+            f"# HELP {histogram_name} Skill execution latency by phase.",
+            f"# TYPE {histogram_name} histogram"
+        ]
+        for skill in sorted(self._histograms):
+            for phase, histogram in self._histograms[skill].items():
+                labels = f'skill="{_escape(skill)}",phase="{phase}"'
+                counts = histogram.cumulative(_EXPORT_BOUNDS_NS)
+                for bound, count in zip(_EXPORT_BOUNDS_NS, counts):
+                    lines.append(f'{histogram_name}_bucket{{{labels},le="{bound / 1e9:.9g}"}} {count}')
+                lines.append(f'{histogram_name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{histogram_name}_sum{{{labels}}} {histogram.sum_ns / 1e9:.9g}")
+                lines.append(f"{histogram_name}_count{{{labels}}} {histogram.count}")
+
+        executions_name = f"{_NAMESPACE}_executions_total"
+        lines.append(f"# HELP {executions_name} Skill executions by outcome.")
+        lines.append(f"# TYPE {executions_name} counter")
+        for skill in sorted(self._outcomes):
+            for status, count in self._outcomes[skill].items():
+                lines.append(f'{executions_name}{{skill="{_escape(skill)}",status="{status}"}} {count}')
+
+        errors_name = f"{_NAMESPACE}_errors_total"
+        lines.append(f"# HELP {errors_name} Failed skill executions by error type.")
+        lines.append(f"# TYPE {errors_name} counter")
+        for skill in sorted(self._errors):
+            for error_type, count in sorted(self._errors[skill].items()):
+                lines.append(
+                    f'{errors_name}{{skill="{_escape(skill)}",error_type="{_escape(error_type)}"}} {count}'
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,177 @@
+"""
+Module Cache - LRU cache of loaded skill modules
+Used by SkillExecutor and by the skill worker processes
+"""
+
+import os
+import sys
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+# Default max number of cached skill modules
+DEFAULT_MAX_ENTRIES = 128
+
+
+def _file_hash(path: str) -> str:
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _estimate_size(module: Any) -> int:
+    """Approximate footprint of a module (shallow size of its namespace)"""
+    namespace = vars(module)
+    return sys.getsizeof(namespace) + sum(
+        sys.getsizeof(value) for value in namespace.values()
+    )
+
+
+class ModuleCache:
+    """
+    LRU cache of skill modules with file-change invalidation
+
+    Features:
+    - O(1) lookup, refresh and eviction (OrderedDict)
+    - Entry cap and optional memory cap (approximate module size)
+    - Invalidation when the entry point's mtime/size changes and its
+      content hash differs (a touch without edits keeps the module)
+    - Evicted or stale modules are removed from sys.modules
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_entries: Max number of cached modules
+            max_bytes: Max approximate total module size (None: no limit)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._total_bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def get(self, name: str, entry_point: str) -> Optional[Any]:
+        """
+        Get a cached module if its file is unchanged
+
+        Args:
+            name: Skill name
+            entry_point: Path to the skill's index.py / __init__.py
+
+        Returns:
+            The module, or None (not cached, moved or changed on disk)
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        if entry["entry_point"] != entry_point or not self._is_fresh(entry):
+            self.stats["invalidations"] += 1
+            self.stats["misses"] += 1
+            self.invalidate(name)
+            return None
+
+        self._entries.move_to_end(name)
+        self.stats["hits"] += 1
+        return entry["module"]
+
+    def put(self, name: str, entry_point: str, module: Any):
+        """Cache a freshly loaded module, evicting least recently used ones"""
+        if name in self._entries:
+            self._remove(name, purge=False)
+
+        stat = self._stat(entry_point)
+        size = _estimate_size(module)
+        self._entries[name] = {
+            "module": module,
+            "entry_point": entry_point,
+            "mtime_ns": stat[0] if stat else None,
+            "file_size": stat[1] if stat else None,
+            "hash": _file_hash(entry_point) if stat else None,
+            "size": size
+        }
+        self._total_bytes += size
+
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest, purge=True)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, name: str):
+        """Drop a module from the cache and from sys.modules"""
+        if name in self._entries:
+            self._remove(name, purge=True)
+
+    def clear(self):
+        """Drop every module"""
+        for name in list(self._entries):
+            self._remove(name, purge=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "approx_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes
+        }
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Compare the file with the loaded version (hash only if mtime/size moved)"""
+        stat = self._stat(entry["entry_point"])
+        if stat is None:
+            return False
+        if stat == (entry["mtime_ns"], entry["file_size"]):
+            return True
+
+        try:
+            unchanged = _file_hash(entry["entry_point"]) == entry["hash"]
+        except OSError:
+            return False
+        if unchanged:
+            entry["mtime_ns"], entry["file_size"] = stat
+        return unchanged
+
+    def _stat(self, path: str):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _remove(self, name: str, purge: bool):
+        entry = self._entries.pop(name)
+        self._total_bytes -= entry["size"]
+        if purge:
+            _purge_sys_modules(f"skills.{name}", entry["module"])
+
+
+def _purge_sys_modules(module_name: str, module: Any):
+    """Remove a skill module (and its submodules) from sys.modules"""
+    if sys.modules.get(module_name) is module:
+        del sys.modules[module_name]
+
+    prefix = module_name + "."
+    for key in [key for key in sys.modules if key.startswith(prefix)]:
+        del sys.modules[key]
@@ -0,0 +1,309 @@
+"""
+Execution Profiler - Opt-in profiling of one execution
+Used by servers/skills/executor.py, worker_pool.py and core/python_server.py
+
+Requests enable it with "profile": true or an options object:
+
+    {"mode": "cprofile" | "sample", "top": 20, "collapsed": false, "interval": 0.005}
+
+- "cprofile" (default): deterministic cProfile of the executing thread;
+  exact call counts, but every Python call pays the profiler hook
+- "sample": a background thread samples the executing thread's stack
+  every `interval` seconds; low overhead, times are estimates (share of
+  samples x duration). A busy thread holding the GIL stretches the
+  effective interval up to interval + sys.getswitchinterval()
+
+The report holds the top-N functions by cumulative and by self time:
+
+    {
+        "mode": "cprofile",
+        "duration": 0.42,
+        "top_cumulative": [{"function", "calls", "self_time", "cumulative_time"}, ...],
+        "top_self": [...],
+        "collapsed": "main (a.py:1);work (a.py:9) 12\\n..."   # when requested
+    }
+
+"collapsed" is the collapsed-stack format read by flamegraph.pl and
+speedscope. It always comes from the sampler (cProfile does not keep
+whole stacks), which then also runs in "cprofile" mode.
+
+Profiling covers the thread that runs the execution: for skills in
+"thread" or "process" mode that is the skill alone; on the event loop
+(inline skills, python_server) other tasks interleaved with it show up
+too. Only one cProfile can be active per thread (per process from
+Python 3.12, where cProfile is built on sys.monitoring), so a concurrent
+request that cannot get one is sampled instead (its report says so in
+"mode").
+
+Without the flag nothing here runs: callers only create a profiler when
+the request asks for one.
+"""
+
+import sys
+import time
+import cProfile
+import pstats
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROFILE_MODES = ("cprofile", "sample")
+
+DEFAULT_TOP = 20
+
+# Seconds between stack samples in "sample" mode
+DEFAULT_INTERVAL = 0.005
+
+# Threads with an active cProfile (one per thread; one per process from 3.12)
+_CPROFILE_PER_THREAD = sys.version_info < (3, 12)
+_cprofile_slots = set()
+_cprofile_lock = threading.Lock()
+
+FrameKey = Tuple[str, int, str]
+
+_THIS_FILE = __file__
+
+
+def _label(key: FrameKey) -> str:
+    """Readable function name: "name (file:line)" ("name" for built-ins)"""
+    filename, lineno, name = key
+    if filename == "~":
+        return name
+    return f"{name} ({filename}:{lineno})"
+
+
+class _StackSampler:
+    """Samples one thread's Python stack from a background thread"""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None or frame.f_code.co_filename == _THIS_FILE:
+                # Thread gone, or already stopping the profiler
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+            self.samples += 1
+
+    def top(self, count: int, duration: float) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Top functions by cumulative and by self samples (times: share of duration)"""
+        seconds_per_sample = duration / self.samples if self.samples else 0.0
+        self_samples: Counter = Counter()
+        cumulative_samples: Counter = Counter()
+        for stack, hits in self.stacks.items():
+            self_samples[stack[-1]] += hits
+            for key in set(stack):
+                cumulative_samples[key] += hits
+
+        def entry(key: FrameKey) -> Dict[str, Any]:
+            return {
+                "function": _label(key),
+                "self_samples": self_samples[key],
+                "cumulative_samples": cumulative_samples[key],
+                "self_time": round(self_samples[key] * seconds_per_sample, 6),
+                "cumulative_time": round(cumulative_samples[key] * seconds_per_sample, 6)
+            }
+
+        return (
+            [entry(key) for key, _ in cumulative_samples.most_common(count)],
+            [entry(key) for key, _ in self_samples.most_common(count)]
+        )
+
+    def collapsed(self) -> str:
+        """Collapsed stacks ("frame;frame;frame count" per line)"""
+        return "\n".join(
+            ";".join(_label(key).replace(";", ",") for key in stack) + f" {hits}"
+            for stack, hits in self.stacks.most_common()
+        )
+
+
+class ExecutionProfiler:
+    """
+    Profiles one execution (start()/stop(), a with block or call())
+
+    The report is kept in `report` (None until stopped) so it can be
+    returned after a failure too.
+    """
+
+    def __init__(
+        self,
+        mode: str = "cprofile",
+        top: int = DEFAULT_TOP,
+        collapsed: bool = False,
+        interval: float = DEFAULT_INTERVAL
+    ):
+        """
+        Args:
+            mode: "cprofile" or "sample"
+            top: Functions listed per ranking
+            collapsed: Also return collapsed stacks (runs the sampler)
+            interval: Seconds between samples
+
+        Raises:
+            ValueError: If mode, top or interval is invalid
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(
+                f"Invalid profile mode '{mode}' (expected one of: {', '.join(PROFILE_MODES)})"
+            )
+        if int(top) < 1 or float(interval) <= 0:
+            raise ValueError("Profile 'top' must be >= 1 and 'interval' > 0")
+
+        self.mode = mode
+        self.top = int(top)
+        self.collapsed = bool(collapsed)
+        self.interval = float(interval)
+        self.report: Optional[Dict[str, Any]] = None
+
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_StackSampler] = None
+        self._thread_id: Optional[int] = None
+        self._slot: Optional[int] = None
+        self._active_mode = mode
+        self._started = 0.0
+
+    @classmethod
+    def from_request(cls, value: Any) -> Optional["ExecutionProfiler"]:
+        """
+        Build from a request's "profile" field
+
+        Returns:
+            None when profiling is off (missing, false or null)
+
+        Raises:
+            ValueError: If the options are invalid
+        """
+        if not value:
+            return None
+        if value is True:
+            return cls()
+        if not isinstance(value, dict):
+            raise ValueError("'profile' must be true or an options object")
+        return cls(
+            mode=value.get("mode", "cprofile"),
+            top=value.get("top", DEFAULT_TOP),
+            collapsed=value.get("collapsed", False),
+            interval=value.get("interval", DEFAULT_INTERVAL)
+        )
+
+    def options(self) -> Dict[str, Any]:
+        """Constructor arguments (to rebuild the profiler in a worker process)"""
+        return {
+            "mode": self.mode,
+            "top": self.top,
+            "collapsed": self.collapsed,
+            "interval": self.interval
+        }
+
+    def start(self):
+        """Start profiling the calling thread"""
+        self.report = None
+        self._thread_id = threading.get_ident()
+
+        mode = self.mode
+        if mode == "cprofile":
+            self._profile = self._acquire_cprofile()
+            if self._profile is None:
+                mode = "sample"
+        self._active_mode = mode
+
+        if mode == "sample" or self.collapsed:
+            self._sampler = _StackSampler(self._thread_id, self.interval)
+            self._sampler.start()
+
+        self._started = time.perf_counter()
+        if self._profile is not None:
+            self._profile.enable()
+
+    def _acquire_cprofile(self) -> Optional[cProfile.Profile]:
+        """Reserve the cProfile slot of this thread (None if taken)"""
+        slot = self._thread_id if _CPROFILE_PER_THREAD else None
+        with _cprofile_lock:
+            if slot in _cprofile_slots:
+                return None
+            _cprofile_slots.add(slot)
+        self._slot = slot
+        return cProfile.Profile()
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop profiling and build the report"""
+        if self._profile is not None:
+            self._profile.disable()
+        duration = time.perf_counter() - self._started
+        if self._sampler is not None:
+            self._sampler.stop()
+
+        report: Dict[str, Any] = {
+            "mode": self._active_mode,
+            "duration": round(duration, 6)
+        }
+
+        if self._profile is not None:
+            with _cprofile_lock:
+                _cprofile_slots.discard(self._slot)
+            report["top_cumulative"], report["top_self"] = self._cprofile_top()
+        else:
+            report["top_cumulative"], report["top_self"] = self._sampler.top(self.top, duration)
+            report["interval"] = self.interval
+
+        if self._sampler is not None:
+            report["samples"] = self._sampler.samples
+            if self.collapsed:
+                report["collapsed"] = self._sampler.collapsed()
+
+        self._profile = None
+        self._sampler = None
+        self.report = report
+        return report
+
+    def _cprofile_top(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        stats = pstats.Stats(self._profile).stats
+        entries = [
+            {
+                "function": _label(key),
+                "calls": calls,
+                "primitive_calls": primitive_calls,
+                "self_time": round(self_time, 6),
+                "cumulative_time": round(cumulative_time, 6)
+            }
+            for key, (primitive_calls, calls, self_time, cumulative_time, _) in stats.items()
+        ]
+        by_cumulative = sorted(entries, key=lambda e: e["cumulative_time"], reverse=True)
+        by_self = sorted(entries, key=lambda e: e["self_time"], reverse=True)
+        return by_cumulative[:self.top], by_self[:self.top]
+
+    def call(self, fn: Callable[..., Any], *args) -> Any:
+        """Run fn(*args) profiled in the calling thread (use inside a pool thread)"""
+        self.start()
+        try:
+            return fn(*args)
+        finally:
+            self.stop()
+
+    def __enter__(self) -> "ExecutionProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
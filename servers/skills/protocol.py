@@ -0,0 +1,262 @@
+"""
+Message Protocol - stdin/stdout transport shared by the Python bridges
+Used by servers/skills/bridge.py and core/python_server.py
+
+Framings (negotiated by the Node side after "ready"):
+- "jsonl": one JSON message per line (default, always available)
+- "frame-json": 4-byte big-endian length prefix + UTF-8 JSON payload
+- "frame-msgpack": 4-byte big-endian length prefix + MessagePack payload
+  (only when the optional msgpack package is installed)
+
+Once a framed mode is active, fd 1 is redirected to stderr so stray
+prints (user code, C extensions) can no longer corrupt the channel.
+
+Messages larger than the spool threshold are written to a spool file and
+replaced on the pipe by a small {"type": "spool"} envelope (see spool.py).
+
+A value can be encoded ahead of its message with encode_value() and then
+embedded as a fragment (send(message, fragments={"result": data})): the
+bridges use it to learn the size of a result without encoding it twice.
+"""
+
+import os
+import sys
+import json
+import struct
+import secrets
+import asyncio
+import threading
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from . import serializer
+from .serializer import msgpack
+from .spool import Spool
+
+
+JSONL = "jsonl"
+FRAME_JSON = "frame-json"
+FRAME_MSGPACK = "frame-msgpack"
+
+# Max size of one incoming message (line or frame payload)
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+_HEADER = struct.Struct(">I")
+
+# Bytes per read when skipping an oversized frame
+_SKIP_CHUNK_SIZE = 64 * 1024
+
+
+def supported_framings() -> List[str]:
+    """Framings this process can speak, advertised in the "ready" message"""
+    framings = [JSONL, FRAME_JSON]
+    if msgpack is not None:
+        framings.append(FRAME_MSGPACK)
+    return framings
+
+
+async def open_stdin_reader(limit: int = MAX_MESSAGE_SIZE) -> asyncio.StreamReader:
+    """
+    Create an asyncio StreamReader over stdin
+
+    Uses a non-blocking pipe when possible; otherwise (Windows, redirected
+    file, console) stdin is read by a dedicated thread.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=limit)
+
+    if sys.platform != "win32":
+        try:
+            await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+            )
+            return reader
+        except (ValueError, OSError):
+            pass
+
+    def pump():
+        stream = sys.stdin.buffer
+        while True:
+            data = stream.read1(65536)
+            if not data:
+                break
+            loop.call_soon_threadsafe(reader.feed_data, data)
+        loop.call_soon_threadsafe(reader.feed_eof)
+
+    threading.Thread(target=pump, name="stdin-reader", daemon=True).start()
+    return reader
+
+
+class MessageChannel:
+    """
+    Bidirectional message channel over a StreamReader and a binary output
+
+    Reads and writes JSON lines until switch() selects a framed mode.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        output: Optional[BinaryIO] = None,
+        spool: Optional[Spool] = None
+    ):
+        """
+        Args:
+            reader: StreamReader over the incoming stream (see open_stdin_reader)
+            output: Binary output stream (default: sys.stdout.buffer)
+            spool: Side channel for large messages (default: Spool() from env)
+        """
+        self.reader = reader
+        self.output = output if output is not None else sys.stdout.buffer
+        self.framing = JSONL
+        self.spool = spool if spool is not None else Spool()
+        self._stdout_isolated = False
+        # Placeholder prefix for fragments (never occurs in real messages)
+        self._marker = f"__fragment_{secrets.token_hex(8)}_"
+
+    def encode(
+        self,
+        message: Dict[str, Any],
+        fragments: Optional[Dict[str, bytes]] = None
+    ) -> bytes:
+        """
+        Encode a message for the current framing (see serializer.py)
+
+        Payloads above the spool threshold are stored in a spool file and
+        the returned bytes carry the envelope instead.
+
+        Args:
+            message: Message to encode
+            fragments: Values already encoded with encode_value() in the
+                current framing, by top-level key of the message
+        """
+        payload = self._encode_payload(message, fragments)
+
+        if self.spool.should_spool(len(payload)):
+            envelope = {
+                "type": "spool",
+                "spool": self.spool.store(
+                    payload, "msgpack" if self.framing == FRAME_MSGPACK else "json"
+                )
+            }
+            # Keep the routing keys so a failed read can still be reported
+            for key in ("id", "requestId"):
+                if key in message:
+                    envelope[key] = message[key]
+            payload = self._encode_payload(envelope)
+
+        if self.framing == JSONL:
+            return payload + b"\n"
+        return _HEADER.pack(len(payload)) + payload
+
+    def encode_value(self, value: Any) -> bytes:
+        """Encode one value for the current framing (to send as a fragment)"""
+        return self._encode_payload(value)
+
+    def _encode_payload(self, message: Any, fragments: Optional[Dict[str, bytes]] = None) -> bytes:
+        if fragments:
+            message = {**message, **{key: self._marker + key for key in fragments}}
+
+        if self.framing == FRAME_MSGPACK:
+            payload = serializer.packb(message)
+        else:
+            payload = serializer.dumps(message)
+
+        if fragments:
+            # JSON and MessagePack are concatenative: the encoded placeholder
+            # string can be swapped for any other encoded value
+            for key, data in fragments.items():
+                placeholder = self._encode_payload(self._marker + key)
+                start = payload.index(placeholder)
+                payload = b"".join((payload[:start], data, payload[start + len(placeholder):]))
+        return payload
+
+    def decode(self, payload: bytes) -> Any:
+        """Decode one message payload for the current framing"""
+        if self.framing == FRAME_MSGPACK:
+            return msgpack.unpackb(payload, raw=False)
+        return json.loads(payload)
+
+    def send(self, message: Dict[str, Any], fragments: Optional[Dict[str, bytes]] = None):
+        """Write one message (single write, so messages never interleave)"""
+        self.output.write(self.encode(message, fragments))
+        self.output.flush()
+
+    async def receive(self) -> Optional[Any]:
+        """
+        Read the next message
+
+        Returns:
+            Decoded message, or None at EOF
+
+        Raises:
+            ValueError: Invalid JSON or message above the size limit (the
+                oversized payload is skipped, so the next frame still
+                starts at a header)
+        """
+        if self.framing == JSONL:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    return None
+                line = line.strip()
+                if line:
+                    return self.decode(line)
+
+        try:
+            header = await self.reader.readexactly(_HEADER.size)
+            (size,) = _HEADER.unpack(header)
+            if size > MAX_MESSAGE_SIZE:
+                await self._skip(size)
+                raise ValueError(f"Frame of {size} bytes exceeds {MAX_MESSAGE_SIZE}")
+            payload = await self.reader.readexactly(size)
+        except asyncio.IncompleteReadError:
+            return None
+        return self.decode(payload)
+
+    async def _skip(self, size: int):
+        """Read and drop size bytes without buffering them"""
+        while size > 0:
+            chunk = await self.reader.read(min(size, _SKIP_CHUNK_SIZE))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b"", size)
+            size -= len(chunk)
+
+    def switch(self, framing: str):
+        """
+        Switch both directions to another framing
+
+        Call right after sending the acknowledgement in the old framing.
+
+        Raises:
+            ValueError: If the framing is not supported
+        """
+        if framing not in supported_framings():
+            raise ValueError(
+                f"Unsupported framing '{framing}' "
+                f"(supported: {', '.join(supported_framings())})"
+            )
+        if framing != JSONL:
+            self.isolate_stdout()
+        self.framing = framing
+
+    def isolate_stdout(self):
+        """
+        Keep the protocol on a private fd and point fd 1 at stderr
+
+        Output written straight to fd 1 (threads, C extensions, print()
+        outside any capture) then goes to stderr instead of corrupting the
+        protocol. switch() to a framed mode calls this; JSON-lines servers
+        that run arbitrary code call it at startup.
+        """
+        if self._stdout_isolated:
+            return
+        try:
+            stdout_fd = self.output.fileno()
+        except (AttributeError, OSError, ValueError):
+            return  # Not a real file (tests)
+
+        sys.stdout.flush()
+        self.output.flush()
+        self.output = os.fdopen(os.dup(stdout_fd), "wb")
+        os.dup2(sys.stderr.fileno(), stdout_fd)
+        self._stdout_isolated = True
@@ -0,0 +1,194 @@
+"""
+Resource Accounting - CPU, memory and GC usage of each execution
+Used by servers/skills/executor.py, worker_pool.py and core/python_server.py
+
+A ResourceMeter snapshots process counters when an execution starts and
+keeps the deltas when it stops:
+
+    {
+        "scope": "thread" | "process",
+        "cpu_user": 0.012,          # seconds
+        "cpu_system": 0.001,        # seconds
+        "max_rss_delta": 1048576,   # growth of the process peak RSS (bytes)
+        "alloc_peak": 524288,       # tracemalloc peak above the start (bytes) or None
+        "gc_collections": 3         # collections run (all generations)
+    }
+
+The bridges add "bytes_serialized" (size of the encoded result) when the
+response is sent.
+
+Scope:
+- "thread": CPU time of the calling thread (RUSAGE_THREAD, Linux) - exact
+  for skills running in a pool thread
+- "process": CPU time of the whole process - exact in worker processes,
+  but overlaps with other executions running concurrently on the same
+  event loop
+
+Peak RSS, tracemalloc peak and GC counts are always process wide: under
+concurrency they are an upper bound for a single execution. alloc_peak
+is only measured while tracemalloc is tracing (MCP_TRACEMALLOC=1 or
+start_tracemalloc_from_env()); tracing slows Python allocations down
+noticeably, so leave it off in production.
+"""
+
+import os
+import sys
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# ru_maxrss is in KiB on Linux and in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+_RUSAGE_THREAD = getattr(resource, "RUSAGE_THREAD", None)
+
+# Summed per key by ResourceTotals (alloc_peak keeps the maximum)
+_SUMMED_FIELDS = ("cpu_user", "cpu_system", "max_rss_delta", "gc_collections")
+
+
+def start_tracemalloc_from_env():
+    """Start tracemalloc when MCP_TRACEMALLOC is set (value: frames to keep, default 1)"""
+    value = os.environ.get("MCP_TRACEMALLOC", "").strip().lower()
+    if value in ("", "0", "false", "no") or tracemalloc.is_tracing():
+        return
+    tracemalloc.start(int(value) if value.isdigit() else 1)
+
+
+def _cpu_times(scope: str):
+    """(user, system) CPU seconds of the thread or the process"""
+    if resource is None:
+        return (time.thread_time() if scope == "thread" else time.process_time()), 0.0
+    who = _RUSAGE_THREAD if scope == "thread" and _RUSAGE_THREAD is not None else resource.RUSAGE_SELF
+    usage = resource.getrusage(who)
+    return usage.ru_utime, usage.ru_stime
+
+
+def _max_rss() -> int:
+    """Peak resident set size of the process (bytes, 0 if unknown)"""
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def _gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+class ResourceMeter:
+    """
+    Measures one execution (start()/stop(), a with block or call())
+
+    The result is kept in `usage` (None until stopped) so it can be read
+    after a failure too.
+    """
+
+    def __init__(self, scope: str = "process"):
+        """
+        Args:
+            scope: "process" or "thread" (see module docstring)
+        """
+        self.scope = scope
+        self.usage: Optional[Dict[str, Any]] = None
+        self._start = None
+
+    def start(self):
+        """Snapshot the counters (resets the tracemalloc peak)"""
+        alloc = None
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            alloc = tracemalloc.get_traced_memory()[0]
+
+        user, system = _cpu_times(self.scope)
+        self._start = (user, system, _max_rss(), _gc_collections(), alloc)
+        self.usage = None
+
+    def stop(self) -> Dict[str, Any]:
+        """Compute the deltas since start()"""
+        user, system = _cpu_times(self.scope)
+        start_user, start_system, start_rss, start_gc, start_alloc = self._start
+
+        alloc_peak = None
+        if start_alloc is not None and tracemalloc.is_tracing():
+            alloc_peak = max(0, tracemalloc.get_traced_memory()[1] - start_alloc)
+
+        self.usage = {
+            "scope": self.scope,
+            "cpu_user": round(user - start_user, 6),
+            "cpu_system": round(system - start_system, 6),
+            "max_rss_delta": max(0, _max_rss() - start_rss),
+            "alloc_peak": alloc_peak,
+            "gc_collections": _gc_collections() - start_gc
+        }
+        return self.usage
+
+    def call(self, fn: Callable[..., Any], *args) -> Any:
+        """Run fn(*args) measuring the calling thread (use inside a pool thread)"""
+        self.scope = "thread"
+        self.start()
+        try:
+            return fn(*args)
+        finally:
+            self.stop()
+
+    def __enter__(self) -> "ResourceMeter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+class ResourceTotals:
+    """Cumulative usage per key (skill name or session)"""
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, key: str) -> Dict[str, Any]:
+        entry = self._totals.get(key)
+        if entry is None:
+            entry = self._totals[key] = {
+                "executions": 0,
+                "cpu_user": 0.0,
+                "cpu_system": 0.0,
+                "max_rss_delta": 0,
+                "alloc_peak": None,
+                "gc_collections": 0,
+                "bytes_serialized": 0
+            }
+        return entry
+
+    def add(self, key: str, usage: Dict[str, Any]):
+        """Add one execution measured by a ResourceMeter"""
+        entry = self._entry(key)
+        entry["executions"] += 1
+        for field in _SUMMED_FIELDS:
+            entry[field] += usage.get(field) or 0
+        if usage.get("alloc_peak") is not None:
+            entry["alloc_peak"] = max(entry["alloc_peak"] or 0, usage["alloc_peak"])
+
+    def add_serialized(self, key: str, size: int):
+        """Add the encoded size of a result sent for key"""
+        self._entry(key)["bytes_serialized"] += size
+
+    def clear(self):
+        self._totals.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Totals per key (CPU rounded to microseconds)"""
+        return {
+            key: {
+                **entry,
+                "cpu_user": round(entry["cpu_user"], 6),
+                "cpu_system": round(entry["cpu_system"], 6)
+            }
+            for key, entry in self._totals.items()
+        }
@@ -0,0 +1,203 @@
+"""
+Result Cache - Memoized results of deterministic skills
+Skills opt in with "cacheable": true (and optional "ttl" in seconds)
+in registry.json or skill.json
+
+Results are stored encoded with the bridge serializer (serializer.dumps)
+in both tiers and decoded on every hit: a hit is a fresh copy, equal to
+what Node receives for the original result, whichever tier it came from.
+Writes to the SQLite tier can be handed to a thread pool (put(executor=...))
+so the event loop never waits on a commit.
+"""
+
+import json
+import time
+import logging
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional, Tuple
+
+from . import serializer
+
+
+# Default max number of results kept in memory
+DEFAULT_MAX_ENTRIES = 256
+
+# Default time-to-live of a cached result (seconds)
+DEFAULT_TTL = 300
+
+
+def make_key(skill_name: str, version: Optional[str], params: Dict[str, Any]) -> Optional[str]:
+    """
+    Build the cache key from skill name, version and canonical params
+
+    Returns:
+        Hex digest, or None if params are not JSON-serializable
+    """
+    try:
+        canonical = json.dumps(
+            [skill_name, version, params],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier result cache
+
+    Features:
+    - In-memory LRU (OrderedDict) with per-entry expiry
+    - Optional SQLite tier shared across restarts; hits there are
+      promoted to memory
+    - Hit/miss counters for stats
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[str] = None):
+        """
+        Args:
+            max_entries: Max results kept in memory
+            path: SQLite database file for the on-disk tier (None: memory only)
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        # The connection is shared with the thread running put()'s writes
+        self._db_lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0
+        }
+
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+            )
+            self._db.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a result
+
+        Returns:
+            (found, result): result is decoded from the stored encoding
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return True, json.loads(value)
+            del self._entries[key]
+
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT expires_at, value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+            if row is not None:
+                expires_at, value = row
+                if expires_at > time.time():
+                    if isinstance(value, str):
+                        value = value.encode("utf-8")
+                    self._remember(key, expires_at, value)
+                    self.stats["hits"] += 1
+                    self.stats["disk_hits"] += 1
+                    return True, json.loads(value)
+                with self._db_lock:
+                    self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self._db.commit()
+
+        self.stats["misses"] += 1
+        return False, None
+
+    def put(self, key: str, result: Any, ttl: float = DEFAULT_TTL, executor: Optional[Executor] = None):
+        """
+        Store a result for ttl seconds
+
+        Results the serializer cannot encode (circular references, too
+        deep, out-of-range numbers, ...) are not cached.
+
+        Args:
+            executor: Runs the SQLite write (default: written before returning)
+        """
+        expires_at = time.time() + ttl
+        try:
+            value = serializer.dumps(result)
+        except Exception:
+            return
+        self._remember(key, expires_at, value)
+        self.stats["stores"] += 1
+
+        if self._db is None:
+            return
+        if executor is None:
+            self._store(key, expires_at, value)
+        else:
+            executor.submit(self._store, key, expires_at, value).add_done_callback(_log_store_error)
+
+    def clear(self):
+        """Drop every cached result (both tiers)"""
+        self._entries.clear()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def close(self):
+        """Close the on-disk tier"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups > 0 else 0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "disk": self.path
+        }
+
+    def _store(self, key: str, expires_at: float, value: bytes):
+        """Write one result to the SQLite tier"""
+        with self._db_lock:
+            if self._db is None:
+                return  # Closed while the write was queued
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, expires_at, value)
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, value: bytes):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+
+def _log_store_error(future):
+    """Report a failed background write (the memory tier still has the result)"""
+    error = future.exception()
+    if error is not None:
+        logging.error(f"Result cache write failed: {error}")
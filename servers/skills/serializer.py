@@ -0,0 +1,175 @@
+"""
+Serializer - Encoding of results sent to Node
+Used by servers/skills/protocol.py (both bridges) and core/python_server.py
+
+Messages are encoded in a single pass: the JSON/MessagePack encoder walks
+the message once and only calls back into Python for values it does not
+know natively. Those go through, in order:
+
+1. Custom encoders registered with register_encoder() (matched by MRO)
+2. Built-in fast paths: dataclasses, datetime/date/time, Decimal, bytes,
+   set/frozenset, Enum, numpy arrays/scalars and array.array (tolist())
+3. Objects with __dict__: {"__type__": <class name>, "__dict__": {...}}
+4. str(obj)
+
+bytes are sent as-is in the "frame-msgpack" framing (binary frames) and
+as {"__type__": "bytes", "base64": "..."} in the JSON framings.
+
+When the optional orjson package is installed it is used for JSON
+(serializing dataclasses, datetimes and numpy arrays natively); the
+standard json module is the fallback. As with json, encoders are never
+consulted for types the backend already handles (str, int, float, list,
+dict and their subclasses, plus those orjson supports).
+
+Custom encoders run in the bridge process: skills executed in "process"
+mode send their results back pickled, so register encoders for their
+types in a module the bridge also imports, or return plain data.
+"""
+
+import json
+import base64
+import decimal
+import datetime
+import dataclasses
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency
+    msgpack = None
+
+
+Encoder = Callable[[Any], Any]
+
+# Custom encoders by type (see register_encoder)
+_encoders: Dict[type, Encoder] = {}
+
+# Resolved encoder per concrete type (None: no custom encoder)
+_resolved: Dict[type, Optional[Encoder]] = {}
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def register_encoder(cls: type, encoder: Encoder):
+    """
+    Register how instances of a type (and its subclasses) are encoded
+
+    Args:
+        cls: Type to handle
+        encoder: Function returning a serializable replacement; it may
+            contain other values that need encoding
+
+    Example:
+        register_encoder(Money, lambda m: {"amount": str(m.amount), "currency": m.currency})
+    """
+    _encoders[cls] = encoder
+    _resolved.clear()
+
+
+def unregister_encoder(cls: type):
+    """Remove a custom encoder (no-op if not registered)"""
+    if _encoders.pop(cls, None) is not None:
+        _resolved.clear()
+
+
+def backend() -> str:
+    """Name of the JSON backend in use"""
+    return "orjson" if orjson is not None else "json"
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode to UTF-8 JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default_json, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Beyond what orjson supports (ex: int above 64 bits)
+            pass
+    return json.dumps(obj, default=_default_json).encode("utf-8")
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Encode to MessagePack
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(obj, default=_default_binary, use_bin_type=True)
+
+
+def encode_value(obj: Any, binary: bool = False) -> Any:
+    """
+    Replacement for one value the encoder cannot handle natively
+
+    Args:
+        obj: Value to encode
+        binary: Target supports raw bytes (MessagePack)
+    """
+    encoder = _lookup(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow: nested values are encoded by the same pass
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        # As a string: keeps the exact value
+        return str(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        if binary:
+            return data
+        return {"__type__": "bytes", "base64": base64.b64encode(data).decode("ascii")}
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+
+    # numpy arrays/scalars, array.array and other objects with tolist()
+    tolist = getattr(obj, "tolist", None)
+    if callable(tolist):
+        return tolist()
+
+    if hasattr(obj, "__dict__") and not isinstance(obj, type):
+        # Custom object - serialize its attributes
+        return {"__type__": type(obj).__name__, "__dict__": vars(obj)}
+
+    # Fallback: convert to string
+    return str(obj)
+
+
+def _default_json(obj: Any) -> Any:
+    return encode_value(obj, binary=False)
+
+
+def _default_binary(obj: Any) -> Any:
+    return encode_value(obj, binary=True)
+
+
+def _lookup(cls: type) -> Optional[Encoder]:
+    """Custom encoder for a type (walks the MRO once, then cached)"""
+    try:
+        return _resolved[cls]
+    except KeyError:
+        pass
+
+    encoder = None
+    if _encoders:
+        for base in cls.__mro__:
+            encoder = _encoders.get(base)
+            if encoder is not None:
+                break
+    _resolved[cls] = encoder
+    return encoder
@@ -0,0 +1,205 @@
+"""
+Spool - Side channel for large messages
+Used by servers/skills/protocol.py (both bridges)
+
+A message whose encoded payload exceeds the threshold is written to a
+spool file instead of stdout, and only a small envelope goes through the
+pipe:
+
+    {"type": "spool", "spool": {"id", "path", "size", "encoding"},
+     "id"/"requestId": <copied from the original message>}
+
+The receiver reads the file, decodes it with "encoding" ("json" or
+"msgpack") as if it had arrived inline, and answers with a release
+message ({"type": "spool_release", "handle": id} for python_server,
+{"action": "spool_release", "handle": id} for the skills bridge).
+
+Spool files live in a per-process directory under /dev/shm (shared
+memory) when available, otherwise under the system temp directory.
+Handles are reference counted: the file is removed when the count drops
+to zero, when the handle has not been released after `ttl` seconds
+(receiver gone), or when the process exits.
+"""
+
+import os
+import time
+import atexit
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+# Payloads above this size (bytes) are spooled; 0 disables the spool
+DEFAULT_THRESHOLD = 8 * 1024 * 1024
+
+# Seconds an unreleased spool file is kept
+DEFAULT_TTL = 300
+
+_SHM_DIR = "/dev/shm"
+
+
+def _default_directory() -> str:
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return tempfile.gettempdir()
+
+
+class Spool:
+    """
+    Registry of reference-counted spool files
+
+    Features:
+    - Per-process directory (created lazily, removed on close/exit)
+    - acquire()/release() reference counting per handle
+    - Expiry of handles never released by the receiver
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[int] = None,
+        ttl: Optional[float] = None,
+        directory: Optional[str] = None
+    ):
+        """
+        Args:
+            threshold: Min payload size to spool (default: MCP_SPOOL_THRESHOLD env or 8 MiB)
+            ttl: Seconds before unreleased files are removed (default: MCP_SPOOL_TTL env or 300)
+            directory: Parent directory of the spool (default: /dev/shm or temp dir)
+        """
+        self.threshold = threshold if threshold is not None else int(
+            os.environ.get("MCP_SPOOL_THRESHOLD", DEFAULT_THRESHOLD)
+        )
+        self.ttl = ttl if ttl is not None else float(
+            os.environ.get("MCP_SPOOL_TTL", DEFAULT_TTL)
+        )
+        self.parent = directory or os.environ.get("MCP_SPOOL_DIR") or _default_directory()
+        self.directory: Optional[str] = None
+
+        self._handles: Dict[str, Dict[str, Any]] = {}
+        self._counter = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            "spooled": 0,
+            "bytes": 0,
+            "released": 0,
+            "expired": 0
+        }
+
+        atexit.register(self.close)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def should_spool(self, size: int) -> bool:
+        """Whether a payload of this size goes through the spool"""
+        return self.enabled and size > self.threshold
+
+    def store(self, payload: bytes, encoding: str) -> Dict[str, Any]:
+        """
+        Write a payload to a new spool file (reference count 1)
+
+        Returns:
+            Handle to send to the receiver
+        """
+        self._expire()
+
+        with self._lock:
+            if self.directory is None:
+                self.directory = tempfile.mkdtemp(prefix=f"mcp-spool-{os.getpid()}-", dir=self.parent)
+            self._counter += 1
+            handle_id = f"{os.getpid()}-{self._counter}"
+
+        path = os.path.join(self.directory, handle_id)
+        with open(path, "wb") as f:
+            f.write(payload)
+
+        handle = {
+            "id": handle_id,
+            "path": path,
+            "size": len(payload),
+            "encoding": encoding
+        }
+        with self._lock:
+            self._handles[handle_id] = {
+                "path": path,
+                "refs": 1,
+                "created_at": time.monotonic()
+            }
+            self.stats["spooled"] += 1
+            self.stats["bytes"] += len(payload)
+        return handle
+
+    def acquire(self, handle_id: str) -> bool:
+        """
+        Add a reference to a handle
+
+        Returns:
+            False if the handle no longer exists
+        """
+        with self._lock:
+            entry = self._handles.get(handle_id)
+            if entry is None:
+                return False
+            entry["refs"] += 1
+            return True
+
+    def release(self, handle_id: str) -> bool:
+        """
+        Drop a reference; the file is removed at zero
+
+        Returns:
+            False if the handle is unknown (already released or expired)
+        """
+        with self._lock:
+            entry = self._handles.get(handle_id)
+            if entry is None:
+                return False
+            entry["refs"] -= 1
+            if entry["refs"] > 0:
+                return True
+            del self._handles[handle_id]
+            self.stats["released"] += 1
+
+        _unlink(entry["path"])
+        return True
+
+    def close(self):
+        """Remove every spool file and the spool directory"""
+        with self._lock:
+            self._handles.clear()
+            directory, self.directory = self.directory, None
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get spool statistics"""
+        with self._lock:
+            outstanding = len(self._handles)
+        return {
+            **self.stats,
+            "outstanding": outstanding,
+            "threshold": self.threshold,
+            "directory": self.directory or self.parent
+        }
+
+    def _expire(self):
+        """Remove files the receiver never released"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                handle_id for handle_id, entry in self._handles.items()
+                if now - entry["created_at"] > self.ttl
+            ]
+            paths = [self._handles.pop(handle_id)["path"] for handle_id in expired]
+            self.stats["expired"] += len(expired)
+
+        for path in paths:
+            _unlink(path)
+
+
+def _unlink(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
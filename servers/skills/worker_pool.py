@@ -0,0 +1,497 @@
+"""
+Skill Worker Pool - Supervised worker processes for skill execution
+Enforces hard timeouts by killing and replacing stuck workers
+"""
+
+import os
+import sys
+import time
+import asyncio
+import inspect
+import logging
+import functools
+import traceback
+import importlib.util
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .module_cache import ModuleCache
+from .profiler import ExecutionProfiler
+from .resources import ResourceMeter, start_tracemalloc_from_env
+
+
+# Skills loaded inside worker processes (invalidated when files change)
+_process_modules = ModuleCache()
+
+
+def _drain_generator(result: Any, emit: Optional[Callable[[Any], None]]) -> Any:
+    """
+    Consume a generator / async generator outside the event loop
+
+    Args:
+        result: Value returned by the skill entry function
+        emit: Called with each chunk; None collects chunks into a list
+
+    Returns:
+        The list of chunks (no emit), the generator's return value (emit),
+        or result unchanged if it is not a generator
+    """
+    if inspect.isasyncgen(result):
+        async def consume():
+            chunks = []
+            async for chunk in result:
+                if emit is None:
+                    chunks.append(chunk)
+                else:
+                    emit(chunk)
+            return chunks if emit is None else None
+        return asyncio.run(consume())
+
+    if inspect.isgenerator(result):
+        chunks = []
+        while True:
+            try:
+                chunk = next(result)
+            except StopIteration as stop:
+                return chunks if emit is None else stop.value
+            if emit is None:
+                chunks.append(chunk)
+            else:
+                emit(chunk)
+
+    return result
+
+
+def _call_entry_function(
+    fn,
+    params: Dict[str, Any],
+    emit: Optional[Callable[[Any], None]] = None
+) -> Any:
+    """Call a skill entry function outside the event loop (sync, async or generator)"""
+    result = fn(**params)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return _drain_generator(result, emit)
+
+
+def _get_entry_function(module: Any):
+    """Return the skill module's execute() or main() function"""
+    if hasattr(module, "execute"):
+        return module.execute
+    if hasattr(module, "main"):
+        return module.main
+    raise AttributeError(
+        "Skill module must have 'execute' or 'main' function"
+    )
+
+
+def _load_process_module(skill_name: str, entry_point: str) -> Any:
+    """Load a skill into this process's module cache (once per file version)"""
+    module = _process_modules.get(skill_name, entry_point)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            f"skills.{skill_name}",
+            entry_point
+        )
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load skill '{skill_name}'")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[f"skills.{skill_name}"] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(f"skills.{skill_name}", None)
+            raise
+        _process_modules.put(skill_name, entry_point, module)
+    return module
+
+
+def _run_skill_in_process(
+    skill_name: str,
+    entry_point: str,
+    params: Dict[str, Any],
+    emit: Optional[Callable[[Any], None]] = None
+) -> Any:
+    """Load the skill once per worker process and run it"""
+    module = _load_process_module(skill_name, entry_point)
+    return _call_entry_function(_get_entry_function(module), params, emit)
+
+
+def _worker_main(conn):
+    """
+    Worker process loop
+
+    Protocol (over a multiprocessing Pipe):
+    - worker -> parent: ("ready", pid, zygote) once started; zygote: the
+      preload report of the zygote it was forked from (zygote.report())
+    - parent -> worker: (skill_name, entry_point, params, stream, profile)
+      or None to stop; profile: ExecutionProfiler options or None
+    - worker -> parent: ("chunk", data) per yielded chunk when stream is set
+    - worker -> parent: ("ok", result, report) or
+      ("error", type, message, traceback, report); report:
+      {"usage": ResourceMeter usage, "profile": profiler report or None}
+    """
+    # Imported here: the fork server must load zygote after this module
+    from . import zygote
+
+    start_tracemalloc_from_env()
+    conn.send(("ready", os.getpid(), zygote.report()))
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        if request is None:
+            break
+
+        skill_name, entry_point, params, stream, profile = request
+        emit = (lambda chunk: conn.send(("chunk", chunk))) if stream else None
+        meter = ResourceMeter()
+        profiler = ExecutionProfiler(**profile) if profile is not None else None
+        run = _run_skill_in_process if profiler is None else functools.partial(
+            profiler.call, _run_skill_in_process
+        )
+
+        try:
+            with meter:
+                result = run(skill_name, entry_point, params, emit)
+            report = {"usage": meter.usage, "profile": profiler and profiler.report}
+            conn.send(("ok", result, report))
+        except BaseException as e:
+            report = {"usage": meter.usage, "profile": profiler and profiler.report}
+            try:
+                conn.send(("error", type(e).__name__, str(e), traceback.format_exc(), report))
+            except (EOFError, OSError):
+                break
+
+
+class SkillTimeoutError(asyncio.TimeoutError):
+    """
+    Skill exceeded its deadline; its worker was killed (replaced in the background)
+
+    kill_time covers the kill only: the respawn finishes after the error is
+    raised and is reported in the pool stats (last_respawn_time).
+    """
+
+    def __init__(self, timeout: float, kill_time: float):
+        super().__init__(f"Skill execution timed out after {timeout}s")
+        self.timeout = timeout
+        self.kill_time = kill_time
+
+
+class SkillWorkerError(Exception):
+    """Exception raised by a skill inside a worker process"""
+
+    def __init__(self, error_type: str, message: str, remote_traceback: str):
+        super().__init__(message)
+        self.error_type = error_type
+        self.remote_traceback = remote_traceback
+
+
+class SkillWorker:
+    """One supervised worker process and its pipe"""
+
+    def __init__(self, mp_context, startup_timeout: float):
+        started = time.perf_counter()
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        if not self.conn.poll(startup_timeout):
+            self.kill()
+            raise RuntimeError(
+                f"Skill worker did not start within {startup_timeout}s"
+            )
+        _, _, self.zygote = self.conn.recv()
+        self.startup_time = time.perf_counter() - started
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def kill(self):
+        """SIGKILL the process and release its pipe"""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self, timeout: float = 2.0):
+        """Ask the worker to exit, killing it if it does not"""
+        try:
+            self.conn.send(None)
+        except (EOFError, OSError):
+            pass
+        self.process.join(timeout)
+        self.kill()
+
+
+class SkillWorkerPool:
+    """
+    Pool of supervised skill worker processes
+
+    Features:
+    - Workers are started on demand (up to size) and reused while healthy
+    - Hard deadlines: a worker that passes its timeout is SIGKILLed and
+      replaced before the slot is handed to the next request
+    - Crashed workers are replaced without affecting other requests
+    - With forkserver, workers are forked from a zygote that preloaded
+      the framework and the hot skills (see zygote.py)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        start_method: Optional[str] = None,
+        startup_timeout: float = 30.0,
+        preload: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            size: Max number of worker processes
+            start_method: multiprocessing start method
+                (default: forkserver when available, else spawn)
+            startup_timeout: Max seconds to wait for a new worker
+            preload: {skill name: entry point} imported by the zygote
+                (forkserver only)
+        """
+        if start_method is None:
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+
+        self.size = size
+        self.start_method = start_method
+        self.startup_timeout = startup_timeout
+        from . import zygote
+
+        self._mp_context = multiprocessing.get_context(start_method)
+        self.zygote = zygote.start(self._mp_context, preload)
+        self._zygote_report: Optional[Dict[str, Any]] = None
+
+        self._idle: List[SkillWorker] = []
+        self._workers = 0
+        self._condition: Optional[asyncio.Condition] = None
+        # Respawns/replacements still running (references keep them alive)
+        self._background: Set[asyncio.Future] = set()
+        # Threads that wait on worker pipes and spawn/kill processes
+        self._io = ThreadPoolExecutor(
+            max_workers=size * 2,
+            thread_name_prefix="skill-worker-io"
+        )
+        self.stats = {
+            "spawned": 0,
+            "timeouts": 0,
+            "crashes": 0,
+            "spawn_time": 0.0,
+            "respawns": 0,
+            "respawn_time": 0.0,
+            "last_respawn_time": None
+        }
+
+    async def run(
+        self,
+        skill_name: str,
+        entry_point: str,
+        params: Dict[str, Any],
+        timeout: float,
+        on_chunk: Optional[Callable[[Any], None]] = None,
+        meter: Optional[ResourceMeter] = None,
+        profiler: Optional[ExecutionProfiler] = None
+    ) -> Any:
+        """
+        Run a skill in a worker process with a hard deadline
+
+        Args:
+            skill_name: Name of the skill
+            entry_point: Path to the skill's index.py / __init__.py
+            params: Execution parameters (must be picklable)
+            timeout: Deadline in seconds (covers the whole stream)
+            on_chunk: Called with each chunk yielded by generator skills
+            meter: Receives the usage measured in the worker (meter.usage)
+            profiler: Profiles the run inside the worker (report in profiler.report)
+
+        Returns:
+            Skill execution result
+
+        Raises:
+            SkillTimeoutError: If the deadline passed (worker was killed; the
+                replacement starts in the background)
+            SkillWorkerError: If the skill raised inside the worker
+            RuntimeError: If the worker process died
+        """
+        loop = asyncio.get_running_loop()
+        worker = await self._acquire()
+        replace = True
+
+        try:
+            worker.conn.send((
+                skill_name, entry_point, params, on_chunk is not None,
+                profiler.options() if profiler is not None else None
+            ))
+            deadline = time.monotonic() + timeout
+
+            while True:
+                remaining = max(0.0, deadline - time.monotonic())
+                ready = await loop.run_in_executor(self._io, worker.conn.poll, remaining)
+
+                if not ready:
+                    # Fail as soon as the worker is dead; the caller does
+                    # not wait for its replacement
+                    self.stats["timeouts"] += 1
+                    replace = False
+                    kill_time = await self._kill(worker)
+                    self._in_background(self._respawn())
+                    raise SkillTimeoutError(timeout, kill_time)
+
+                try:
+                    response = worker.conn.recv()
+                except (EOFError, OSError):
+                    self.stats["crashes"] += 1
+                    await loop.run_in_executor(self._io, worker.process.join, 1.0)
+                    raise RuntimeError(
+                        f"Skill worker {worker.pid} died "
+                        f"(exit code {worker.process.exitcode})"
+                    )
+
+                if response[0] != "chunk":
+                    break
+                on_chunk(response[1])
+
+            replace = False
+            self._release(worker)
+
+            report = response[-1]
+            if meter is not None:
+                meter.usage = report["usage"]
+            if profiler is not None:
+                profiler.report = report["profile"]
+            if response[0] == "ok":
+                return response[1]
+            _, error_type, message, remote_traceback, _ = response
+            raise SkillWorkerError(error_type, message, remote_traceback)
+
+        finally:
+            if replace:
+                # Crash, send failure or cancellation: never reuse this worker
+                self._in_background(self._replace(worker))
+
+    async def _acquire(self) -> SkillWorker:
+        """Get an idle worker, starting one if below size"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        async with self._condition:
+            while not self._idle and self._workers >= self.size:
+                await self._condition.wait()
+
+            if self._idle:
+                return self._idle.pop()
+            self._workers += 1
+
+        try:
+            return await self._spawn()
+        except BaseException:
+            async with self._condition:
+                self._workers -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, worker: SkillWorker):
+        """Return a healthy worker to the idle list"""
+        self._idle.append(worker)
+        asyncio.ensure_future(self._notify())
+
+    async def _notify(self):
+        async with self._condition:
+            self._condition.notify()
+
+    async def _spawn(self) -> SkillWorker:
+        loop = asyncio.get_running_loop()
+        worker = await loop.run_in_executor(
+            self._io, SkillWorker, self._mp_context, self.startup_timeout
+        )
+        self.stats["spawned"] += 1
+        self.stats["spawn_time"] += worker.startup_time
+        self._zygote_report = worker.zygote
+        return worker
+
+    async def _replace(self, worker: SkillWorker):
+        """Kill a worker and start its replacement"""
+        await self._kill(worker)
+        await self._respawn()
+
+    async def _kill(self, worker: SkillWorker) -> float:
+        """
+        Kill a worker (its slot stays taken until _respawn())
+
+        Returns:
+            Kill time in seconds
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        await loop.run_in_executor(self._io, worker.kill)
+        return time.perf_counter() - start
+
+    async def _respawn(self):
+        """Start a worker in the slot of a killed one"""
+        start = time.perf_counter()
+        try:
+            new_worker = await self._spawn()
+        except Exception:
+            # Free the slot; the next request will try to spawn again
+            async with self._condition:
+                self._workers -= 1
+                self._condition.notify()
+            raise
+        respawn_time = time.perf_counter() - start
+        self.stats["respawns"] += 1
+        self.stats["respawn_time"] += respawn_time
+        self.stats["last_respawn_time"] = respawn_time
+        self._release(new_worker)
+
+    def _in_background(self, coro):
+        """Run a respawn/replacement without blocking the caller"""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Future):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"Skill worker respawn failed: {task.exception()!r}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        spawned = self.stats["spawned"]
+        respawns = self.stats["respawns"]
+        return {
+            **self.stats,
+            "avg_spawn_time": self.stats["spawn_time"] / spawned if spawned else 0.0,
+            "avg_respawn_time": self.stats["respawn_time"] / respawns if respawns else 0.0,
+            "size": self.size,
+            "workers": self._workers,
+            "idle": len(self._idle),
+            "start_method": self.start_method,
+            "zygote": self._zygote_report if self.zygote else None
+        }
+
+    def shutdown(self):
+        """Stop idle workers (busy ones are killed with the parent)"""
+        for worker in self._idle:
+            worker.stop()
+        self._idle.clear()
+        self._workers = 0
+        self._io.shutdown(wait=False)
@@ -0,0 +1,135 @@
+"""
+Zygote - Preloaded fork server for skill worker processes
+Used by servers/skills/worker_pool.py
+
+Skill workers are started through multiprocessing's fork server: a
+process started once that forks one child per new worker. start() turns
+it into a zygote. Before serving any fork it imports:
+- the framework (FRAMEWORK_MODULES: worker_pool and everything it pulls
+  in, plus json, asyncio, inspect and the serializer)
+- the hot skills (the pool's preload list), straight into the workers'
+  module cache
+
+Then it runs gc.collect() and gc.freeze(). Each new worker is a fork of
+that process. Nothing is imported again and hot skills are cache hits,
+so a worker is ready in a few milliseconds. The preloaded memory stays
+shared copy-on-write between workers. Frozen objects are skipped by the
+collector, which would otherwise write to the header of every object it
+visits and unshare those pages. Reference counting still unshares the
+pages of objects the worker actually touches.
+
+There is one fork server per process, shared by every pool in it, so
+the first start() fixes what is preloaded. A hot skill edited after the
+zygote started is reloaded by each worker that runs it (the module cache
+checks the file), so it can never be stale; it just stops being
+preloaded.
+
+Without the "forkserver" start method (Windows) workers are spawned and
+nothing is preloaded.
+"""
+
+import gc
+import os
+import json
+import time
+import multiprocessing
+import multiprocessing.forkserver
+from typing import Any, Dict, Optional
+
+# Imported by the fork server before the hot skills
+FRAMEWORK_MODULES = (
+    "json",
+    "asyncio",
+    "inspect",
+    f"{__package__}.serializer",
+    f"{__package__}.worker_pool"
+)
+
+# Hot skills of the fork server being started ({name: entry point}, JSON).
+# Only set while the fork server is launched (see start())
+_HOT_SKILLS_ENV = "MCP_SKILLS_ZYGOTE_HOT_SKILLS"
+
+# Preload outcome, inherited by every worker forked from the zygote
+_report: Optional[Dict[str, Any]] = None
+
+# Hot skills requested by the first start() of this process
+_started: Optional[Dict[str, str]] = None
+
+
+def start(mp_context, hot_skills: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Configure and launch the fork server as a zygote
+
+    Args:
+        mp_context: multiprocessing context the workers are started with
+        hot_skills: {skill name: entry point} to import in the zygote
+
+    Returns:
+        True if workers will be forked from the zygote (forkserver context)
+    """
+    global _started
+
+    if mp_context.get_start_method() != "forkserver":
+        return False
+    if _started is not None:
+        return True
+
+    _started = dict(hot_skills or {})
+    mp_context.set_forkserver_preload(list(FRAMEWORK_MODULES) + [__name__])
+
+    # The fork server inherits the environment at launch: pass the hot
+    # skills that way, without leaking them to later child processes
+    previous = os.environ.get(_HOT_SKILLS_ENV)
+    os.environ[_HOT_SKILLS_ENV] = json.dumps(_started)
+    try:
+        multiprocessing.forkserver.ensure_running()
+    finally:
+        if previous is None:
+            os.environ.pop(_HOT_SKILLS_ENV, None)
+        else:
+            os.environ[_HOT_SKILLS_ENV] = previous
+    return True
+
+
+def report() -> Optional[Dict[str, Any]]:
+    """
+    Preload outcome of the zygote this process was forked from
+
+    Returns:
+        {"preloaded": {name: seconds}, "failed": {name: error},
+         "preload_time", "frozen_objects"}, or None outside a zygote fork
+    """
+    return _report
+
+
+def _preload(hot_skills: Dict[str, str]):
+    """Import the hot skills, then freeze everything loaded so far"""
+    global _report
+
+    from .worker_pool import _load_process_module
+
+    started = time.perf_counter()
+    preloaded: Dict[str, float] = {}
+    failed: Dict[str, str] = {}
+    for name, entry_point in hot_skills.items():
+        skill_started = time.perf_counter()
+        try:
+            _load_process_module(name, entry_point)
+            preloaded[name] = round(time.perf_counter() - skill_started, 6)
+        except Exception as e:
+            failed[name] = f"{type(e).__name__}: {e}"
+
+    gc.collect()
+    gc.freeze()
+    _report = {
+        "preloaded": preloaded,
+        "failed": failed,
+        "preload_time": round(time.perf_counter() - started, 6),
+        "frozen_objects": gc.get_freeze_count()
+    }
+
+
+# Runs only in the fork server, which imports this module last in its
+# preload list (worker_pool is complete by then; see start())
+if _HOT_SKILLS_ENV in os.environ:
+    _preload(json.loads(os.environ.pop(_HOT_SKILLS_ENV)))
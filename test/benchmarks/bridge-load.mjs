@@ -0,0 +1,599 @@
+/**
+ * Benchmark de carga e latência dos bridges Python
+ *
+ * Alvos (cada um em um processo próprio, via pipes reais):
+ * - skills-bridge: servers/skills/bridge.py (JSON por linha no stdin/stdout)
+ * - python-server: core/python_server.py via PythonBridge (core/python-bridge.js)
+ * - executor: SkillExecutor chamado direto em um processo Python (sem o
+ *   protocolo; a diferença para o skills-bridge é o custo do pipe)
+ *
+ * Cenários: test-skill e heavy-task-skill (test/fixtures) e skills
+ * sintéticas com resultado grande (string e lista de registros) em cada
+ * tamanho de payload. As skills rodam de um diretório temporário
+ * (MCP_SKILLS_PATH). Cada cenário é uma carga em malha fechada: N
+ * requisições simultâneas, a próxima sai quando uma termina.
+ *
+ * Por cenário: req/s, latência (média, p50, p95, p99, máx), erros e RSS
+ * da árvore de processos do alvo. O resultado completo vai para um JSON
+ * (test/benchmarks/results/) e pode ser comparado com um baseline salvo.
+ *
+ * Uso: node test/benchmarks/bridge-load.mjs [opções]
+ *   --targets skills-bridge,python-server,executor
+ *   --concurrency 1,8,32         Requisições simultâneas
+ *   --payloads 1024,65536,1048576  Tamanhos (bytes) dos resultados grandes
+ *   --requests 200               Requisições medidas por cenário
+ *   --warmup 20                  Requisições de aquecimento por cenário
+ *   --iterations 200             Parâmetro da heavy-task-skill
+ *   --output <arquivo>           Onde gravar o JSON dos resultados
+ *   --save-baseline [arquivo]    Grava os resultados também como baseline
+ *   --baseline [arquivo]         Compara com o baseline (sai com 1 se regredir)
+ *   --threshold 0.15             Piora relativa tolerada na comparação
+ *
+ * Baseline padrão: test/benchmarks/baselines/bridge-load.json. Os números
+ * dependem da máquina: compare somente com baselines gerados nela.
+ */
+
+import { spawn, execFileSync } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { PythonBridge } from '../../core/python-bridge.js';
+import messageFraming from '../../core/message-framing.cjs';
+
+const { MessageDecoder, readSpooledMessage } = messageFraming;
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const FIXTURES = path.join(ROOT, 'test', 'fixtures');
+const DEFAULT_BASELINE = path.join(__dirname, 'baselines', 'bridge-load.json');
+const RESULTS_DIR = path.join(__dirname, 'results');
+
+const TARGETS = ['skills-bridge', 'python-server', 'executor'];
+
+const DEFAULTS = {
+  targets: TARGETS,
+  concurrency: [1, 8, 32],
+  payloads: [1024, 65536, 1048576],
+  requests: 200,
+  warmup: 20,
+  iterations: 200,
+  threshold: 0.15
+};
+
+// Bytes aproximados de um registro das skills sintéticas, em JSON
+const RECORD_BYTES = 56;
+
+const RECORDS_EXPRESSION =
+  '[{"id": i, "name": f"record-{i:08d}", "value": i * 0.5} for i in range(max(1, size // %RECORD%))]'
+    .replace('%RECORD%', RECORD_BYTES);
+
+const SYNTHETIC_SKILLS = {
+  'bench-large-blob': `
+def execute(size=1024, **kwargs):
+    """Synthetic benchmark skill: a string of \`size\` bytes"""
+    return "x" * size
+`,
+  'bench-large-records': `
+def execute(size=1024, **kwargs):
+    """Synthetic benchmark skill: about \`size\` bytes of small records"""
+    return ${RECORDS_EXPRESSION}
+`
+};
+
+// Métricas comparadas com o baseline (higher: maior é melhor)
+const COMPARED = [
+  { key: 'throughput', label: 'req/s', higher: true },
+  { key: 'p50', label: 'p50', higher: false },
+  { key: 'p95', label: 'p95', higher: false },
+  { key: 'rssMb', label: 'RSS', higher: false }
+];
+
+// SkillExecutor direto: lê um cenário (JSON) por linha e responde as latências
+const EXECUTOR_DRIVER = `
+import sys, json, time, asyncio
+from servers.skills.executor import SkillExecutor
+
+async def load(executor, scenario, count):
+    latencies, errors = [], 0
+    remaining = count
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter_ns()
+            response = await executor.execute_skill(scenario["skill"], scenario["params"])
+            latencies.append((time.perf_counter_ns() - start) / 1e6)
+            if not response.get("success"):
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(scenario["concurrency"])))
+    return latencies, errors, time.perf_counter() - start
+
+loop = asyncio.new_event_loop()
+executor = SkillExecutor()
+print(json.dumps({"type": "ready"}), flush=True)
+for line in sys.stdin:
+    scenario = json.loads(line)
+    loop.run_until_complete(load(executor, scenario, scenario["warmup"]))
+    latencies, errors, wall = loop.run_until_complete(load(executor, scenario, scenario["requests"]))
+    print(json.dumps({"latencies": latencies, "errors": errors, "wall": wall}), flush=True)
+executor.shutdown()
+`;
+
+function parseArgs(argv) {
+  const options = { ...DEFAULTS, output: null, baseline: null, saveBaseline: null };
+  const lists = ['targets', 'concurrency', 'payloads'];
+  const numbers = ['requests', 'warmup', 'iterations', 'threshold'];
+
+  for (let i = 0; i < argv.length; i++) {
+    const [flag, inline] = argv[i].split('=', 2);
+    const name = flag.replace(/^--/, '').replace(/-([a-z])/g, (_, c) => c.toUpperCase());
+    const next = () => {
+      if (inline !== undefined) {
+        return inline;
+      }
+      return argv[i + 1] !== undefined && !argv[i + 1].startsWith('--') ? argv[++i] : undefined;
+    };
+
+    if (lists.includes(name)) {
+      const values = next().split(',').filter(Boolean);
+      options[name] = name === 'targets' ? values : values.map(Number);
+    } else if (numbers.includes(name)) {
+      options[name] = Number(next());
+    } else if (name === 'output') {
+      options.output = next();
+    } else if (name === 'baseline' || name === 'saveBaseline') {
+      options[name] = next() || DEFAULT_BASELINE;
+    } else {
+      throw new Error(`Opção desconhecida: ${argv[i]}`);
+    }
+  }
+
+  const unknown = options.targets.filter((target) => !TARGETS.includes(target));
+  if (unknown.length > 0) {
+    throw new Error(`Alvo desconhecido: ${unknown.join(', ')} (disponíveis: ${TARGETS.join(', ')})`);
+  }
+  return options;
+}
+
+/**
+ * Diretório temporário de skills: fixtures + skills sintéticas
+ */
+function createSkillsDirectory() {
+  const directory = fs.mkdtempSync(path.join(os.tmpdir(), 'mcp-bench-skills-'));
+  for (const name of ['test-skill', 'heavy-task-skill']) {
+    fs.cpSync(path.join(FIXTURES, name), path.join(directory, name), { recursive: true });
+  }
+  for (const [name, source] of Object.entries(SYNTHETIC_SKILLS)) {
+    fs.mkdirSync(path.join(directory, name));
+    fs.writeFileSync(path.join(directory, name, 'index.py'), source.trimStart());
+  }
+  return directory;
+}
+
+function skillScenarios(options) {
+  return [
+    { name: 'test-skill', skill: 'test-skill', params: { name: 'bench' } },
+    { name: 'heavy-task-skill', skill: 'heavy-task-skill', params: { iterations: options.iterations } },
+    ...options.payloads.flatMap((size) => [
+      { name: 'large-blob', payload: size, skill: 'bench-large-blob', params: { size } },
+      { name: 'large-records', payload: size, skill: 'bench-large-records', params: { size } }
+    ])
+  ];
+}
+
+function pythonServerScenarios(options) {
+  return [
+    { name: 'eval', code: 'x * 2', context: { x: 21 } },
+    ...options.payloads.flatMap((size) => [
+      { name: 'large-blob', payload: size, code: `"x" * ${size}` },
+      { name: 'large-records', payload: size, code: RECORDS_EXPRESSION.replace('size', size) }
+    ])
+  ];
+}
+
+/**
+ * RSS (MB) do processo e de todos os descendentes (workers)
+ *
+ * Linux: /proc/<pid>/status e .../children; outros sistemas: `ps` (só o pid).
+ */
+function processTreeRss(pid) {
+  const procStatus = `/proc/${pid}/status`;
+  if (!fs.existsSync(procStatus)) {
+    try {
+      return Number(execFileSync('ps', ['-o', 'rss=', '-p', String(pid)]).toString().trim()) / 1024;
+    } catch {
+      return null;
+    }
+  }
+
+  let totalKb = 0;
+  const pending = [pid];
+  while (pending.length > 0) {
+    const current = pending.pop();
+    try {
+      const status = fs.readFileSync(`/proc/${current}/status`, 'utf8');
+      totalKb += Number((status.match(/^VmRSS:\s+(\d+)/m) || [0, 0])[1]);
+      for (const task of fs.readdirSync(`/proc/${current}/task`)) {
+        const children = fs.readFileSync(`/proc/${current}/task/${task}/children`, 'utf8').trim();
+        if (children) {
+          pending.push(...children.split(/\s+/).map(Number));
+        }
+      }
+    } catch {
+      // Processo terminou durante a leitura
+    }
+  }
+  return totalKb / 1024;
+}
+
+/**
+ * Carga em malha fechada: `concurrency` laços enviando `count` requisições
+ * @returns {Promise<{latencies: number[], errors: number, wall: number}>}
+ */
+async function runLoad(send, count, concurrency) {
+  const latencies = [];
+  let errors = 0;
+  let remaining = count;
+
+  const worker = async () => {
+    while (remaining > 0) {
+      remaining--;
+      const start = process.hrtime.bigint();
+      try {
+        await send();
+      } catch {
+        errors++;
+      }
+      latencies.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+  };
+
+  const start = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: concurrency }, worker));
+  return { latencies, errors, wall: Number(process.hrtime.bigint() - start) / 1e9 };
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) {
+    return 0;
+  }
+  return sorted[Math.min(sorted.length - 1, Math.ceil(sorted.length * p) - 1)];
+}
+
+function summarize(target, scenario, concurrency, { latencies, errors, wall }, rssMb) {
+  const sorted = [...latencies].sort((a, b) => a - b);
+  const round = (value) => Math.round(value * 1000) / 1000;
+  const id = [target, scenario.name, `c${concurrency}`]
+    .concat(scenario.payload ? [`${scenario.payload}B`] : [])
+    .join('/');
+
+  return {
+    id,
+    target,
+    scenario: scenario.name,
+    concurrency,
+    payload: scenario.payload || null,
+    requests: latencies.length,
+    errors,
+    throughput: round(latencies.length / wall),
+    mean: round(sorted.reduce((sum, value) => sum + value, 0) / (sorted.length || 1)),
+    p50: round(percentile(sorted, 0.5)),
+    p95: round(percentile(sorted, 0.95)),
+    p99: round(percentile(sorted, 0.99)),
+    max: round(sorted[sorted.length - 1] || 0),
+    rssMb: rssMb === null ? null : round(rssMb)
+  };
+}
+
+/**
+ * Cliente mínimo do servers/skills/bridge.py (requestId → resposta)
+ */
+class SkillsBridgeClient {
+  constructor(env) {
+    this.pending = new Map();
+    this.nextId = 0;
+    this.process = spawn(process.env.PYTHON_PATH || 'python3', ['-m', 'servers.skills.bridge'], {
+      cwd: ROOT,
+      env,
+      stdio: ['pipe', 'pipe', 'inherit']
+    });
+    this.decoder = new MessageDecoder();
+    this.ready = new Promise((resolve) => this.pending.set(undefined, resolve));
+    this.process.stdout.on('data', (data) => this.decoder.push(data, (message) => this._onMessage(message)));
+  }
+
+  _onMessage(message) {
+    if (message.type === 'spool') {
+      const handle = message.spool.id;
+      message = readSpooledMessage(message);
+      this.process.stdin.write(JSON.stringify({ action: 'spool_release', handle }) + '\n');
+    }
+    if (message.type === 'chunk') {
+      return;
+    }
+    const key = message.type === 'ready' ? undefined : message.requestId;
+    const resolve = this.pending.get(key);
+    if (resolve) {
+      this.pending.delete(key);
+      resolve(message);
+    }
+  }
+
+  async execute(skill, params) {
+    const requestId = `b-${this.nextId++}`;
+    const response = await new Promise((resolve) => {
+      this.pending.set(requestId, resolve);
+      this.process.stdin.write(JSON.stringify({ action: 'execute', skill, params, requestId }) + '\n');
+    });
+    if (response.success === false) {
+      throw new Error(response.error);
+    }
+    return response.result;
+  }
+
+  close() {
+    return new Promise((resolve) => {
+      this.process.on('exit', resolve);
+      this.process.stdin.end();
+    });
+  }
+}
+
+/**
+ * Processo Python que executa o SkillExecutor direto (EXECUTOR_DRIVER)
+ */
+class ExecutorDriver {
+  constructor(env) {
+    this.process = spawn(process.env.PYTHON_PATH || 'python3', ['-c', EXECUTOR_DRIVER], {
+      cwd: ROOT,
+      env,
+      stdio: ['pipe', 'pipe', 'inherit']
+    });
+    this.waiting = [];
+    this.decoder = new MessageDecoder();
+    this.process.stdout.on('data', (data) => {
+      this.decoder.push(data, (message) => this.waiting.shift()(message));
+    });
+    this.ready = this._next();
+  }
+
+  _next() {
+    return new Promise((resolve) => this.waiting.push(resolve));
+  }
+
+  run(scenario, concurrency, options) {
+    const reply = this._next();
+    this.process.stdin.write(JSON.stringify({
+      skill: scenario.skill,
+      params: scenario.params,
+      concurrency,
+      warmup: options.warmup,
+      requests: options.requests
+    }) + '\n');
+    return reply;
+  }
+
+  close() {
+    return new Promise((resolve) => {
+      this.process.on('exit', resolve);
+      this.process.stdin.end();
+    });
+  }
+}
+
+async function benchmarkSkillsBridge(options, env, report) {
+  const client = new SkillsBridgeClient(env);
+  await client.ready;
+  try {
+    for (const scenario of skillScenarios(options)) {
+      for (const concurrency of options.concurrency) {
+        const send = () => client.execute(scenario.skill, scenario.params);
+        await runLoad(send, options.warmup, concurrency);
+        const load = await runLoad(send, options.requests, concurrency);
+        report(summarize('skills-bridge', scenario, concurrency, load, processTreeRss(client.process.pid)));
+      }
+    }
+  } finally {
+    await client.close();
+  }
+}
+
+async function benchmarkPythonServer(options, report) {
+  const bridge = new PythonBridge({});
+  await bridge.initialize();
+  try {
+    for (const scenario of pythonServerScenarios(options)) {
+      for (const concurrency of options.concurrency) {
+        const send = () => bridge.execute(scenario.code, scenario.context || {});
+        await runLoad(send, options.warmup, concurrency);
+        const load = await runLoad(send, options.requests, concurrency);
+        report(summarize('python-server', scenario, concurrency, load, processTreeRss(bridge.pythonProcess.pid)));
+      }
+    }
+  } finally {
+    await bridge.cleanup();
+  }
+}
+
+async function benchmarkExecutor(options, env, report) {
+  const driver = new ExecutorDriver(env);
+  await driver.ready;
+  try {
+    for (const scenario of skillScenarios(options)) {
+      for (const concurrency of options.concurrency) {
+        const load = await driver.run(scenario, concurrency, options);
+        report(summarize('executor', scenario, concurrency, load, processTreeRss(driver.process.pid)));
+      }
+    }
+  } finally {
+    await driver.close();
+  }
+}
+
+function environment() {
+  let python = null;
+  try {
+    python = execFileSync(process.env.PYTHON_PATH || 'python3', ['--version']).toString().trim();
+  } catch {
+    // Sem Python no PATH: os alvos falham logo em seguida
+  }
+  return {
+    node: process.version,
+    python,
+    platform: `${process.platform}-${process.arch}`,
+    cpus: os.cpus().length,
+    cpuModel: os.cpus()[0]?.model || null,
+    totalMemoryMb: Math.round(os.totalmem() / 1048576)
+  };
+}
+
+function printRow(row) {
+  const cells = [
+    row.id.padEnd(52),
+    row.throughput.toFixed(1).padStart(10),
+    row.p50.toFixed(2).padStart(9),
+    row.p95.toFixed(2).padStart(9),
+    row.p99.toFixed(2).padStart(9),
+    (row.rssMb === null ? '-' : row.rssMb.toFixed(1)).padStart(8),
+    String(row.errors).padStart(6)
+  ];
+  console.log(`   ${cells.join('')}`);
+}
+
+/**
+ * Compara com o baseline
+ * @returns {Array<Object>} Regressões acima do limite
+ */
+function compareWithBaseline(results, baseline, threshold) {
+  const previous = new Map(baseline.results.map((row) => [row.id, row]));
+  const regressions = [];
+
+  console.log(`\n   Comparação com o baseline de ${baseline.createdAt} (limite ${(threshold * 100).toFixed(0)}%)\n`);
+  for (const row of results) {
+    const old = previous.get(row.id);
+    if (!old) {
+      console.log(`   ${row.id.padEnd(52)} sem baseline`);
+      continue;
+    }
+
+    const deltas = [];
+    for (const { key, label, higher } of COMPARED) {
+      if (row[key] === null || old[key] === null || !old[key]) {
+        continue;
+      }
+      const change = (row[key] - old[key]) / old[key];
+      const worse = higher ? -change : change;
+      deltas.push(`${label} ${change >= 0 ? '+' : ''}${(change * 100).toFixed(1)}%`);
+      if (worse > threshold) {
+        regressions.push({ id: row.id, metric: key, baseline: old[key], current: row[key], change });
+      }
+    }
+    console.log(`   ${row.id.padEnd(52)} ${deltas.join('  ')}`);
+  }
+
+  if (regressions.length > 0) {
+    console.log('\n   ❌ Regressões:');
+    for (const { id, metric, baseline: before, current, change } of regressions) {
+      console.log(`      ${id} ${metric}: ${before} → ${current} (${(change * 100).toFixed(1)}%)`);
+    }
+  } else {
+    console.log('\n   ✅ Sem regressões acima do limite');
+  }
+  return regressions;
+}
+
+function writeJson(file, data) {
+  fs.mkdirSync(path.dirname(file), { recursive: true });
+  fs.writeFileSync(file, JSON.stringify(data, null, 2) + '\n');
+}
+
+async function run() {
+  const options = parseArgs(process.argv.slice(2));
+  process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+
+  const skillsPath = createSkillsDirectory();
+  const env = { ...process.env, MCP_SKILLS_PATH: skillsPath };
+
+  console.log('═══════════════════════════════════════════════════════');
+  console.log('   Bridges Python - carga e latência');
+  console.log('═══════════════════════════════════════════════════════\n');
+  console.log(
+    `   concorrência ${options.concurrency.join(',')} | payloads ${options.payloads.join(',')} B | ` +
+    `${options.requests} requisições (+${options.warmup} de aquecimento)\n`
+  );
+  console.log(
+    `   ${'cenário'.padEnd(52)}${'req/s'.padStart(10)}${'p50 ms'.padStart(9)}` +
+    `${'p95 ms'.padStart(9)}${'p99 ms'.padStart(9)}${'RSS MB'.padStart(8)}${'erros'.padStart(6)}`
+  );
+
+  const results = [];
+  const report = (row) => {
+    results.push(row);
+    printRow(row);
+  };
+
+  try {
+    if (options.targets.includes('skills-bridge')) {
+      await benchmarkSkillsBridge(options, env, report);
+    }
+    if (options.targets.includes('python-server')) {
+      await benchmarkPythonServer(options, report);
+    }
+    if (options.targets.includes('executor')) {
+      await benchmarkExecutor(options, env, report);
+    }
+  } finally {
+    fs.rmSync(skillsPath, { recursive: true, force: true });
+  }
+
+  const output = {
+    benchmark: 'bridge-load',
+    version: 1,
+    createdAt: new Date().toISOString(),
+    environment: environment(),
+    config: {
+      targets: options.targets,
+      concurrency: options.concurrency,
+      payloads: options.payloads,
+      requests: options.requests,
+      warmup: options.warmup,
+      iterations: options.iterations
+    },
+    results
+  };
+
+  const outputPath = options.output ||
+    path.join(RESULTS_DIR, `bridge-load-${output.createdAt.replace(/[:.]/g, '-')}.json`);
+  writeJson(outputPath, output);
+  console.log(`\n   Resultados: ${path.relative(process.cwd(), outputPath)}`);
+
+  if (options.saveBaseline) {
+    writeJson(options.saveBaseline, output);
+    console.log(`   Baseline salvo: ${path.relative(process.cwd(), options.saveBaseline)}`);
+  }
+
+  if (options.baseline) {
+    if (!fs.existsSync(options.baseline)) {
+      throw new Error(`Baseline não encontrado: ${options.baseline} (gere com --save-baseline)`);
+    }
+    const baseline = JSON.parse(fs.readFileSync(options.baseline, 'utf8'));
+    const regressions = compareWithBaseline(results, baseline, options.threshold);
+    if (regressions.length > 0) {
+      process.exitCode = 1;
+    }
+  }
+
+  if (results.some((row) => row.errors > 0)) {
+    console.log('\n   ⚠️  Houve erros em algum cenário (coluna "erros")');
+    process.exitCode = 1;
+  }
+}
+
+run().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,80 @@
+/**
+ * Microbenchmark - Overhead por execução vs. tamanho do namespace
+ *
+ * Cada tamanho usa uma sessão própria, preenchida com N variáveis; em
+ * seguida mede a latência de execuções triviais. Com o namespace em
+ * camadas a latência deve ficar estável (sem cópia do namespace por
+ * chamada nem varredura de todas as variáveis ao final).
+ *
+ * Uso: node test/benchmarks/namespace-overhead.mjs [iterações]
+ */
+
+import { PythonBridge } from '../../core/python-bridge.js';
+
+const SIZES = [0, 1000, 10000, 100000];
+const ITERATIONS = parseInt(process.argv[2], 10) || 500;
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
+async function run() {
+  process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+  const bridge = new PythonBridge({});
+  await bridge.initialize();
+
+  console.log('═══════════════════════════════════════════════════════');
+  console.log('   Namespace overhead (latência por execução)');
+  console.log('═══════════════════════════════════════════════════════\n');
+
+  const rows = [];
+  try {
+    for (const size of SIZES) {
+      const session = `bench-${size}`;
+      await bridge.createSession(session);
+      const filled = await bridge.execute(
+        `for i in range(${size}):\n    globals()[f"var_{i}"] = i\nlen(globals())`, {}, { session }
+      );
+      if (filled < size) {
+        throw new Error(`Sessão ${session} ficou com ${filled} variáveis`);
+      }
+
+      // Aquecimento (compilação em cache, JIT do V8)
+      for (let i = 0; i < 50; i++) {
+        await bridge.execute('y = x + 1\ny', { x: i }, { session });
+      }
+
+      const samples = [];
+      for (let i = 0; i < ITERATIONS; i++) {
+        const start = process.hrtime.bigint();
+        await bridge.execute('y = x + 1\ny', { x: i }, { session });
+        samples.push(Number(process.hrtime.bigint() - start) / 1000);
+      }
+      samples.sort((a, b) => a - b);
+
+      const mean = samples.reduce((a, b) => a + b, 0) / samples.length;
+      rows.push({ size, mean, p50: percentile(samples, 0.5), p95: percentile(samples, 0.95) });
+      await bridge.dropSession(session);
+    }
+  } finally {
+    await bridge.cleanup();
+  }
+
+  console.log('   variáveis    média (µs)    p50 (µs)    p95 (µs)');
+  for (const row of rows) {
+    console.log(
+      `   ${String(row.size).padStart(9)}` +
+      `${row.mean.toFixed(1).padStart(14)}` +
+      `${row.p50.toFixed(1).padStart(12)}` +
+      `${row.p95.toFixed(1).padStart(12)}`
+    );
+  }
+
+  const ratio = rows[rows.length - 1].p50 / rows[0].p50;
+  console.log(`\n   p50 com ${SIZES[SIZES.length - 1]} variáveis / vazio: ${ratio.toFixed(2)}x`);
+}
+
+run().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,70 @@
+"""
+Stub Guardrails checker CLI
+Used by the tests of servers/security/guardrails (replaces CHECKER_CMD)
+
+Usage: checker.py validate|scan [--rules JSON] [--batch] --input -|PATH
+
+Every non-empty input line is one part (with --batch, each line is a JSON
+string: one text of the batch). A result is printed for each
+(pretty-printed JSON, written in small pieces), with "valid"/"issues"
+("forbidden" in the text is an issue), its length and where the input
+came from ("input": "stdin" or the file path).
+
+Environment:
+- STUB_CHECKER_NO_STDIN=1: fail on "--input -" without output (a checker
+  that cannot read stdin)
+- STUB_CHECKER_NO_BATCH=1: reject --batch (a checker without batch mode)
+- STUB_CHECKER_LOG=path: append the arguments of every run (one JSON line)
+"""
+
+import os
+import sys
+import json
+
+
+def main(argv):
+    command = argv[0]
+    source = argv[argv.index("--input") + 1]
+
+    log = os.environ.get("STUB_CHECKER_LOG")
+    if log:
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(json.dumps(argv) + "\n")
+
+    if "--batch" in argv and os.environ.get("STUB_CHECKER_NO_BATCH") == "1":
+        sys.stderr.write("error: unrecognized arguments: --batch\n")
+        return 2
+
+    if source == "-":
+        if os.environ.get("STUB_CHECKER_NO_STDIN") == "1":
+            sys.stderr.write("error: --input - is not supported\n")
+            return 2
+        lines = sys.stdin.buffer
+        origin = "stdin"
+    else:
+        lines = open(source, "rb")
+        origin = source
+
+    out = sys.stdout
+    for raw in lines:
+        line = raw.decode("utf-8").rstrip("\n")
+        if not line:
+            continue
+        if "--batch" in argv:
+            line = json.loads(line)
+        issues = [{"type": "forbidden"}] if "forbidden" in line else []
+        if command == "scan":
+            result = {"issues": issues, "risk_level": "high" if issues else "low"}
+        else:
+            result = {"valid": not issues, "issues": issues, "score": 1.0}
+        result.update({"length": len(line), "input": origin})
+
+        text = json.dumps(result, indent=2)
+        for start in range(0, len(text), 7):
+            out.write(text[start:start + 7])
+            out.flush()
+        out.write("\n")
+    return 0
+
+
+sys.exit(main(sys.argv[1:]))
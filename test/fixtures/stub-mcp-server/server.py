@@ -0,0 +1,94 @@
+"""
+Stub MCP server (stdio, JSON-RPC 2.0 one message per line)
+Used by the tests of servers/_mcp_session.py
+
+Tools:
+- echo: returns its arguments
+- pid: returns the server process id
+- sleep: waits "seconds" in a worker thread (concurrency tests)
+- fail: returns a tool result with isError
+- exit: terminates the server without answering
+- run-actor / get-dataset / validate / scan: canned backend responses
+  (get-dataset with datasetId "range-<n>" pages over n items by offset/limit)
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+
+_write_lock = threading.Lock()
+
+
+def send(message):
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def text_result(value, is_error=False):
+    return {
+        "content": [{"type": "text", "text": json.dumps(value)}],
+        "isError": is_error
+    }
+
+
+def call_tool(name, arguments):
+    if name == "echo":
+        return text_result(arguments)
+    if name == "pid":
+        return text_result(os.getpid())
+    if name == "sleep":
+        time.sleep(arguments.get("seconds", 0.1))
+        return text_result({"slept": arguments.get("seconds", 0.1)})
+    if name == "fail":
+        return text_result("tool failed", is_error=True)
+    if name == "exit":
+        os._exit(3)
+    if name == "run-actor":
+        return text_result({"actor": arguments.get("actor"), "items": [1, 2, 3]})
+    if name == "get-dataset":
+        dataset_id = arguments.get("datasetId", "")
+        if dataset_id.startswith("range-"):
+            total = int(dataset_id[len("range-"):])
+            offset = arguments.get("offset", 0)
+            end = min(total, offset + arguments.get("limit", total))
+            return text_result({"items": [{"id": i} for i in range(offset, end)],
+                                "offset": offset, "total": total})
+        return text_result([{"id": 1}, {"id": 2}])
+    if name == "validate":
+        text = arguments.get("text", "")
+        return text_result({"valid": "forbidden" not in text, "issues": [], "score": 1.0, "length": len(text)})
+    if name == "scan":
+        return text_result({"issues": [], "risk_level": "low", "recommendations": []})
+    raise KeyError(name)
+
+
+def handle(message):
+    method = message.get("method")
+    request_id = message.get("id")
+
+    if method == "initialize":
+        send({"jsonrpc": "2.0", "id": request_id, "result": {
+            "protocolVersion": message["params"]["protocolVersion"],
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "stub-mcp-server", "version": "1.0.0"}
+        }})
+    elif method == "tools/call":
+        params = message.get("params", {})
+        try:
+            result = call_tool(params.get("name"), params.get("arguments", {}))
+            send({"jsonrpc": "2.0", "id": request_id, "result": result})
+        except KeyError as e:
+            send({"jsonrpc": "2.0", "id": request_id,
+                  "error": {"code": -32602, "message": f"Unknown tool: {e}"}})
+    elif request_id is not None:
+        send({"jsonrpc": "2.0", "id": request_id,
+              "error": {"code": -32601, "message": "Method not found"}})
+
+
+for line in sys.stdin:
+    line = line.strip()
+    if line:
+        threading.Thread(target=handle, args=(json.loads(line),), daemon=True).start()
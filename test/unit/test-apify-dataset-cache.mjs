@@ -0,0 +1,210 @@
+/**
+ * @fileoverview Testes unitários para o cache local de datasets (servers/scraping/apify/_dataset_cache.py)
+ * @module test/unit/test-apify-dataset-cache
+ * @description Executa cached_dataset/get_dataset em um processo Python com
+ * um dataset em memória que cresce entre as sincronizações.
+ */
+
+import { describe, it, beforeEach, afterEach } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+describe('Apify - Cache Local de Datasets', function() {
+  this.timeout(30000);
+
+  let dir;
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'apify-dataset-cache-'));
+  });
+
+  afterEach(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  /**
+   * Executa corpo async Python e retorna o JSON impresso
+   *
+   * `ITEMS` é o conteúdo atual do dataset; `requests` registra offset/limit
+   * de cada página pedida.
+   */
+  function runPython(body) {
+    const script = [
+      'import os, sys, json, types, asyncio',
+      `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+      '# servers/scraping/__init__.py também importa crawl4ai (fora desta árvore)',
+      'package = types.ModuleType("servers.scraping")',
+      `package.__path__ = [${JSON.stringify(path.join(ROOT, 'servers', 'scraping'))}]`,
+      'sys.modules["servers.scraping"] = package',
+      'from servers.scraping.apify import get_dataset, cached_dataset',
+      'from servers.scraping.apify._dataset_cache import DatasetCache, cache_key',
+      'module = sys.modules["servers.scraping.apify.get_dataset"]',
+      `CACHE_DIR = ${JSON.stringify(dir)}`,
+      'ITEMS = []',
+      'requests = []',
+      'async def fake_fetch(dataset_id, options=None):',
+      '    requests.append((options["offset"], options["limit"]))',
+      '    offset = options["offset"]',
+      '    return {"items": ITEMS[offset:offset + options["limit"]], "offset": offset, "total": len(ITEMS)}',
+      'module._fetch = fake_fetch',
+      'async def main():',
+      ...body.trim().split('\n').map(line => `    ${line}`),
+      'print(json.dumps(asyncio.run(main())))'
+    ].join('\n');
+
+    return new Promise((resolve, reject) => {
+      execFile(PYTHON, ['-c', script], { timeout: 20000 }, (error, stdout, stderr) => {
+        if (error) {
+          reject(new Error(stderr || error.message));
+          return;
+        }
+        resolve(JSON.parse(stdout.trim().split('\n').pop()));
+      });
+    });
+  }
+
+  it('deve baixar apenas os itens novos a cada sincronização', async () => {
+    const result = await runPython(`
+ITEMS.extend({"id": i, "name": "item %d" % i} for i in range(25))
+with await cached_dataset("ds-1", cache_dir=CACHE_DIR, page_size=10) as dataset:
+    first = {"length": len(dataset), "requests": list(requests)}
+
+requests.clear()
+ITEMS.extend({"id": i, "name": "item %d" % i} for i in range(25, 32))
+with await cached_dataset("ds-1", cache_dir=CACHE_DIR, page_size=10) as dataset:
+    second = {"length": len(dataset), "requests": list(requests), "ids": [item["id"] for item in dataset]}
+return {"first": first, "second": second}
+`);
+
+    expect(result.first.length).to.equal(25);
+    expect(result.first.requests[0]).to.deep.equal([0, 10]);
+    expect(result.second.length).to.equal(32);
+    // A segunda abertura começa no primeiro item que não estava em cache
+    expect(result.second.requests[0]).to.deep.equal([25, 10]);
+    expect(result.second.ids).to.deep.equal(Array.from({ length: 32 }, (_, i) => i));
+  });
+
+  it('deve dar acesso aleatório por índice sem sincronizar com sync=False', async () => {
+    const result = await runPython(`
+ITEMS.extend({"id": i, "text": "ção %d" % i} for i in range(5))
+(await cached_dataset("ds-2", cache_dir=CACHE_DIR)).close()
+requests.clear()
+with await cached_dataset("ds-2", cache_dir=CACHE_DIR, sync=False) as dataset:
+    try:
+        dataset[5]
+        out_of_range = None
+    except IndexError as e:
+        out_of_range = str(e)
+    return {"third": dataset[3], "last": dataset[-1], "raw": bytes(dataset.raw(1)).decode("utf-8"),
+            "slice": list(dataset.slice(1, 3)), "requests": requests, "out_of_range": out_of_range}
+`);
+
+    expect(result.third).to.deep.equal({ id: 3, text: 'ção 3' });
+    expect(result.last.id).to.equal(4);
+    expect(JSON.parse(result.raw)).to.deep.equal({ id: 1, text: 'ção 1' });
+    expect(result.slice.map(item => item.id)).to.deep.equal([1, 2]);
+    expect(result.requests).to.deep.equal([]);
+    expect(result.out_of_range).to.include('out of range');
+  });
+
+  it('deve descartar o final de uma gravação interrompida ao reabrir', async () => {
+    const result = await runPython(`
+prefix = os.path.join(CACHE_DIR, "partial")
+with DatasetCache(prefix) as dataset:
+    dataset.append([{"id": 0}, {"id": 1}])
+# Dados sem índice e índice incompleto, como após uma queda durante append()
+with open(prefix + ".jsonl", "ab") as f:
+    f.write(b'{"id": 2}\\n{"id"')
+with open(prefix + ".idx", "ab") as f:
+    f.write(b"\\x00\\x01\\x02")
+with DatasetCache(prefix) as dataset:
+    recovered = [item["id"] for item in dataset]
+    dataset.append([{"id": 2}])
+    appended = [item["id"] for item in dataset]
+return {"recovered": recovered, "appended": appended, "idx_size": os.path.getsize(prefix + ".idx")}
+`);
+
+    expect(result.recovered).to.deep.equal([0, 1]);
+    expect(result.appended).to.deep.equal([0, 1, 2]);
+    expect(result.idx_size).to.equal(24);
+  });
+
+  it('deve manter o índice consistente com duas instâncias gravando no mesmo cache', async () => {
+    const result = await runPython(`
+prefix = os.path.join(CACHE_DIR, "shared")
+first, second = DatasetCache(prefix), DatasetCache(prefix)
+first.append([{"id": 0}, {"id": 1}])
+second.append([{"id": 2}, {"id": 3}])
+# Itens que outra instância já gravou (mesmo start) não são duplicados
+skipped = first.append([{"id": 2}, {"id": 3}, {"id": 4}], start=2)
+first.close()
+second.close()
+with DatasetCache(prefix) as dataset:
+    return {"length": len(dataset), "ids": [item["id"] for item in dataset], "skipped": skipped}
+`);
+
+    expect(result.length).to.equal(5);
+    expect(result.ids).to.deep.equal([0, 1, 2, 3, 4]);
+    expect(result.skipped).to.equal(1);
+  });
+
+  it('deve serializar sincronizações concorrentes do mesmo dataset', async () => {
+    const result = await runPython(`
+ITEMS.extend({"id": i} for i in range(25))
+datasets = await asyncio.gather(*(cached_dataset("ds-5", cache_dir=CACHE_DIR, page_size=10) for _ in range(3)))
+lengths = [len(dataset) for dataset in datasets]
+for dataset in datasets:
+    dataset.close()
+with await cached_dataset("ds-5", cache_dir=CACHE_DIR, sync=False) as dataset:
+    return {"lengths": lengths, "ids": [item["id"] for item in dataset],
+            "offsets": [offset for offset, _ in requests]}
+`);
+
+    expect(result.lengths).to.deep.equal([25, 25, 25]);
+    expect(result.ids).to.deep.equal(Array.from({ length: 25 }, (_, i) => i));
+    // Só a primeira sincronização baixa os itens; as outras começam no fim do cache
+    expect(result.offsets.filter(offset => offset < 25)).to.deep.equal([0, 10, 20]);
+  });
+
+  it('deve separar o cache por opções e recusar offset/limit', async () => {
+    const result = await runPython(`
+try:
+    await cached_dataset("ds-3", {"offset": 10}, cache_dir=CACHE_DIR)
+    error = None
+except ValueError as e:
+    error = str(e)
+return {"error": error, "plain": cache_key("ds/3"),
+        "fields": cache_key("ds/3", {"fields": ["a"]}) != cache_key("ds/3", {"fields": ["b"]})}
+`);
+
+    expect(result.error).to.include('offset/limit are not supported');
+    expect(result.plain).to.equal('ds_3');
+    expect(result.fields).to.equal(true);
+  });
+
+  it('deve servir get_dataset(cache=True) a partir do cache', async () => {
+    const result = await runPython(`
+os.environ["APIFY_DATASET_CACHE_DIR"] = CACHE_DIR
+ITEMS.extend({"id": i} for i in range(30))
+first = await get_dataset("ds-4", {"offset": 5, "limit": 3}, cache=True)
+requests.clear()
+second = await get_dataset("ds-4", {"offset": 20}, cache=True)
+return {"first": first, "second": second, "requests": requests}
+`);
+
+    expect(result.first.success).to.equal(true);
+    expect(result.first.data.items.map(item => item.id)).to.deep.equal([5, 6, 7]);
+    expect(result.first.data.total).to.equal(30);
+    expect(result.second.data.count).to.equal(10);
+    // Nada novo: a sincronização começa no fim do cache
+    expect(result.requests[0]).to.deep.equal([30, 1000]);
+  });
+});
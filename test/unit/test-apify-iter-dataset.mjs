@@ -0,0 +1,157 @@
+/**
+ * @fileoverview Testes unitários para iter_dataset (servers/scraping/apify/get_dataset.py)
+ * @module test/unit/test-apify-iter-dataset
+ * @description Executa iter_dataset em um processo Python contra o servidor
+ * MCP stub, cujos datasets "range-<n>" são paginados por offset/limit.
+ */
+
+import { describe, it } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const STUB = path.join(ROOT, 'test', 'fixtures', 'stub-mcp-server', 'server.py');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+/**
+ * Executa corpo async Python com iter_dataset e retorna o JSON impresso
+ *
+ * `requests` registra as opções de cada página pedida (com "cancelled"
+ * quando o pedido foi cancelado); `delay` atrasa cada página, e `delays`
+ * por offset substitui esse atraso.
+ */
+function runPython(body) {
+  const script = [
+    'import sys, json, types, asyncio',
+    `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+    '# servers/scraping/__init__.py também importa crawl4ai (fora desta árvore)',
+    'package = types.ModuleType("servers.scraping")',
+    `package.__path__ = [${JSON.stringify(path.join(ROOT, 'servers', 'scraping'))}]`,
+    'sys.modules["servers.scraping"] = package',
+    'from servers._mcp_session import get_session_manager',
+    'from servers.scraping.apify import iter_dataset',
+    '# O pacote reexporta a função get_dataset com o nome do módulo',
+    'module = sys.modules["servers.scraping.apify.get_dataset"]',
+    'requests = []',
+    'delay = 0',
+    'delays = {}',
+    'fetch = module._fetch',
+    'async def recording_fetch(dataset_id, options=None):',
+    '    request = dict(options)',
+    '    requests.append(request)',
+    '    try:',
+    '        await asyncio.sleep(delays.get(request["offset"], delay))',
+    '        return await fetch(dataset_id, options)',
+    '    except asyncio.CancelledError:',
+    '        request["cancelled"] = True',
+    '        raise',
+    'module._fetch = recording_fetch',
+    'async def main():',
+    '    global delay',
+    '    try:',
+    ...body.trim().split('\n').map(line => `        ${line}`),
+    '    finally:',
+    '        await get_session_manager().close_all()',
+    'print(json.dumps(asyncio.run(main())))'
+  ].join('\n');
+
+  return new Promise((resolve, reject) => {
+    execFile(PYTHON, ['-c', script], {
+      timeout: 20000,
+      env: { ...process.env, MCP_SESSION_APIFY_COMMAND: `${PYTHON} ${STUB}` }
+    }, (error, stdout, stderr) => {
+      if (error) {
+        reject(new Error(stderr || error.message));
+        return;
+      }
+      resolve(JSON.parse(stdout.trim().split('\n').pop()));
+    });
+  });
+}
+
+describe('Apify - iter_dataset', function() {
+  this.timeout(30000);
+
+  it('deve percorrer o dataset inteiro página por página', async () => {
+    const result = await runPython(`
+ids = [item["id"] async for item in iter_dataset("range-2500", page_size=1000)]
+return {"ids": ids, "requests": requests}
+`);
+
+    expect(result.ids).to.deep.equal(Array.from({ length: 2500 }, (_, i) => i));
+    const pages = result.requests.filter(r => r.offset < 2500);
+    expect(pages.map(r => [r.offset, r.limit])).to.deep.equal([[0, 1000], [1000, 1000], [2000, 1000]]);
+    // No máximo uma página lida adiante além do fim
+    expect(result.requests.length - pages.length).to.be.at.most(1);
+  });
+
+  it('deve respeitar offset e limit das opções', async () => {
+    const result = await runPython(`
+ids = [item["id"] async for item in iter_dataset("range-100", page_size=10, options={"offset": 10, "limit": 25})]
+return {"ids": ids, "requests": requests}
+`);
+
+    expect(result.ids).to.deep.equal(Array.from({ length: 25 }, (_, i) => i + 10));
+    expect(result.requests.map(r => [r.offset, r.limit])).to.deep.equal([[10, 10], [20, 10], [30, 5]]);
+  });
+
+  it('deve pedir a próxima página enquanto a atual é consumida', async () => {
+    const result = await runPython(`
+delay = 0.3
+seen = []
+async for item in iter_dataset("range-30", page_size=10, prefetch=2):
+    if item["id"] in (0, 10):
+        # O consumidor demora: as páginas seguintes chegam nesse meio-tempo
+        seen.append(len(requests))
+        await asyncio.sleep(0.5)
+return {"seen": seen}
+`);
+
+    // Na primeira página, a segunda e a terceira já foram pedidas;
+    // ao passar para a segunda, a quarta
+    expect(result.seen).to.deep.equal([3, 4]);
+  });
+
+  it('deve cancelar as páginas lidas adiante quando o consumidor para', async () => {
+    const result = await runPython(`
+# Só a primeira página chega antes de o consumidor parar
+delay = 1
+delays[0] = 0
+items = iter_dataset("range-100", page_size=10, prefetch=2)
+first = [await items.__anext__() for _ in range(5)]
+await items.aclose()
+await asyncio.sleep(0)
+pending = [task for task in asyncio.all_tasks() if task.get_coro().__name__ == "recording_fetch"]
+return {"first": [item["id"] for item in first], "requests": requests, "pending": len(pending)}
+`);
+
+    expect(result.first).to.deep.equal([0, 1, 2, 3, 4]);
+    expect(result.requests).to.have.length(3);
+    expect(result.requests.slice(1).every(r => r.cancelled)).to.equal(true);
+    expect(result.pending).to.equal(0);
+  });
+
+  it('deve propagar a falha de uma página', async () => {
+    const result = await runPython(`
+async def failing_fetch(dataset_id, options=None):
+    if options["offset"] >= 20:
+        raise RuntimeError("page unavailable")
+    return await fetch(dataset_id, options)
+module._fetch = failing_fetch
+ids = []
+try:
+    async for item in iter_dataset("range-100", page_size=10):
+        ids.append(item["id"])
+    error = None
+except RuntimeError as e:
+    error = str(e)
+return {"ids": ids, "error": error}
+`);
+
+    expect(result.ids).to.have.length(20);
+    expect(result.error).to.equal('page unavailable');
+  });
+});
@@ -0,0 +1,158 @@
+/**
+ * @fileoverview Testes unitários para validate_many/scan_many (servers/security/guardrails/_batch.py)
+ * @module test/unit/test-guardrails-batch
+ * @description Executa os lotes em um processo Python contra o servidor MCP
+ * stub (sessão) e contra o checker stub (sem sessão).
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const STUB = path.join(ROOT, 'test', 'fixtures', 'stub-mcp-server', 'server.py');
+const CHECKER = path.join(ROOT, 'test', 'fixtures', 'stub-guardrails-checker', 'checker.py');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+/**
+ * Executa corpo async Python com validate_many/scan_many e retorna o JSON impresso
+ */
+function runPython(body, env = {}) {
+  const script = [
+    'import os, sys, json, types, asyncio',
+    `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+    '# servers/security/__init__.py também importa garak e cipher (fora desta árvore)',
+    'package = types.ModuleType("servers.security")',
+    `package.__path__ = [${JSON.stringify(path.join(ROOT, 'servers', 'security'))}]`,
+    'sys.modules["servers.security"] = package',
+    'from servers._mcp_session import get_session_manager',
+    'from servers.security.guardrails import _stream, validate_many, scan_many',
+    `_stream.CHECKER_CMD = [sys.executable, ${JSON.stringify(CHECKER)}]`,
+    'async def main():',
+    '    try:',
+    ...body.trim().split('\n').map(line => `        ${line}`),
+    '    finally:',
+    '        await get_session_manager().close_all()',
+    'print(json.dumps(asyncio.run(main())))'
+  ].join('\n');
+
+  return new Promise((resolve, reject) => {
+    execFile(PYTHON, ['-c', script], { timeout: 20000, env: { ...process.env, ...env } }, (error, stdout, stderr) => {
+      if (error) {
+        reject(new Error(stderr || error.message));
+        return;
+      }
+      resolve(JSON.parse(stdout.trim().split('\n').pop()));
+    });
+  });
+}
+
+describe('Guardrails - Lotes', function() {
+  this.timeout(30000);
+
+  describe('Com sessão MCP', () => {
+    const env = { MCP_SESSION_GUARDRAILS_COMMAND: `${PYTHON} ${STUB}` };
+
+    it('deve entregar os resultados na ordem de entrada', async () => {
+      const result = await runPython(`
+texts = [("forbidden " if i % 3 == 0 else "") + "text %d" % i for i in range(10)]
+ordered = [(i, r["valid"]) async for i, r in validate_many(texts, batch_size=3, concurrency=2)]
+async def contents():
+    for text in texts:
+        yield text
+unordered = [i async for i, r in scan_many(contents(), batch_size=4, concurrency=3, ordered=False)]
+return {"ordered": ordered, "unordered": unordered, "started": get_session_manager().get_stats()["started"]}
+`, env);
+
+      expect(result.ordered.map(([i]) => i)).to.deep.equal([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]);
+      expect(result.ordered.map(([, valid]) => valid)).to.deep.equal(
+        [false, true, true, false, true, true, false, true, true, false]
+      );
+      expect([...result.unordered].sort((a, b) => a - b)).to.deep.equal([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]);
+      expect(result.started).to.equal(1);
+    });
+
+    it('deve rejeitar batch_size e concurrency menores que 1', async () => {
+      const result = await runPython(`
+try:
+    [item async for item in validate_many(["a"], batch_size=0)]
+    return None
+except ValueError as e:
+    return str(e)
+`, env);
+
+      expect(result).to.include('must be >= 1');
+    });
+  });
+
+  describe('Sem sessão MCP', () => {
+    let dir;
+
+    before(() => {
+      dir = fs.mkdtempSync(path.join(os.tmpdir(), 'guardrails-batch-'));
+    });
+
+    after(() => {
+      fs.rmSync(dir, { recursive: true, force: true });
+    });
+
+    it('deve enviar cada lote inteiro para um único processo do checker', async () => {
+      const log = path.join(dir, 'runs.log');
+      const result = await runPython(`
+texts = ["ok", "two\\nlines", "forbidden", "", "x" * 1000, "forbidden again", "last"]
+results = [(i, r) async for i, r in validate_many(texts, rules={"max": 1}, batch_size=3, concurrency=2)]
+return {"indices": [i for i, _ in results], "valid": [r["valid"] for _, r in results],
+        "lengths": [r["data"]["length"] for _, r in results]}
+`, { MCP_SESSION_GUARDRAILS_COMMAND: path.join(dir, 'no-such-command'), STUB_CHECKER_LOG: log });
+
+      expect(result.indices).to.deep.equal([0, 1, 2, 3, 4, 5, 6]);
+      expect(result.valid).to.deep.equal([true, true, false, true, true, false, true]);
+      expect(result.lengths).to.deep.equal([2, 9, 9, 0, 1000, 15, 4]);
+
+      const runs = fs.readFileSync(log, 'utf8').trim().split('\n').map(line => JSON.parse(line));
+      expect(runs).to.have.length(3);
+      expect(runs.every(args => args.includes('--batch') && args.includes('--rules'))).to.equal(true);
+    });
+
+    it('deve verificar item a item quando o checker recusa --batch', async () => {
+      const log = path.join(dir, 'no-batch.log');
+      const result = await runPython(`
+texts = ["ok", "forbidden", "last"]
+validated = [(i, r) async for i, r in validate_many(texts, batch_size=3)]
+scanned = [r async for _, r in scan_many(texts, batch_size=3)]
+return {"indices": [i for i, _ in validated], "valid": [r["valid"] for _, r in validated],
+        "lengths": [r["data"]["length"] for _, r in validated],
+        "risk": [r["risk_level"] for r in scanned]}
+`, {
+        MCP_SESSION_GUARDRAILS_COMMAND: path.join(dir, 'no-such-command'),
+        STUB_CHECKER_NO_BATCH: '1',
+        STUB_CHECKER_LOG: log
+      });
+
+      expect(result.indices).to.deep.equal([0, 1, 2]);
+      expect(result.valid).to.deep.equal([true, false, true]);
+      expect(result.lengths).to.deep.equal([2, 9, 4]);
+      expect(result.risk).to.deep.equal(['low', 'high', 'low']);
+
+      // O lote recusado é refeito com um processo por item
+      const runs = fs.readFileSync(log, 'utf8').trim().split('\n').map(line => JSON.parse(line));
+      expect(runs.filter(args => args.includes('--batch')).length).to.be.at.least(2);
+      expect(runs.filter(args => !args.includes('--batch'))).to.have.length(6);
+    });
+
+    it('deve marcar todos os itens do lote quando o checker falha', async () => {
+      const result = await runPython(`
+_stream.CHECKER_CMD = [sys.executable, "-c", "import sys; sys.exit(1)"]
+return [r async for _, r in scan_many(["a", "b"], batch_size=2)]
+`, { MCP_SESSION_GUARDRAILS_COMMAND: path.join(dir, 'no-such-command') });
+
+      expect(result).to.have.length(2);
+      expect(result.every(r => r.success === false && r.risk_level === 'error')).to.equal(true);
+    });
+  });
+});
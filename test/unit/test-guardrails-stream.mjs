@@ -0,0 +1,122 @@
+/**
+ * @fileoverview Testes unitários para o streaming do Guardrails (servers/security/guardrails/_stream.py)
+ * @module test/unit/test-guardrails-stream
+ * @description Executa validate_stream/scan_stream em um processo Python
+ * contra o checker stub de test/fixtures/stub-guardrails-checker.
+ */
+
+import { describe, it } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const CHECKER = path.join(ROOT, 'test', 'fixtures', 'stub-guardrails-checker', 'checker.py');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+/**
+ * Executa corpo async Python com o checker stub e retorna o JSON impresso
+ */
+function runPython(body, env = {}) {
+  const script = [
+    'import os, sys, json, types, asyncio',
+    `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+    '# servers/security/__init__.py também importa garak e cipher (fora desta árvore)',
+    'package = types.ModuleType("servers.security")',
+    `package.__path__ = [${JSON.stringify(path.join(ROOT, 'servers', 'security'))}]`,
+    'sys.modules["servers.security"] = package',
+    'from servers.security.guardrails import _stream, validate_stream, scan_stream',
+    `_stream.CHECKER_CMD = [sys.executable, ${JSON.stringify(CHECKER)}]`,
+    'async def main():',
+    ...body.trim().split('\n').map(line => `    ${line}`),
+    'print(json.dumps(asyncio.run(main())))'
+  ].join('\n');
+
+  return new Promise((resolve, reject) => {
+    execFile(PYTHON, ['-c', script], { timeout: 20000, env: { ...process.env, ...env } }, (error, stdout, stderr) => {
+      if (error) {
+        reject(new Error(stderr || error.message));
+        return;
+      }
+      resolve(JSON.parse(stdout.trim().split('\n').pop()));
+    });
+  });
+}
+
+describe('Guardrails - Streaming', function() {
+  this.timeout(30000);
+
+  it('deve enviar o conteúdo pelo stdin em chunks e entregar cada resultado', async () => {
+    const result = await runPython(`
+async def pieces():
+    for line in ["first line\\n", "a forbidden ", "word\\n", "last line\\n"]:
+        yield line
+values = [value async for value in validate_stream(pieces())]
+big = [value async for value in scan_stream("x" * 100000 + "\\n" + "forbidden\\n", input_mode="stdin")]
+return {"values": values, "big": big}
+`);
+
+    expect(result.values.map(v => v.valid)).to.deep.equal([true, false, true]);
+    expect(result.values.map(v => v.length)).to.deep.equal([10, 16, 9]);
+    expect(result.values.every(v => v.input === 'stdin')).to.equal(true);
+    expect(result.big.map(v => v.length)).to.deep.equal([100000, 9]);
+    expect(result.big[1].risk_level).to.equal('high');
+  });
+
+  it('deve usar arquivo temporário quando o checker não lê stdin', async () => {
+    const result = await runPython(`
+values = [value async for value in validate_stream("ok\\nforbidden\\n")]
+return {"values": values, "exists": os.path.exists(values[0]["input"])}
+`, { STUB_CHECKER_NO_STDIN: '1' });
+
+    expect(result.values.map(v => v.valid)).to.deep.equal([true, false]);
+    expect(result.values[0].input).to.not.equal('stdin');
+    expect(result.exists).to.equal(false);
+  });
+
+  it('deve falhar sem fallback para fontes que não podem ser relidas', async () => {
+    const result = await runPython(`
+async def pieces():
+    yield "ok\\n"
+try:
+    [value async for value in validate_stream(pieces())]
+    return {"error": None}
+except Exception as e:
+    return {"error": str(e)}
+`, { STUB_CHECKER_NO_STDIN: '1' });
+
+    expect(result.error).to.include('not supported');
+  });
+
+  it('deve usar arquivo quando GUARDRAILS_INPUT_MODE=file', async () => {
+    const result = await runPython(`
+return [value async for value in scan_stream(b"one\\ntwo\\n")]
+`, { GUARDRAILS_INPUT_MODE: 'file' });
+
+    expect(result).to.have.length(2);
+    expect(result[0].input).to.not.equal('stdin');
+  });
+
+  it('deve analisar JSON recebido em pedaços em tempo linear', async () => {
+    const result = await runPython(`
+import time
+parser = _stream.JSONStreamParser()
+data = json.dumps({"items": ["x" * 50] * 200000, "s": "a\\\\\\"}"}).encode() + b"\\n42\\n" + json.dumps("z").encode()
+start = time.monotonic()
+values = []
+for offset in range(0, len(data), 4096):
+    values += parser.feed(data[offset:offset + 4096])
+values += parser.close()
+return {"count": len(values[0]["items"]), "s": values[0]["s"], "rest": values[1:],
+        "elapsed": time.monotonic() - start, "mb": len(data) / 1e6}
+`);
+
+    expect(result.count).to.equal(200000);
+    expect(result.s).to.equal('a\\"}');
+    expect(result.rest).to.deep.equal([42, 'z']);
+    // ~10 MB em 2500 chunks: o parser quadrático levava dezenas de segundos
+    expect(result.elapsed).to.be.lessThan(5);
+  });
+});
@@ -0,0 +1,149 @@
+/**
+ * @fileoverview Testes unitários para servers/_mcp_session.py (sessões MCP persistentes)
+ * @module test/unit/test-mcp-session
+ * @description Executa o gerenciador de sessões em um processo Python contra
+ * o servidor MCP stub de test/fixtures/stub-mcp-server.
+ */
+
+import { describe, it } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const STUB = path.join(ROOT, 'test', 'fixtures', 'stub-mcp-server', 'server.py');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+/**
+ * Executa corpo async Python com `manager` (backend "stub") e retorna o JSON impresso
+ */
+function runPython(body) {
+  const script = [
+    'import sys, json, time, asyncio',
+    `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+    'from servers._mcp_session import MCPSessionManager, MCPSessionError, MCPToolError',
+    'async def main():',
+    `    manager = MCPSessionManager({"stub": [sys.executable, ${JSON.stringify(STUB)}]}, idle_timeout=0.3)`,
+    '    try:',
+    ...body.trim().split('\n').map(line => `        ${line}`),
+    '    finally:',
+    '        await manager.close_all()',
+    'print(json.dumps(asyncio.run(main())))'
+  ].join('\n');
+
+  return new Promise((resolve, reject) => {
+    execFile(PYTHON, ['-c', script], { timeout: 20000 }, (error, stdout, stderr) => {
+      if (error) {
+        reject(new Error(stderr || error.message));
+        return;
+      }
+      resolve(JSON.parse(stdout.trim().split('\n').pop()));
+    });
+  });
+}
+
+describe('MCP Sessions', function() {
+  this.timeout(30000);
+
+  it('deve reutilizar o mesmo processo entre chamadas', async () => {
+    const result = await runPython(`
+pids = [await manager.call_tool("stub", "pid") for _ in range(3)]
+return {"pids": pids, "started": manager.stats["started"]}
+`);
+
+    expect(new Set(result.pids).size).to.equal(1);
+    expect(result.started).to.equal(1);
+  });
+
+  it('deve multiplexar chamadas concorrentes por id', async () => {
+    const result = await runPython(`
+start = time.monotonic()
+echoes = await asyncio.gather(*(manager.call_tool("stub", "sleep", {"seconds": 0.3}) for _ in range(8)))
+return {"elapsed": time.monotonic() - start, "count": len(echoes)}
+`);
+
+    expect(result.count).to.equal(8);
+    expect(result.elapsed).to.be.lessThan(1.5);
+  });
+
+  it('deve reportar erros de ferramenta sem derrubar a sessão', async () => {
+    const result = await runPython(`
+try:
+    await manager.call_tool("stub", "fail")
+    failed = False
+except MCPToolError:
+    failed = True
+return {"failed": failed, "echo": await manager.call_tool("stub", "echo", {"a": 1})}
+`);
+
+    expect(result.failed).to.be.true;
+    expect(result.echo).to.deep.equal({ a: 1 });
+  });
+
+  it('deve reiniciar sessão que morreu', async () => {
+    const result = await runPython(`
+first = await manager.call_tool("stub", "pid")
+try:
+    await manager.call_tool("stub", "exit")
+except MCPSessionError:
+    pass
+second = await manager.call_tool("stub", "pid")
+return {"changed": first != second, "restarts": manager.stats["restarts"]}
+`);
+
+    expect(result.changed).to.be.true;
+    expect(result.restarts).to.equal(1);
+  });
+
+  it('deve manter sessões por event loop e fechá-las quando o loop termina', async () => {
+    const script = [
+      'import os, sys, json, asyncio',
+      `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+      'from servers._mcp_session import MCPSessionManager',
+      `manager = MCPSessionManager({"stub": [sys.executable, ${JSON.stringify(STUB)}]})`,
+      'async def main():',
+      '    # Chamadas concorrentes disputam o lock de start da sessão',
+      '    return await asyncio.gather(*(manager.call_tool("stub", "pid") for _ in range(3)))',
+      'def alive(pid):',
+      '    try:',
+      '        os.kill(pid, 0)',
+      '        return True',
+      '    except OSError:',
+      '        return False',
+      'first = asyncio.run(main())',
+      'second = asyncio.run(main())',
+      'print(json.dumps({"first": first, "second": second, "alive": [alive(first[0]), alive(second[0])],',
+      '                  "started": manager.stats["started"], "restarts": manager.stats["restarts"]}))'
+    ].join('\n');
+
+    const result = await new Promise((resolve, reject) => {
+      execFile(PYTHON, ['-c', script], { timeout: 20000 }, (error, stdout, stderr) => {
+        if (error) {
+          reject(new Error(stderr || error.message));
+          return;
+        }
+        resolve(JSON.parse(stdout.trim().split('\n').pop()));
+      });
+    });
+
+    expect(new Set(result.first).size).to.equal(1);
+    expect(new Set(result.second).size).to.equal(1);
+    expect(result.first[0]).to.not.equal(result.second[0]);
+    expect(result.alive).to.deep.equal([false, false]);
+    expect(result.started).to.equal(2);
+    expect(result.restarts).to.equal(0);
+  });
+
+  it('deve encerrar sessões ociosas', async () => {
+    const result = await runPython(`
+await manager.call_tool("stub", "pid")
+await asyncio.sleep(1.0)
+return manager.get_stats()
+`);
+
+    expect(result.idle_closed).to.equal(1);
+    expect(result.sessions).to.deep.equal({});
+  });
+});
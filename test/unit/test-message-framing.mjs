@@ -0,0 +1,167 @@
+/**
+ * @fileoverview Testes unitários para Message Framing
+ * @module test/unit/test-message-framing
+ */
+
+import { describe, it } from 'mocha';
+import { expect } from 'chai';
+import { execFile, spawn } from 'child_process';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import framing from '../../core/message-framing.cjs';
+
+const { FRAMINGS, MessageDecoder, encodeMessage, negotiateFraming } = framing;
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+function decodeAll(decoder, chunks) {
+  const messages = [];
+  for (const chunk of chunks) {
+    decoder.push(chunk, (message) => messages.push(message));
+  }
+  return messages;
+}
+
+describe('Message Framing', () => {
+  describe('JSON lines', () => {
+    it('deve decodificar linhas divididas entre chunks', () => {
+      const data = Buffer.from(encodeMessage({ a: 1 }) + encodeMessage({ b: 'ç' }));
+      const chunks = [data.subarray(0, 3), data.subarray(3, 10), data.subarray(10)];
+
+      const messages = decodeAll(new MessageDecoder(), chunks);
+
+      expect(messages).to.deep.equal([{ a: 1 }, { b: 'ç' }]);
+    });
+
+    it('deve ignorar linhas vazias e reportar linhas inválidas', () => {
+      const errors = [];
+      const decoder = new MessageDecoder({ onError: (error, raw) => errors.push(raw.toString()) });
+
+      const messages = decodeAll(decoder, ['\n', 'lixo\n', '{"ok":true}\n']);
+
+      expect(messages).to.deep.equal([{ ok: true }]);
+      expect(errors).to.deep.equal(['lixo']);
+    });
+  });
+
+  describe('Frames', () => {
+    it('deve decodificar frames com prefixo de tamanho', () => {
+      const data = Buffer.concat([
+        encodeMessage({ id: 1, text: 'a\nb' }, FRAMINGS.JSON),
+        encodeMessage({ id: 2 }, FRAMINGS.JSON)
+      ]);
+      const chunks = Array.from(data, (byte) => Buffer.from([byte]));
+
+      const messages = decodeAll(new MessageDecoder({ framing: FRAMINGS.JSON }), chunks);
+
+      expect(messages).to.deep.equal([{ id: 1, text: 'a\nb' }, { id: 2 }]);
+    });
+
+    it('deve trocar de framing entre mensagens do mesmo chunk', () => {
+      const data = Buffer.concat([
+        Buffer.from(encodeMessage({ type: 'framing', framing: FRAMINGS.JSON })),
+        encodeMessage({ id: 3 }, FRAMINGS.JSON)
+      ]);
+      const decoder = new MessageDecoder();
+      const messages = [];
+
+      decoder.push(data, (message) => {
+        if (message.type === 'framing') {
+          decoder.setFraming(message.framing);
+        }
+        messages.push(message);
+      });
+
+      expect(messages[1]).to.deep.equal({ id: 3 });
+    });
+  });
+
+  describe('Negociação', () => {
+    it('deve escolher framing suportado pelos dois lados', () => {
+      expect(negotiateFraming(FRAMINGS.JSON, ['jsonl', 'frame-json'])).to.equal(FRAMINGS.JSON);
+      expect(negotiateFraming(FRAMINGS.JSON, ['jsonl'])).to.equal(FRAMINGS.JSONL);
+    });
+
+    it('deve cair para frame-json quando msgpack não está disponível', () => {
+      expect(negotiateFraming(FRAMINGS.MSGPACK, ['jsonl', 'frame-json'])).to.equal(FRAMINGS.JSON);
+    });
+  });
+
+  describe('MessageChannel (Python)', () => {
+    it('deve descartar frame acima do limite e continuar no próximo frame', async () => {
+      const oversized = Buffer.from(encodeMessage({ data: 'x'.repeat(100) }, FRAMINGS.JSON));
+      const next = Buffer.from(encodeMessage({ id: 2 }, FRAMINGS.JSON));
+      const script = [
+        'import sys, json, asyncio, base64',
+        `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+        'from servers.skills import protocol',
+        'protocol.MAX_MESSAGE_SIZE = 64',
+        'async def main():',
+        '    reader = asyncio.StreamReader()',
+        `    reader.feed_data(base64.b64decode(${JSON.stringify(Buffer.concat([oversized, next]).toString('base64'))}))`,
+        '    reader.feed_eof()',
+        '    channel = protocol.MessageChannel(reader, output=sys.stderr.buffer)',
+        '    channel.framing = protocol.FRAME_JSON',
+        '    try:',
+        '        await channel.receive()',
+        '        error = None',
+        '    except ValueError as e:',
+        '        error = str(e)',
+        '    return {"error": error, "next": await channel.receive(), "eof": await channel.receive()}',
+        'print(json.dumps(asyncio.run(main())))'
+      ].join('\n');
+
+      const result = await new Promise((resolve, reject) => {
+        execFile(PYTHON, ['-c', script], { timeout: 10000 }, (error, stdout, stderr) => {
+          if (error) {
+            reject(new Error(stderr || error.message));
+            return;
+          }
+          resolve(JSON.parse(stdout.trim()));
+        });
+      });
+
+      expect(result.error).to.include('exceeds 64');
+      expect(result.next).to.deep.equal({ id: 2 });
+      expect(result.eof).to.equal(null);
+    });
+  });
+
+  describe('python_server.py (JSON lines)', () => {
+    it('deve manter escritas diretas no fd 1 fora do stream do protocolo', async () => {
+      const server = spawn(PYTHON, [path.join(ROOT, 'core', 'python_server.py')], {
+        cwd: ROOT,
+        stdio: ['pipe', 'pipe', 'pipe']
+      });
+      let stdout = '';
+      let stderr = '';
+      server.stdout.on('data', (data) => { stdout += data; });
+      server.stderr.on('data', (data) => { stderr += data; });
+
+      // Thread do usuário e escrita de baixo nível não passam pela captura por task
+      const code = [
+        'import os, threading',
+        'thread = threading.Thread(target=lambda: print("from thread", flush=True))',
+        'thread.start()',
+        'thread.join()',
+        'os.write(1, b"raw fd write\\n")',
+        'print("captured")',
+        '"done"'
+      ].join('\n');
+      server.stdin.write(JSON.stringify({ type: 'execute', id: 1, code }) + '\n');
+      server.stdin.end();
+      await new Promise((resolve) => server.on('close', resolve));
+
+      const messages = stdout.trim().split('\n').map(line => JSON.parse(line));
+      const response = messages.find(m => m.type === 'response' && m.id === 1);
+
+      expect(response.result).to.equal('done');
+      expect(stdout).to.not.include('from thread');
+      expect(stdout).to.not.include('raw fd write');
+      expect(stderr).to.include('from thread');
+      expect(stderr).to.include('raw fd write');
+    });
+  });
+});
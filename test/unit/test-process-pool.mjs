@@ -5,6 +5,9 @@
 
 import { describe, it, before, after, beforeEach, afterEach } from 'mocha';
 import { expect } from 'chai';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
 import PythonProcessPool from '../../core/process-pool.cjs';
 
 describe('FASE 7.2 - Python Process Pool', () => {
@@ -145,6 +148,71 @@ describe('FASE 7.2 - Python Process Pool', () => {
     });
   });
 
+  describe('Resultados grandes (spool)', () => {
+    const saved = {};
+    let tmpDir;
+
+    before(() => {
+      tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'process-pool-spool-'));
+      const skillDir = path.join(tmpDir, 'packages', 'big-result');
+      fs.mkdirSync(skillDir, { recursive: true });
+      fs.writeFileSync(
+        path.join(skillDir, 'index.py'),
+        'def execute(size=0):\n    return "x" * size\n'
+      );
+      fs.mkdirSync(path.join(tmpDir, 'spool'));
+
+      const env = {
+        MCP_SKILLS_PATH: path.join(tmpDir, 'packages'),
+        MCP_SPOOL_THRESHOLD: '4096',
+        MCP_SPOOL_DIR: path.join(tmpDir, 'spool')
+      };
+      for (const [key, value] of Object.entries(env)) {
+        saved[key] = process.env[key];
+        process.env[key] = value;
+      }
+    });
+
+    after(() => {
+      for (const [key, value] of Object.entries(saved)) {
+        if (value === undefined) {
+          delete process.env[key];
+        } else {
+          process.env[key] = value;
+        }
+      }
+      fs.rmSync(tmpDir, { recursive: true, force: true });
+    });
+
+    it('deve ler resultados acima do threshold pelo spool e liberar o arquivo', async () => {
+      pool = new PythonProcessPool({ poolSize: 1 });
+      await pool.initialize();
+
+      const result = await pool.execute('big-result', { size: 64 * 1024 }, 10000);
+
+      expect(result.type).to.equal('result');
+      expect(result.result.length).to.equal(64 * 1024);
+
+      // spool_release não tem resposta: a mensagem seguinte confirma o processamento
+      const processObj = pool.processes[0];
+      const stats = await new Promise((resolve) => {
+        const handler = ({ processId, message }) => {
+          if (processId === processObj.id && message.requestId === 'spool-stats') {
+            pool.off('message', handler);
+            resolve(message.stats);
+          }
+        };
+        pool.on('message', handler);
+        pool._write(processObj, { action: 'stats', requestId: 'spool-stats' });
+      });
+
+      expect(stats.spool.spooled).to.equal(1);
+      expect(stats.spool.released).to.equal(1);
+      expect(stats.spool.outstanding).to.equal(0);
+      expect(fs.readdirSync(stats.spool.directory).length).to.equal(0);
+    });
+  });
+
   describe('Health Checks', () => {
     it('deve iniciar health checks periódicos', async () => {
       pool = new PythonProcessPool({
@@ -0,0 +1,178 @@
+/**
+ * @fileoverview Testes unitários para PythonBridgePool
+ * @module test/unit/test-python-bridge-pool
+ */
+
+import { describe, it, afterEach } from 'mocha';
+import { expect } from 'chai';
+import PythonBridgePool from '../../core/python-bridge-pool.js';
+import { MCPCodeExecutionFramework } from '../../core/index.js';
+
+describe('Python Bridge Pool', function() {
+  this.timeout(30000);
+
+  let pool;
+
+  afterEach(async () => {
+    if (pool) {
+      await pool.cleanup().catch(() => {});
+      pool = null;
+    }
+  });
+
+  describe('Inicialização', () => {
+    it('deve iniciar minWorkers interpretadores prontos', async () => {
+      pool = new PythonBridgePool({}, { minWorkers: 2, maxWorkers: 3 });
+      await pool.initialize();
+
+      const stats = pool.getStats();
+      expect(stats.initialized).to.be.true;
+      expect(stats.workers).to.equal(2);
+      expect(pool.workers.every(w => w.bridge.initialized)).to.be.true;
+    });
+
+    it('deve manter os padrões para opções undefined', () => {
+      pool = new PythonBridgePool({}, { minWorkers: undefined, idleTimeoutMs: undefined, restartDelay: 500 });
+
+      expect(pool.options.minWorkers).to.be.at.least(1);
+      expect(pool.options.idleTimeoutMs).to.equal(60000);
+      expect(pool.options.scaleUpQueueDepth).to.equal(4);
+      expect(pool.options.restartDelay).to.equal(500);
+    });
+  });
+
+  describe('Roteamento', () => {
+    it('deve distribuir requisições entre workers', async () => {
+      pool = new PythonBridgePool({}, { minWorkers: 2, maxWorkers: 2 });
+      await pool.initialize();
+
+      const pids = await Promise.all(
+        Array.from({ length: 4 }, () => pool.execute('__import__("os").getpid()'))
+      );
+
+      expect(new Set(pids).size).to.equal(2);
+    });
+
+    it('deve escalar quando a fila passa de scaleUpQueueDepth', async () => {
+      pool = new PythonBridgePool({}, { minWorkers: 1, maxWorkers: 2, scaleUpQueueDepth: 1 });
+      await pool.initialize();
+
+      await Promise.all(
+        Array.from({ length: 3 }, () => pool.execute('__import__("asyncio").sleep(0.2)'))
+      );
+
+      const stats = pool.getStats();
+      expect(stats.scaleUps).to.be.greaterThan(0);
+      expect(stats.workers + stats.starting).to.equal(2);
+    });
+  });
+
+  describe('Sessões', () => {
+    it('deve rotear execuções da sessão sempre para o mesmo worker', async () => {
+      pool = new PythonBridgePool({}, { minWorkers: 2, maxWorkers: 2 });
+      await pool.initialize();
+
+      await pool.createSession('agent-1');
+      await pool.execute('counter = 0', {}, { session: 'agent-1' });
+
+      const results = [];
+      for (let i = 0; i < 4; i++) {
+        results.push(await pool.execute('counter += 1\ncounter', {}, { session: 'agent-1' }));
+      }
+      expect(results).to.deep.equal([1, 2, 3, 4]);
+
+      await pool.dropSession('agent-1');
+      let error;
+      try {
+        await pool.execute('counter', {}, { session: 'agent-1' });
+      } catch (e) {
+        error = e;
+      }
+      expect(error.message).to.include('Sessão não encontrada');
+    });
+    it('deve esquecer a sessão que o python_server descartou (LRU)', async () => {
+      const saved = process.env.MCP_PYTHON_MAX_SESSIONS;
+      process.env.MCP_PYTHON_MAX_SESSIONS = '1';
+      try {
+        pool = new PythonBridgePool({}, { minWorkers: 1, maxWorkers: 1 });
+        await pool.initialize();
+      } finally {
+        if (saved === undefined) {
+          delete process.env.MCP_PYTHON_MAX_SESSIONS;
+        } else {
+          process.env.MCP_PYTHON_MAX_SESSIONS = saved;
+        }
+      }
+
+      await pool.createSession('old');
+      await pool.createSession('new'); // Remove 'old' no python_server
+      const [worker] = pool.workers;
+      expect(worker.sessions).to.equal(2);
+
+      let error;
+      try {
+        await pool.execute('1', {}, { session: 'old' });
+      } catch (e) {
+        error = e;
+      }
+      expect(error.message).to.include('Sessão não encontrada');
+      expect(pool.sessionWorkers.has('old')).to.be.false;
+      expect(worker.sessions).to.equal(1);
+      expect(await pool.execute('2', {}, { session: 'new' })).to.equal(2);
+    });
+
+    it('deve encerrar worker ocioso cujas sessões o python_server já removeu', async () => {
+      pool = new PythonBridgePool({}, { minWorkers: 2, maxWorkers: 2 });
+      await pool.initialize();
+      pool.options.minWorkers = 1;
+
+      await pool.createSession('agent-1');
+      const owner = pool.sessionWorkers.get('agent-1');
+      // Remoção feita pelo próprio python_server (TTL ocioso), sem passar pelo pool
+      await owner.bridge.dropSession('agent-1');
+
+      for (const worker of pool.workers) {
+        worker.lastUsed = 0;
+      }
+      await pool._scaleDown();
+
+      expect(pool.sessionWorkers.has('agent-1')).to.be.false;
+      expect(owner.sessions).to.equal(0);
+      expect(pool.workers).to.have.length(1);
+      expect(pool.getStats().scaleDowns).to.equal(1);
+    });
+  });
+
+  describe('Framework', () => {
+    it('deve executar código Python pelo pool com a opção pythonPool', async () => {
+      const framework = new MCPCodeExecutionFramework({ autoEnforce: false, pythonPool: { minWorkers: 2, maxWorkers: 2 } });
+      pool = framework.pythonExecutor;
+      expect(pool).to.be.instanceOf(PythonBridgePool);
+
+      await framework.initialize();
+      const result = await framework.execute('import os\nos.getpid()');
+
+      expect(pool.workers.map(w => w.bridge.pythonProcess.pid)).to.include(result);
+      expect(pool.getStats().workers).to.equal(2);
+      expect(framework.getStats().pythonBridge.workers).to.equal(2);
+    });
+  });
+
+  describe('Recuperação', () => {
+    it('deve repor worker que caiu sem afetar os demais', async () => {
+      pool = new PythonBridgePool({}, { minWorkers: 2, maxWorkers: 2, restartDelay: 50 });
+      await pool.initialize();
+
+      const [victim, survivor] = pool.workers;
+      const survivorResult = survivor.bridge.execute('__import__("asyncio").sleep(0.3)');
+      victim.bridge.pythonProcess.kill('SIGKILL');
+
+      await survivorResult;
+
+      await new Promise(resolve => setTimeout(resolve, 1500));
+      expect(pool.getStats().restarts).to.equal(1);
+      expect(pool.getStats().workers).to.equal(2);
+      expect(await pool.execute('1 + 1')).to.equal(2);
+    });
+  });
+});
@@ -0,0 +1,66 @@
+/**
+ * @fileoverview Testes unitários para o cache de código compilado do python_server.py
+ * @module test/unit/test-python-code-cache
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { PythonBridge } from '../../core/python-bridge.js';
+
+describe('Python Server - Cache de Código', function() {
+  this.timeout(30000);
+
+  let bridge;
+
+  before(async () => {
+    process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+    bridge = new PythonBridge({});
+    await bridge.initialize();
+  });
+
+  after(async () => {
+    await bridge.cleanup().catch(() => {});
+  });
+
+  describe('Compilação', () => {
+    it('deve retornar o valor de uma expressão simples', async () => {
+      expect(await bridge.execute('1 + 2')).to.equal(3);
+    });
+
+    it('deve usar a expressão final de um bloco como resultado', async () => {
+      expect(await bridge.execute('x = 20\ny = 22\nx + y')).to.equal(42);
+    });
+
+    it('deve aceitar return e await no nível do módulo', async () => {
+      expect(await bridge.eval('len("abc")')).to.equal(3);
+      expect(await bridge.execute('import asyncio\nvalue = await asyncio.sleep(0, result=7)\nreturn value')).to.equal(7);
+    });
+
+    it('deve propagar erros de sintaxe', async () => {
+      let error;
+      try {
+        await bridge.execute('def (');
+      } catch (e) {
+        error = e;
+      }
+      expect(error).to.be.an('error');
+      expect(error.message).to.include('SyntaxError');
+    });
+  });
+
+  describe('Estatísticas', () => {
+    it('deve reutilizar código já compilado', async () => {
+      const code = 'n = 10\nsum(range(n))';
+      const before = (await bridge.getServerStats()).code_cache;
+
+      for (let i = 0; i < 5; i++) {
+        expect(await bridge.execute(code)).to.equal(45);
+      }
+
+      const stats = (await bridge.getServerStats()).code_cache;
+      expect(stats.misses - before.misses).to.equal(1);
+      expect(stats.hits - before.hits).to.equal(4);
+      expect(stats.hit_rate).to.be.greaterThan(0);
+    });
+  });
+});
@@ -0,0 +1,66 @@
+/**
+ * @fileoverview Testes unitários para o profiler opcional por execução (servers/skills/profiler.py)
+ * @module test/unit/test-python-profiler
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { PythonBridge } from '../../core/python-bridge.js';
+
+const HOT_CODE = `
+def hot(n):
+    return sum(i * i for i in range(n))
+
+hot(300000)
+`;
+
+describe('Python Server - Profiler por Execução', function() {
+  this.timeout(30000);
+
+  let bridge;
+
+  before(async () => {
+    process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+    bridge = new PythonBridge({});
+    await bridge.initialize();
+  });
+
+  after(async () => {
+    await bridge.cleanup().catch(() => {});
+  });
+
+  it('deve listar as funções mais custosas com cProfile', async () => {
+    const { result, profile } = await bridge.execute(HOT_CODE, {}, { profile: { top: 5 } });
+
+    expect(result).to.equal(8999955000050000);
+    expect(profile.mode).to.equal('cprofile');
+    expect(profile.top_cumulative.length).to.be.at.most(5);
+    expect(profile.top_self[0].function).to.include('<genexpr>');
+    expect(profile.top_self[0].calls).to.equal(300001);
+    expect(profile.top_cumulative.some((entry) => entry.function.startsWith('hot ('))).to.equal(true);
+  });
+
+  it('deve gerar collapsed stacks no modo sample', async () => {
+    const { profile } = await bridge.execute(HOT_CODE, {}, {
+      profile: { mode: 'sample', collapsed: true, interval: 0.001 }
+    });
+
+    expect(profile.mode).to.equal('sample');
+    expect(profile.samples).to.be.above(0);
+    const line = profile.collapsed.split('\n')[0];
+    expect(line).to.match(/;hot \(<string>:\d+\);<genexpr> \(<string>:\d+\) \d+$/);
+  });
+
+  it('não deve incluir profile sem a opção', async () => {
+    expect(await bridge.execute('1 + 1', {}, {})).to.equal(2);
+  });
+
+  it('deve rejeitar modo desconhecido', async () => {
+    try {
+      await bridge.execute('1', {}, { profile: { mode: 'perf' } });
+      expect.fail('deveria ter lançado erro');
+    } catch (error) {
+      expect(error.message).to.include('Invalid profile mode');
+    }
+  });
+});
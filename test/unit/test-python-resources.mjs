@@ -0,0 +1,60 @@
+/**
+ * @fileoverview Testes unitários para a contabilização de recursos por execução (servers/skills/resources.py)
+ * @module test/unit/test-python-resources
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { PythonBridge } from '../../core/python-bridge.js';
+
+describe('Python Server - Recursos por Execução', function() {
+  this.timeout(30000);
+
+  let bridge;
+
+  before(async () => {
+    process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+    bridge = new PythonBridge({});
+    await bridge.initialize();
+  });
+
+  after(async () => {
+    await bridge.cleanup().catch(() => {});
+  });
+
+  it('deve manter o resultado puro sem a opção resources', async () => {
+    expect(await bridge.execute('1 + 1')).to.equal(2);
+  });
+
+  it('deve retornar CPU, memória, GC e bytes serializados com resources', async () => {
+    const { result, resources } = await bridge.execute(
+      'sum(i * i for i in range(200000))', {}, { resources: true }
+    );
+
+    expect(result).to.equal(2666646666700000);
+    expect(resources.cpu_user + resources.cpu_system).to.be.above(0);
+    expect(resources.max_rss_delta).to.be.at.least(0);
+    expect(resources.gc_collections).to.be.at.least(0);
+    expect(resources.alloc_peak).to.equal(null); // tracemalloc desligado
+    expect(resources.bytes_serialized).to.equal(String(result).length);
+  });
+
+  it('deve anexar os recursos ao erro da execução', async () => {
+    try {
+      await bridge.execute('1 / 0', {}, { resources: true });
+      expect.fail('deveria ter lançado erro');
+    } catch (error) {
+      expect(error.message).to.include('division by zero');
+      expect(error.resources.cpu_user).to.be.at.least(0);
+    }
+  });
+
+  it('deve acumular totais no stats', async () => {
+    const before = (await bridge.getServerStats()).resources.execute;
+    await bridge.execute('"x" * 1000');
+    const after = (await bridge.getServerStats()).resources.execute;
+
+    expect(after.executions).to.equal(before.executions + 1);
+    expect(after.bytes_serialized).to.equal(before.bytes_serialized + 1002);
+  });
+});
@@ -0,0 +1,87 @@
+/**
+ * @fileoverview Testes unitários para servers/skills/serializer.py (resultados do python_server)
+ * @module test/unit/test-python-serializer
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { PythonBridge } from '../../core/python-bridge.js';
+
+describe('Python Server - Serializer', function() {
+  this.timeout(30000);
+
+  let bridge;
+
+  before(async () => {
+    process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+    bridge = new PythonBridge({});
+    await bridge.initialize();
+  });
+
+  after(async () => {
+    await bridge.cleanup().catch(() => {});
+  });
+
+  describe('Tipos nativos do Python', () => {
+    it('deve codificar datetime, Decimal, set e dataclasses', async () => {
+      const result = await bridge.execute(`
+import datetime, decimal, dataclasses
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    created: datetime.date
+
+{
+    'when': datetime.datetime(2024, 1, 2, 3, 4, 5),
+    'price': decimal.Decimal('10.50'),
+    'tags': {'a'},
+    'row': Row(1, datetime.date(2024, 1, 2)),
+}
+`);
+
+      expect(result).to.deep.equal({
+        when: '2024-01-02T03:04:05',
+        price: '10.50',
+        tags: ['a'],
+        row: { id: 1, created: '2024-01-02' }
+      });
+    });
+
+    it('deve codificar bytes em base64 no framing JSON', async () => {
+      const result = await bridge.execute(`b'\\x00\\xff'`);
+      expect(result).to.deep.equal({ __type__: 'bytes', base64: 'AP8=' });
+    });
+
+    it('deve manter o formato __type__/__dict__ para objetos', async () => {
+      const result = await bridge.execute(`
+class Point:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+
+Point()
+`);
+      expect(result).to.deep.equal({ __type__: 'Point', __dict__: { x: 1, y: 2 } });
+    });
+  });
+
+  describe('Encoders customizados', () => {
+    it('deve usar encoder registrado para a classe e subclasses', async () => {
+      const result = await bridge.execute(`
+from servers.skills.serializer import register_encoder
+
+class Money:
+    def __init__(self, cents):
+        self.cents = cents
+
+class Euro(Money):
+    pass
+
+register_encoder(Money, lambda m: {'amount': m.cents / 100})
+[Money(150), Euro(99)]
+`);
+      expect(result).to.deep.equal([{ amount: 1.5 }, { amount: 0.99 }]);
+    });
+  });
+});
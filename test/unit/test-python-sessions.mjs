@@ -0,0 +1,122 @@
+/**
+ * @fileoverview Testes unitários para as sessões de execução do python_server.py
+ * @module test/unit/test-python-sessions
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { PythonBridge } from '../../core/python-bridge.js';
+
+describe('Python Server - Sessões', function() {
+  this.timeout(30000);
+
+  let bridge;
+
+  before(async () => {
+    process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+    // Módulo JS chamado pelo Python via js.call
+    bridge = new PythonBridge({
+      timers: { wait: (ms) => new Promise(resolve => setTimeout(() => resolve(ms), ms)) }
+    });
+    await bridge.initialize();
+  });
+
+  after(async () => {
+    await bridge.cleanup().catch(() => {});
+  });
+
+  it('deve isolar variáveis entre sessões e da sessão padrão', async () => {
+    await bridge.createSession('a');
+    await bridge.createSession('b');
+
+    await bridge.execute('value = "default"');
+    await bridge.execute('value = "a"', {}, { session: 'a' });
+    await bridge.execute('value = "b"', {}, { session: 'b' });
+
+    expect(await bridge.execute('value')).to.equal('default');
+    expect(await bridge.execute('value', {}, { session: 'a' })).to.equal('a');
+    expect(await bridge.execute('value', {}, { session: 'b' })).to.equal('b');
+  });
+
+  it('deve isolar o contexto de execuções concorrentes na mesma sessão', async () => {
+    await bridge.createSession('concurrent');
+    const options = { session: 'concurrent' };
+    await bridge.execute('import asyncio', {}, options);
+
+    const results = await Promise.all([
+      bridge.execute('await asyncio.sleep(0.05)\n[v, tag]', { v: 1, tag: 'a' }, options),
+      bridge.execute('[v, tag]', { v: 2, tag: 'b' }, options),
+      bridge.execute('tag', { tag: 'c' }, options)
+    ]);
+    expect(results).to.deep.equal([[1, 'a'], [2, 'b'], 'c']);
+
+    // Variáveis do contexto não ficam na sessão (nem entram na memória contabilizada)
+    expect(await bridge.execute('"v" in globals()', {}, options)).to.equal(false);
+    const { sessions } = await bridge.getServerStats();
+    expect(sessions.sessions.find(s => s.name === 'concurrent').variables).to.equal(1); // asyncio
+  });
+
+  it('deve rodar execuções concorrentes na sessão padrão em paralelo', async () => {
+    await bridge.execute('import asyncio');
+
+    const start = Date.now();
+    const results = await Promise.all(
+      [1, 2, 3, 4].map(n => bridge.execute('await asyncio.sleep(0.5)\nn', { n }))
+    );
+
+    expect(results).to.deep.equal([1, 2, 3, 4]);
+    // Em fila, uma por vez, levariam 2 s
+    expect(Date.now() - start).to.be.lessThan(1200);
+  });
+
+  it('deve responder outras execuções enquanto uma aguarda js.call', async () => {
+    const start = Date.now();
+    const pending = bridge.execute('await js.call("timers", "wait", 800)');
+    await new Promise(resolve => setTimeout(resolve, 100));
+
+    expect(await bridge.execute('1 + 1')).to.equal(2);
+    expect(Date.now() - start).to.be.lessThan(600);
+    expect(await pending).to.equal(800);
+  });
+
+  it('deve isolar contexto que sobrepõe variável da sessão', async () => {
+    await bridge.execute('shared = "session"');
+
+    const [overridden, plain] = await Promise.all([
+      bridge.execute('await asyncio.sleep(0.2)\nshared', { shared: 'context' }),
+      bridge.execute('shared')
+    ]);
+
+    expect(overridden).to.equal('context');
+    expect(plain).to.equal('session');
+    expect(await bridge.execute('shared')).to.equal('session');
+  });
+
+  it('deve reutilizar sessão existente em createSession', async () => {
+    const first = await bridge.createSession('reuse');
+    const second = await bridge.createSession('reuse');
+
+    expect(first.created).to.be.true;
+    expect(second.created).to.equal(false);
+  });
+
+  it('deve contabilizar memória e remover sessões com dropSession', async () => {
+    await bridge.createSession('big');
+    await bridge.execute('data = list(range(100000))', {}, { session: 'big' });
+
+    const { sessions } = await bridge.getServerStats();
+    const big = sessions.sessions.find(s => s.name === 'big');
+    expect(big.variables).to.equal(1);
+    expect(big.approx_bytes).to.be.greaterThan(800000);
+
+    expect((await bridge.dropSession('big')).dropped).to.be.true;
+
+    let error;
+    try {
+      await bridge.execute('data', {}, { session: 'big' });
+    } catch (e) {
+      error = e;
+    }
+    expect(error.message).to.include('Sessão não encontrada');
+  });
+});
@@ -0,0 +1,45 @@
+/**
+ * @fileoverview Testes unitários para o spool de mensagens grandes (servers/skills/spool.py)
+ * @module test/unit/test-python-spool
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import fs from 'fs';
+import { PythonBridge } from '../../core/python-bridge.js';
+
+describe('Python Server - Spool de Mensagens Grandes', function() {
+  this.timeout(30000);
+
+  let bridge;
+
+  before(async () => {
+    process.env.PYTHON_PATH = process.env.PYTHON_PATH || 'python3';
+    bridge = new PythonBridge({ options: { pythonSpoolThreshold: 4096 } });
+    await bridge.initialize();
+  });
+
+  after(async () => {
+    await bridge.cleanup().catch(() => {});
+  });
+
+  it('deve entregar resultados pequenos pelo pipe', async () => {
+    expect(await bridge.execute('[1, 2, 3]')).to.deep.equal([1, 2, 3]);
+
+    const { spool } = await bridge.getServerStats();
+    expect(spool.spooled).to.equal(0);
+  });
+
+  it('deve entregar resultados grandes pelo arquivo de spool e liberá-lo', async () => {
+    const result = await bridge.execute('[{"id": i, "name": "item-%d" % i} for i in range(2000)]');
+
+    expect(result.length).to.equal(2000);
+    expect(result[1999]).to.deep.equal({ id: 1999, name: 'item-1999' });
+
+    const { spool } = await bridge.getServerStats();
+    expect(spool.spooled).to.equal(1);
+    expect(spool.released).to.equal(1);
+    expect(spool.outstanding).to.equal(0);
+    expect(fs.readdirSync(spool.directory).length).to.equal(0);
+  });
+});
@@ -0,0 +1,126 @@
+/**
+ * @fileoverview Testes unitários para a execução concorrente do bridge de skills (servers/skills/bridge.py)
+ * @module test/unit/test-skills-bridge-concurrency
+ * @description Inicia o bridge com MCP_SKILLS_PATH apontando para skills
+ * criadas em um diretório temporário.
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { spawn } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import readline from 'readline';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+
+const SLEEP_SKILL = [
+  'import asyncio',
+  '',
+  'async def execute(seconds=0.5, tag=None):',
+  '    await asyncio.sleep(seconds)',
+  '    return tag',
+  ''
+].join('\n');
+
+describe('Skills Bridge - Execução Concorrente', function() {
+  this.timeout(30000);
+
+  let dir;
+  let bridge;
+  const pending = new Map();
+  const order = [];
+  let nextId = 0;
+
+  function request(message) {
+    const requestId = `c-${nextId++}`;
+    return new Promise((resolve) => {
+      pending.set(requestId, resolve);
+      bridge.stdin.write(JSON.stringify({ ...message, requestId }) + '\n');
+    });
+  }
+
+  before(async () => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'skills-bridge-concurrency-'));
+    const skillDir = path.join(dir, 'packages', 'sleep-skill');
+    fs.mkdirSync(skillDir, { recursive: true });
+    fs.writeFileSync(path.join(skillDir, 'index.py'), SLEEP_SKILL);
+    fs.writeFileSync(path.join(skillDir, 'skill.json'), JSON.stringify({ name: 'sleep-skill' }));
+
+    bridge = spawn(process.env.PYTHON_PATH || 'python3', ['-m', 'servers.skills.bridge'], {
+      cwd: ROOT,
+      stdio: ['pipe', 'pipe', 'inherit'],
+      env: {
+        ...process.env,
+        MCP_SKILLS_PATH: path.join(dir, 'packages'),
+        MCP_SKILLS_MAX_CONCURRENCY: '3'
+      }
+    });
+
+    const ready = new Promise((resolve) => pending.set(undefined, resolve));
+    readline.createInterface({ input: bridge.stdout }).on('line', (line) => {
+      const message = JSON.parse(line);
+      const requestId = message.type === 'ready' ? undefined : message.requestId;
+      const resolve = pending.get(requestId);
+      if (resolve) {
+        pending.delete(requestId);
+        order.push(requestId);
+        resolve(message);
+      }
+    });
+    await ready;
+  });
+
+  after(() => {
+    bridge.kill();
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('deve executar requisições em paralelo até max_concurrency', async () => {
+    const start = Date.now();
+    const results = await Promise.all(
+      Array.from({ length: 6 }, (_, i) => request({
+        action: 'execute', skill: 'sleep-skill', params: { seconds: 0.5, tag: i }
+      }))
+    );
+    const elapsed = Date.now() - start;
+
+    expect(results.map(r => r.result)).to.deep.equal([0, 1, 2, 3, 4, 5]);
+    expect(results.every(r => r.success)).to.equal(true);
+    // 6 × 0,5 s em série levaria 3 s; com 3 slots são duas rodadas
+    expect(elapsed).to.be.at.least(900);
+    expect(elapsed).to.be.lessThan(2500);
+  });
+
+  it('deve responder fora de ordem, identificando cada resposta pelo requestId', async () => {
+    order.length = 0;
+    const slow = request({ action: 'execute', skill: 'sleep-skill', params: { seconds: 1, tag: 'slow' } });
+    const fast = request({ action: 'execute', skill: 'sleep-skill', params: { seconds: 0.1, tag: 'fast' } });
+
+    const [slowResult, fastResult] = await Promise.all([slow, fast]);
+
+    expect(slowResult.result).to.equal('slow');
+    expect(fastResult.result).to.equal('fast');
+    expect(order).to.deep.equal([fastResult.requestId, slowResult.requestId]);
+  });
+
+  it('deve informar fila e execuções em andamento nas estatísticas', async () => {
+    const running = Array.from({ length: 5 }, () => request({
+      action: 'execute', skill: 'sleep-skill', params: { seconds: 0.5 }
+    }));
+    // Deixa as tarefas do bridge ocuparem os slots antes de consultar
+    await new Promise(resolve => setTimeout(resolve, 200));
+    const busy = (await request({ action: 'stats' })).stats;
+    await Promise.all(running);
+    const idle = (await request({ action: 'stats' })).stats;
+
+    expect(busy.max_concurrency).to.equal(3);
+    expect(busy.in_flight).to.equal(3);
+    expect(busy.queue_depth).to.equal(2);
+    expect(idle.in_flight).to.equal(0);
+    expect(idle.queue_depth).to.equal(0);
+  });
+});
@@ -0,0 +1,180 @@
+/**
+ * @fileoverview Testes unitários para os modos de execução das skills (servers/skills/executor.py)
+ * @module test/unit/test-skills-execution-modes
+ * @description Executa o SkillExecutor em um processo Python contra skills
+ * criadas em um diretório temporário, com modo em skill.json ou registry.json.
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+const WHERE = [
+  'import os',
+  'import time',
+  'import threading',
+  '',
+  'def execute(busy=0):',
+  '    deadline = time.monotonic() + busy',
+  '    while time.monotonic() < deadline:',
+  '        pass',
+  '    return {"pid": os.getpid(), "thread": threading.get_ident()}',
+  ''
+].join('\n');
+
+const WHERE_ASYNC = [
+  'import os',
+  'import threading',
+  '',
+  'async def execute():',
+  '    return {"pid": os.getpid(), "thread": threading.get_ident()}',
+  ''
+].join('\n');
+
+// skill.json de cada skill (registry.json define o modo de "registry-thread")
+const SKILLS = {
+  'where-inline': { code: WHERE, config: { executionMode: 'inline' } },
+  'where-thread': { code: WHERE, config: { executionMode: 'thread' } },
+  'where-process': { code: WHERE, config: { executionMode: 'process' } },
+  'where-default': { code: WHERE, config: {} },
+  'where-async': { code: WHERE_ASYNC, config: {} },
+  'registry-thread': { code: WHERE, config: {} },
+  'registry-overridden': { code: WHERE, config: { executionMode: 'inline' } },
+  'bad-mode': { code: WHERE, config: { executionMode: 'gpu' } }
+};
+
+const REGISTRY = {
+  skills: [
+    { name: 'registry-thread', executionMode: 'thread' },
+    { name: 'registry-overridden', executionMode: 'process' }
+  ]
+};
+
+describe('Skills - Modos de Execução', function() {
+  this.timeout(30000);
+
+  let dir;
+
+  before(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'skills-execution-modes-'));
+    for (const [name, skill] of Object.entries(SKILLS)) {
+      const skillDir = path.join(dir, 'packages', name);
+      fs.mkdirSync(skillDir, { recursive: true });
+      fs.writeFileSync(path.join(skillDir, 'index.py'), skill.code);
+      fs.writeFileSync(path.join(skillDir, 'skill.json'), JSON.stringify({ name, ...skill.config }));
+    }
+    fs.writeFileSync(path.join(dir, 'registry.json'), JSON.stringify(REGISTRY));
+  });
+
+  after(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  /**
+   * Executa corpo async Python com `executor` e `where(name)` e retorna o JSON impresso
+   */
+  function runPython(body) {
+    const script = [
+      'import os, sys, json, time, asyncio, threading',
+      `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+      'from servers.skills.executor import SkillExecutor',
+      'MAIN = {"pid": os.getpid(), "thread": threading.get_ident()}',
+      'async def main():',
+      `    executor = SkillExecutor(skills_path=${JSON.stringify(path.join(dir, 'packages'))}, process_workers=2)`,
+      '    async def where(name, **params):',
+      '        response = await executor.execute_skill(name, params)',
+      '        if not response["success"]:',
+      '            return response["error_type"]',
+      '        result = response["result"]',
+      '        return "process" if result["pid"] != MAIN["pid"] else (',
+      '            "inline" if result["thread"] == MAIN["thread"] else "thread")',
+      '    try:',
+      ...body.trim().split('\n').map(line => `        ${line}`),
+      '    finally:',
+      '        executor.shutdown(wait=False)',
+      'print(json.dumps(asyncio.run(main())))'
+    ].join('\n');
+
+    return new Promise((resolve, reject) => {
+      execFile(PYTHON, ['-c', script], { timeout: 25000 }, (error, stdout, stderr) => {
+        if (error) {
+          reject(new Error(stderr || error.message));
+          return;
+        }
+        resolve(JSON.parse(stdout.trim().split('\n').pop()));
+      });
+    });
+  }
+
+  it('deve executar cada skill no backend declarado', async () => {
+    const result = await runPython(`
+names = ["where-inline", "where-thread", "where-process", "where-default", "where-async"]
+return {name: await where(name) for name in names}
+`);
+
+    expect(result).to.deep.equal({
+      'where-inline': 'inline',
+      'where-thread': 'thread',
+      'where-process': 'process',
+      // Sem executionMode: síncrona no pool de threads, async no event loop
+      'where-default': 'thread',
+      'where-async': 'inline'
+    });
+  });
+
+  it('deve ler o modo do registry.json, com skill.json tendo precedência', async () => {
+    const result = await runPython(`
+return [await where("registry-thread"), await where("registry-overridden")]
+`);
+
+    expect(result).to.deep.equal(['thread', 'inline']);
+  });
+
+  it('deve recusar modos desconhecidos', async () => {
+    const result = await runPython(`
+response = await executor.execute_skill("bad-mode", {})
+try:
+    SkillExecutor(default_mode="gpu")
+    invalid_default = None
+except ValueError as e:
+    invalid_default = str(e)
+return {"response": response, "invalid_default": invalid_default}
+`);
+
+    expect(result.response.success).to.equal(false);
+    expect(result.response.error_type).to.equal('ValueError');
+    expect(result.response.error).to.include("Invalid executionMode 'gpu'");
+    expect(result.invalid_default).to.include("Invalid default execution mode 'gpu'");
+  });
+
+  it('deve manter o event loop livre durante skills CPU-bound em thread e process', async () => {
+    const result = await runPython(`
+gaps = []
+async def ticker():
+    while True:
+        start = time.monotonic()
+        await asyncio.sleep(0.01)
+        gaps.append(time.monotonic() - start)
+task = asyncio.ensure_future(ticker())
+await asyncio.gather(
+    executor.execute_skill("where-thread", {"busy": 0.5}),
+    executor.execute_skill("where-process", {"busy": 0.5})
+)
+task.cancel()
+return {"max_gap": max(gaps), "pool": executor.get_stats()["pools"]}
+`);
+
+    // Executada no event loop, cada skill bloquearia o ticker por 0,5 s
+    expect(result.max_gap).to.be.lessThan(0.25);
+    expect(result.pool.thread_pool_started).to.equal(true);
+    expect(result.pool.process_workers).to.equal(2);
+  });
+});
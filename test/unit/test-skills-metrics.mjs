@@ -0,0 +1,109 @@
+/**
+ * @fileoverview Testes unitários para a ação "metrics" do bridge de skills (servers/skills/metrics.py)
+ * @module test/unit/test-skills-metrics
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { spawn } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+
+describe('Skills Bridge - Métricas de Latência', function() {
+  this.timeout(30000);
+
+  let bridge;
+  const pending = new Map();
+  let nextId = 0;
+
+  function request(message) {
+    const requestId = `m-${nextId++}`;
+    return new Promise((resolve) => {
+      pending.set(requestId, resolve);
+      bridge.stdin.write(JSON.stringify({ ...message, requestId }) + '\n');
+    });
+  }
+
+  before(async () => {
+    bridge = spawn(process.env.PYTHON_PATH || 'python3', ['-m', 'servers.skills.bridge'], {
+      cwd: ROOT,
+      stdio: ['pipe', 'pipe', 'inherit']
+    });
+
+    const ready = new Promise((resolve) => pending.set(undefined, resolve));
+    readline.createInterface({ input: bridge.stdout }).on('line', (line) => {
+      const message = JSON.parse(line);
+      const resolve = pending.get(message.type === 'ready' ? undefined : message.requestId);
+      if (resolve) {
+        pending.delete(message.requestId);
+        resolve(message);
+      }
+    });
+    await ready;
+  });
+
+  after(() => {
+    bridge.kill();
+  });
+
+  it('deve registrar histogramas por fase e erros por tipo', async () => {
+    for (let i = 0; i < 5; i++) {
+      const result = await request({ action: 'execute', skill: 'test-skill', params: { name: `n${i}` } });
+      expect(result.success).to.equal(true);
+    }
+    await request({ action: 'execute', skill: 'test-skill', params: { unknown: 1 } });
+    await request({ action: 'execute', skill: 'no-such-skill', params: {} });
+
+    const { format, metrics } = await request({ action: 'metrics' });
+    expect(format).to.equal('json');
+
+    const skill = metrics['test-skill'];
+    expect(skill.success).to.equal(5);
+    expect(skill.errors).to.deep.equal({ TypeError: 1 });
+    for (const phase of ['queue', 'load', 'execute', 'serialize', 'total']) {
+      expect(skill.phases[phase].count).to.equal(6);
+      expect(skill.phases[phase].p99).to.be.at.least(skill.phases[phase].p50);
+    }
+
+    // Nomes inexistentes não viram labels
+    expect(metrics._unresolved.errors).to.deep.equal({ FileNotFoundError: 1 });
+    expect(metrics['no-such-skill']).to.equal(undefined);
+  });
+
+  it('deve agrupar skills inexistentes também nos totais de recursos', async () => {
+    for (let i = 0; i < 3; i++) {
+      await request({ action: 'execute', skill: `missing-${i}`, params: {} });
+    }
+
+    const { stats } = await request({ action: 'stats' });
+    const { metrics } = await request({ action: 'metrics' });
+
+    expect(Object.keys(stats.resources).some(name => name.startsWith('missing-'))).to.equal(false);
+    expect(Object.keys(metrics).some(name => name.startsWith('missing-'))).to.equal(false);
+    expect(metrics._unresolved.errors.FileNotFoundError).to.equal(4);
+  });
+
+  it('deve exportar no formato de texto do Prometheus', async () => {
+    const { metrics } = await request({ action: 'metrics', format: 'prometheus' });
+
+    expect(metrics).to.include('# TYPE mcp_skill_phase_duration_seconds histogram');
+    expect(metrics).to.include(
+      'mcp_skill_phase_duration_seconds_count{skill="test-skill",phase="execute"} 6'
+    );
+    expect(metrics).to.include(
+      'mcp_skill_phase_duration_seconds_bucket{skill="test-skill",phase="execute",le="+Inf"} 6'
+    );
+    expect(metrics).to.include('mcp_skill_errors_total{skill="test-skill",error_type="TypeError"} 1');
+    expect(metrics).to.include('mcp_skill_executions_total{skill="test-skill",status="success"} 5');
+  });
+
+  it('deve recusar formato desconhecido', async () => {
+    const response = await request({ action: 'metrics', format: 'xml' });
+    expect(response.success).to.equal(false);
+    expect(response.error).to.include('Unsupported metrics format');
+  });
+});
@@ -0,0 +1,145 @@
+/**
+ * @fileoverview Testes unitários para o cache de módulos das skills (servers/skills/module_cache.py)
+ * @module test/unit/test-skills-module-cache
+ * @description Executa o SkillExecutor em um processo Python contra skills
+ * criadas (e reescritas) em um diretório temporário.
+ */
+
+import { describe, it, beforeEach, afterEach } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+describe('Skills - Cache de Módulos', function() {
+  this.timeout(30000);
+
+  let dir;
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'skills-module-cache-'));
+    for (const name of ['skill-a', 'skill-b', 'skill-c']) {
+      const skillDir = path.join(dir, 'packages', name);
+      fs.mkdirSync(skillDir, { recursive: true });
+      fs.writeFileSync(path.join(skillDir, 'index.py'), `def execute():\n    return "${name} v1"\n`);
+      fs.writeFileSync(path.join(skillDir, 'skill.json'), JSON.stringify({ name, executionMode: 'inline' }));
+    }
+  });
+
+  afterEach(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  /**
+   * Executa corpo async Python com `new_executor()`, `run(name)` e `write(name, code)` e retorna o JSON impresso
+   */
+  function runPython(body) {
+    const script = [
+      'import os, sys, json, asyncio',
+      `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+      'from servers.skills.executor import SkillExecutor',
+      `PACKAGES = ${JSON.stringify(path.join(dir, 'packages'))}`,
+      'def new_executor(**options):',
+      '    global executor',
+      '    executor = SkillExecutor(skills_path=PACKAGES, **options)',
+      '    return executor',
+      'async def run(name):',
+      '    return (await executor.execute_skill(name, {}))["result"]',
+      'def write(name, code):',
+      '    path = os.path.join(PACKAGES, name, "index.py")',
+      '    with open(path, "w") as f:',
+      '        f.write(code)',
+      '    # Garante um mtime diferente mesmo em sistemas de arquivos de baixa resolução',
+      '    stat = os.stat(path)',
+      '    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))',
+      'async def main():',
+      ...body.trim().split('\n').map(line => `    ${line}`),
+      'print(json.dumps(asyncio.run(main())))'
+    ].join('\n');
+
+    return new Promise((resolve, reject) => {
+      execFile(PYTHON, ['-c', script], { timeout: 25000 }, (error, stdout, stderr) => {
+        if (error) {
+          reject(new Error(stderr || error.message));
+          return;
+        }
+        resolve(JSON.parse(stdout.trim().split('\n').pop()));
+      });
+    });
+  }
+
+  it('deve recarregar o módulo quando o arquivo da skill muda', async () => {
+    const result = await runPython(`
+new_executor()
+first = await run("skill-a")
+cached = await run("skill-a")
+write("skill-a", 'def execute():\\n    return "skill-a v2"\\n')
+reloaded = await run("skill-a")
+return {"results": [first, cached, reloaded], "stats": executor.get_stats()["module_cache"],
+        "in_sys_modules": "skills.skill-a" in sys.modules}
+`);
+
+    expect(result.results).to.deep.equal(['skill-a v1', 'skill-a v1', 'skill-a v2']);
+    expect(result.stats.hits).to.equal(1);
+    expect(result.stats.misses).to.equal(2);
+    expect(result.stats.invalidations).to.equal(1);
+    expect(result.in_sys_modules).to.equal(true);
+  });
+
+  it('deve manter o módulo quando só o mtime muda (conteúdo igual)', async () => {
+    const result = await runPython(`
+new_executor()
+await run("skill-b")
+write("skill-b", 'def execute():\\n    return "skill-b v1"\\n')
+again = await run("skill-b")
+return {"again": again, "stats": executor.get_stats()["module_cache"]}
+`);
+
+    expect(result.again).to.equal('skill-b v1');
+    expect(result.stats.hits).to.equal(1);
+    expect(result.stats.invalidations).to.equal(0);
+  });
+
+  it('deve descartar o módulo menos usado recentemente ao exceder o limite', async () => {
+    const result = await runPython(`
+new_executor(module_cache_size=2)
+await run("skill-a")
+await run("skill-b")
+await run("skill-a")   # skill-a passa a ser a mais recente
+await run("skill-c")   # descarta skill-b
+loaded = sorted(name for name in sys.modules if name.startswith("skills."))
+stats = executor.get_stats()["module_cache"]
+await run("skill-a")
+after = executor.get_stats()["module_cache"]
+return {"loaded": loaded, "stats": stats, "hits_after": after["hits"]}
+`);
+
+    expect(result.loaded).to.deep.equal(['skills.skill-a', 'skills.skill-c']);
+    expect(result.stats.entries).to.equal(2);
+    expect(result.stats.evictions).to.equal(1);
+    expect(result.hits_after).to.equal(result.stats.hits + 1);
+  });
+
+  it('deve respeitar o limite aproximado de memória', async () => {
+    const result = await runPython(`
+new_executor(module_cache_bytes=1)
+results = [await run(name) for name in ["skill-a", "skill-b", "skill-c"]]
+stats = executor.get_stats()["module_cache"]
+return {"results": results, "stats": stats,
+        "loaded": sorted(name for name in sys.modules if name.startswith("skills."))}
+`);
+
+    // Mesmo acima do limite, o módulo mais recente continua em cache
+    expect(result.results).to.deep.equal(['skill-a v1', 'skill-b v1', 'skill-c v1']);
+    expect(result.stats.entries).to.equal(1);
+    expect(result.stats.evictions).to.equal(2);
+    expect(result.stats.max_bytes).to.equal(1);
+    expect(result.loaded).to.deep.equal(['skills.skill-c']);
+  });
+});
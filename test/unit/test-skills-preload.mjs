@@ -0,0 +1,97 @@
+/**
+ * @fileoverview Testes unitários para a ação "preload" do bridge de skills (servers/skills/bridge.py)
+ * @module test/unit/test-skills-preload
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { spawn } from 'child_process';
+import fs from 'fs';
+import path from 'path';
+import readline from 'readline';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+
+describe('Skills Bridge - Preload de Skills', function() {
+  this.timeout(30000);
+
+  let bridge;
+  const pending = new Map();
+  let nextId = 0;
+
+  function request(message) {
+    const requestId = `p-${nextId++}`;
+    return new Promise((resolve) => {
+      pending.set(requestId, resolve);
+      bridge.stdin.write(JSON.stringify({ ...message, requestId }) + '\n');
+    });
+  }
+
+  before(async () => {
+    bridge = spawn(process.env.PYTHON_PATH || 'python3', ['-m', 'servers.skills.bridge'], {
+      cwd: ROOT,
+      stdio: ['pipe', 'pipe', 'inherit'],
+      env: { ...process.env, MCP_SKILLS_PRELOAD: 'test-skill' }
+    });
+
+    const ready = new Promise((resolve) => pending.set(undefined, resolve));
+    readline.createInterface({ input: bridge.stdout }).on('line', (line) => {
+      const message = JSON.parse(line);
+      const resolve = pending.get(message.type === 'ready' ? undefined : message.requestId);
+      if (resolve) {
+        pending.delete(message.requestId);
+        resolve(message);
+      }
+    });
+    await ready;
+  });
+
+  after(() => {
+    bridge.kill();
+  });
+
+  it('deve carregar o conjunto de MCP_SKILLS_PRELOAD após o ready', async () => {
+    let stats;
+    do {
+      ({ stats } = await request({ action: 'stats' }));
+    } while (!stats.preload);
+
+    expect(stats.preload.skills['test-skill'].status).to.equal('loaded');
+    expect(stats.preload.loaded).to.equal(1);
+
+    // Primeira execução já encontra o módulo no cache
+    const result = await request({ action: 'execute', skill: 'test-skill', params: {} });
+    expect(result.success).to.equal(true);
+    const after = (await request({ action: 'stats' })).stats;
+    expect(after.module_cache.hits).to.equal(stats.module_cache.hits + 1);
+    expect(after.module_cache.misses).to.equal(stats.module_cache.misses);
+  });
+
+  it('deve informar tempos e falhas por skill', async () => {
+    const { preload } = await request({ action: 'preload', skills: ['test-skill', 'no-such-skill'] });
+
+    expect(preload.skills['test-skill'].status).to.equal('cached');
+    expect(preload.skills['no-such-skill'].status).to.equal('failed');
+    expect(preload.skills['no-such-skill'].error_type).to.equal('FileNotFoundError');
+    expect(preload.skills['no-such-skill'].load_time).to.be.at.least(0);
+    expect(preload.failed).to.equal(1);
+  });
+
+  it('deve usar as skills de prioridade alta do registry.json por padrão', async () => {
+    const registry = JSON.parse(fs.readFileSync(path.join(ROOT, 'skills', 'registry.json'), 'utf8'));
+    const high = registry.skills.filter((skill) => skill.priority === 'high').map((skill) => skill.name);
+
+    const { preload } = await request({ action: 'preload' });
+
+    expect(Object.keys(preload.skills)).to.deep.equal(high);
+    expect(preload.loaded + preload.failed).to.be.at.most(high.length);
+  });
+
+  it('deve recusar skills em formato inválido', async () => {
+    const response = await request({ action: 'preload', skills: 'test-skill' });
+    expect(response.success).to.equal(false);
+    expect(response.error).to.include("'skills' must be a list");
+  });
+});
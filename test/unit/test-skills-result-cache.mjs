@@ -0,0 +1,207 @@
+/**
+ * @fileoverview Testes unitários para a memoização de resultados (servers/skills/result_cache.py)
+ * @module test/unit/test-skills-result-cache
+ * @description Executa o SkillExecutor em um processo Python contra skills
+ * "cacheable" criadas em um diretório temporário.
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+const SKILLS = {
+  'cached-report': {
+    config: { cacheable: true, ttl: 60 },
+    code: [
+      'import datetime',
+      'calls = 0',
+      '',
+      'def execute(n=1):',
+      '    global calls',
+      '    calls += 1',
+      '    return {"items": list(range(n)), "when": datetime.date(2024, 1, 2), "calls": calls}',
+      ''
+    ].join('\n')
+  },
+  'deep-result': {
+    config: { cacheable: true },
+    code: [
+      'def execute(depth=100000):',
+      '    root = node = []',
+      '    for _ in range(depth):',
+      '        node.append([])',
+      '        node = node[0]',
+      '    return root',
+      ''
+    ].join('\n')
+  },
+  'plain-counter': {
+    config: {},
+    code: 'calls = 0\n\ndef execute():\n    global calls\n    calls += 1\n    return calls\n'
+  }
+};
+
+describe('Skills - Memoização de Resultados', function() {
+  this.timeout(30000);
+
+  let dir;
+
+  before(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'skills-result-cache-'));
+    for (const [name, skill] of Object.entries(SKILLS)) {
+      const skillDir = path.join(dir, 'packages', name);
+      fs.mkdirSync(skillDir, { recursive: true });
+      fs.writeFileSync(path.join(skillDir, 'index.py'), skill.code);
+      fs.writeFileSync(path.join(skillDir, 'skill.json'), JSON.stringify({ name, ...skill.config }));
+    }
+  });
+
+  after(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  /**
+   * Executa corpo async Python com `new_executor()` e retorna o JSON impresso
+   */
+  function runPython(body) {
+    const script = [
+      'import sys, json, asyncio',
+      `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+      'from servers.skills.executor import SkillExecutor',
+      'from servers.skills import serializer',
+      `DB = ${JSON.stringify(path.join(dir, 'results.db'))}`,
+      'def new_executor(**options):',
+      `    return SkillExecutor(skills_path=${JSON.stringify(path.join(dir, 'packages'))}, **options)`,
+      'async def main():',
+      ...body.trim().split('\n').map(line => `    ${line}`),
+      'print(serializer.dumps(asyncio.run(main())).decode())'
+    ].join('\n');
+
+    return new Promise((resolve, reject) => {
+      execFile(PYTHON, ['-c', script], { timeout: 25000 }, (error, stdout, stderr) => {
+        if (error) {
+          reject(new Error(stderr || error.message));
+          return;
+        }
+        resolve(JSON.parse(stdout.trim().split('\n').pop()));
+      });
+    });
+  }
+
+  it('deve executar a skill uma vez por parâmetros e não memoizar skills comuns', async () => {
+    const result = await runPython(`
+executor = new_executor()
+a = await executor.execute_skill("cached-report", {"n": 2})
+b = await executor.execute_skill("cached-report", {"n": 2})
+c = await executor.execute_skill("cached-report", {"n": 3})
+counters = [(await executor.execute_skill("plain-counter", {}))["result"] for _ in range(2)]
+return {"a": a, "b": b, "c": c, "counters": counters, "cache": executor.get_stats()["result_cache"]}
+`);
+
+    expect(result.a.cached).to.equal(undefined);
+    expect(result.b.cached).to.equal(true);
+    expect(result.b.result.calls).to.equal(1);
+    expect(result.c.result.calls).to.equal(2);
+    expect(result.counters).to.deep.equal([1, 2]);
+    expect(result.cache.hits).to.equal(1);
+    expect(result.cache.misses).to.equal(2);
+  });
+
+  it('deve devolver cópias: alterar um resultado não afeta os próximos hits', async () => {
+    const result = await runPython(`
+executor = new_executor()
+first = (await executor.execute_skill("cached-report", {"n": 2}))["result"]
+first["items"].append(99)
+hit = (await executor.execute_skill("cached-report", {"n": 2}))["result"]
+hit["items"].append(100)
+again = (await executor.execute_skill("cached-report", {"n": 2}))["result"]
+return {"hit": hit["items"], "again": again["items"]}
+`);
+
+    expect(result.hit).to.deep.equal([0, 1, 100]);
+    expect(result.again).to.deep.equal([0, 1]);
+  });
+
+  it('deve devolver o mesmo valor em hits de memória e de disco', async () => {
+    const result = await runPython(`
+executor = new_executor(result_cache_path=DB)
+await executor.execute_skill("cached-report", {"n": 1})
+memory_hit = (await executor.execute_skill("cached-report", {"n": 1}))["result"]
+executor.shutdown()
+
+restarted = new_executor(result_cache_path=DB)
+disk_hit = (await restarted.execute_skill("cached-report", {"n": 1}))["result"]
+stats = restarted.get_stats()["result_cache"]
+restarted.shutdown()
+return {"memory": memory_hit, "disk": disk_hit, "same": memory_hit == disk_hit, "disk_hits": stats["disk_hits"]}
+`);
+
+    expect(result.same).to.equal(true);
+    expect(result.memory.when).to.equal('2024-01-02');
+    expect(result.disk_hits).to.equal(1);
+  });
+
+  it('deve contar hits nas estatísticas e nos recursos da skill', async () => {
+    const result = await runPython(`
+executor = new_executor()
+await executor.execute_skill("cached-report", {"n": 1})
+hit = await executor.execute_skill("cached-report", {"n": 1}, resources=True)
+stats = executor.get_stats()
+return {"hit": hit, "total": stats["total_executions"], "successful": stats["successful"],
+        "executions": stats["resources"]["cached-report"]["executions"]}
+`);
+
+    expect(result.hit.cached).to.equal(true);
+    expect(result.hit.resources.cpu_user).to.be.at.least(0);
+    expect(result.total).to.equal(2);
+    expect(result.successful).to.equal(2);
+    expect(result.executions).to.equal(2);
+  });
+
+  it('deve ignorar resultados que o serializer não codifica (RecursionError)', async () => {
+    const result = await runPython(`
+executor = new_executor()
+first = await executor.execute_skill("deep-result", {})
+second = await executor.execute_skill("deep-result", {})
+return {"success": [first["success"], second["success"]], "cached": second.get("cached", False),
+        "stores": executor.get_stats()["result_cache"]["stores"]}
+`);
+
+    expect(result.success).to.deep.equal([true, true]);
+    expect(result.cached).to.equal(false);
+    expect(result.stores).to.equal(0);
+  });
+
+  it('deve gravar o nível SQLite no thread pool, fora do event loop', async () => {
+    const result = await runPython(`
+import threading
+executor = new_executor(result_cache_path=DB + "-threads")
+writers = []
+store = executor.result_cache._store
+def recording_store(*args):
+    writers.append(threading.current_thread().name)
+    store(*args)
+executor.result_cache._store = recording_store
+await executor.execute_skill("cached-report", {"n": 4})
+executor.shutdown()
+
+restarted = new_executor(result_cache_path=DB + "-threads")
+hit = await restarted.execute_skill("cached-report", {"n": 4})
+restarted.shutdown()
+return {"writers": writers, "loop": threading.current_thread().name, "cached": hit.get("cached", False)}
+`);
+
+    expect(result.writers).to.have.length(1);
+    expect(result.writers[0]).to.not.equal(result.loop);
+    expect(result.writers[0]).to.match(/^skill/);
+    expect(result.cached).to.equal(true);
+  });
+});
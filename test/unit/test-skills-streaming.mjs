@@ -0,0 +1,194 @@
+/**
+ * @fileoverview Testes unitários para o streaming de skills geradoras (servers/skills/executor.py e bridge.py)
+ * @module test/unit/test-skills-streaming
+ * @description Executa skills geradoras criadas em um diretório temporário
+ * pelo SkillExecutor (em um processo Python) e pelo bridge (stdin/stdout).
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { execFile, spawn } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import readline from 'readline';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+const COUNTER = [
+  'import time',
+  '',
+  'def execute(n=3, delay=0.0):',
+  '    for i in range(n):',
+  '        time.sleep(delay)',
+  '        yield {"i": i, "at": time.time()}',
+  '    return {"total": n}',
+  ''
+].join('\n');
+
+const ASYNC_COUNTER = [
+  'import time',
+  'import asyncio',
+  '',
+  'async def execute(n=3, delay=0.0):',
+  '    for i in range(n):',
+  '        await asyncio.sleep(delay)',
+  '        yield {"i": i, "at": time.time()}',
+  ''
+].join('\n');
+
+const SKILLS = {
+  'stream-inline': { code: COUNTER, mode: 'inline' },
+  'stream-thread': { code: COUNTER, mode: 'thread' },
+  'stream-process': { code: COUNTER, mode: 'process' },
+  'stream-async': { code: ASYNC_COUNTER }
+};
+
+describe('Skills - Streaming de Resultados', function() {
+  this.timeout(30000);
+
+  let dir;
+
+  before(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'skills-streaming-'));
+    for (const [name, skill] of Object.entries(SKILLS)) {
+      const skillDir = path.join(dir, 'packages', name);
+      fs.mkdirSync(skillDir, { recursive: true });
+      fs.writeFileSync(path.join(skillDir, 'index.py'), skill.code);
+      const config = skill.mode ? { name, executionMode: skill.mode } : { name };
+      fs.writeFileSync(path.join(skillDir, 'skill.json'), JSON.stringify(config));
+    }
+  });
+
+  after(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  /**
+   * Executa corpo async Python com `executor` e `stream(name, params)` e retorna o JSON impresso
+   */
+  function runPython(body) {
+    const script = [
+      'import sys, json, time, asyncio',
+      `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+      'from servers.skills.executor import SkillExecutor',
+      'async def main():',
+      `    executor = SkillExecutor(skills_path=${JSON.stringify(path.join(dir, 'packages'))}, process_workers=1)`,
+      '    async def stream(name, params, timeout=30):',
+      '        chunks = []',
+      '        def on_chunk(chunk):',
+      '            chunks.append({**chunk, "received": time.time()})',
+      '        response = await executor.execute_skill(name, params, timeout, on_chunk)',
+      '        return {"chunks": chunks, "response": response, "done": time.time()}',
+      '    try:',
+      ...body.trim().split('\n').map(line => `        ${line}`),
+      '    finally:',
+      '        executor.shutdown(wait=False)',
+      'print(json.dumps(asyncio.run(main())))'
+    ].join('\n');
+
+    return new Promise((resolve, reject) => {
+      execFile(PYTHON, ['-c', script], { timeout: 25000 }, (error, stdout, stderr) => {
+        if (error) {
+          reject(new Error(stderr || error.message));
+          return;
+        }
+        resolve(JSON.parse(stdout.trim().split('\n').pop()));
+      });
+    });
+  }
+
+  it('deve entregar cada chunk assim que é produzido, em todos os modos', async () => {
+    const result = await runPython(`
+names = ["stream-inline", "stream-thread", "stream-process", "stream-async"]
+return {name: await stream(name, {"n": 3, "delay": 0.3}) for name in names}
+`);
+
+    for (const [name, { chunks, response, done }] of Object.entries(result)) {
+      expect(response.success, name).to.equal(true);
+      expect(response.chunks, name).to.equal(3);
+      expect(chunks.map(c => c.i), name).to.deep.equal([0, 1, 2]);
+      // O primeiro chunk chega bem antes do fim da execução
+      expect(done - chunks[0].received, name).to.be.at.least(0.4);
+      expect(chunks[0].received - chunks[0].at, name).to.be.lessThan(0.2);
+    }
+    // Com on_chunk, o resultado é o valor de retorno do gerador
+    expect(result['stream-thread'].response.result).to.deep.equal({ total: 3 });
+    expect(result['stream-process'].response.result).to.deep.equal({ total: 3 });
+    expect(result['stream-async'].response.result).to.equal(null);
+  });
+
+  it('deve devolver a lista de chunks sem on_chunk', async () => {
+    const result = await runPython(`
+names = ["stream-inline", "stream-thread", "stream-process", "stream-async"]
+return {name: (await executor.execute_skill(name, {"n": 2}))["result"] for name in names}
+`);
+
+    for (const [name, chunks] of Object.entries(result)) {
+      expect(chunks.map(c => c.i), name).to.deep.equal([0, 1]);
+    }
+  });
+
+  it('deve aplicar o timeout ao stream inteiro', async () => {
+    const result = await runPython(`
+return {name: await stream(name, {"n": 10, "delay": 0.2}, timeout=0.5)
+        for name in ["stream-process", "stream-async"]}
+`);
+
+    for (const [name, { chunks, response }] of Object.entries(result)) {
+      expect(response.error_type, name).to.equal('TimeoutError');
+      expect(chunks.length, name).to.be.at.least(1);
+      expect(chunks.length, name).to.be.lessThan(10);
+    }
+  });
+
+  describe('Bridge', () => {
+    let bridge;
+    const messages = [];
+    let onMessage = () => {};
+
+    before(async () => {
+      bridge = spawn(PYTHON, ['-m', 'servers.skills.bridge'], {
+        cwd: ROOT,
+        stdio: ['pipe', 'pipe', 'inherit'],
+        env: { ...process.env, MCP_SKILLS_PATH: path.join(dir, 'packages') }
+      });
+
+      const ready = new Promise((resolve) => { onMessage = resolve; });
+      readline.createInterface({ input: bridge.stdout }).on('line', (line) => {
+        const message = JSON.parse(line);
+        messages.push(message);
+        onMessage(message);
+      });
+      await ready;
+    });
+
+    after(() => {
+      bridge.kill();
+    });
+
+    it('deve enviar mensagens "chunk" com requestId antes do "result"', async () => {
+      const done = new Promise((resolve) => {
+        onMessage = (message) => {
+          if (message.type === 'result' && message.requestId === 's-1') {
+            resolve();
+          }
+        };
+      });
+      messages.length = 0;
+      bridge.stdin.write(JSON.stringify({
+        action: 'execute', skill: 'stream-thread', params: { n: 3 }, stream: true, requestId: 's-1'
+      }) + '\n');
+      await done;
+
+      expect(messages.map(m => m.type)).to.deep.equal(['chunk', 'chunk', 'chunk', 'result']);
+      expect(messages.every(m => m.requestId === 's-1')).to.equal(true);
+      expect(messages.slice(0, 3).map(m => [m.index, m.data.i])).to.deep.equal([[0, 0], [1, 1], [2, 2]]);
+      expect(messages[3].result).to.deep.equal({ total: 3 });
+      expect(messages[3].chunks).to.equal(3);
+    });
+  });
+});
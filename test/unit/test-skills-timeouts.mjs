@@ -0,0 +1,151 @@
+/**
+ * @fileoverview Testes unitários para os timeouts das skills (servers/skills/executor.py e worker_pool.py)
+ * @module test/unit/test-skills-timeouts
+ * @description Executa o SkillExecutor em um processo Python contra skills
+ * criadas em um diretório temporário.
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { execFile } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+const PYTHON = process.env.PYTHON_PATH || 'python3';
+
+const SKILLS = {
+  'hang-process': {
+    mode: 'process',
+    code: 'import time\n\ndef execute(seconds=60):\n    time.sleep(seconds)\n    return seconds\n'
+  },
+  'hang-thread': {
+    mode: 'thread',
+    code: 'import time\n\ndef execute(seconds=60):\n    time.sleep(seconds)\n    return seconds\n'
+  },
+  'pid-process': {
+    mode: 'process',
+    code: 'import os\n\ndef execute():\n    return os.getpid()\n'
+  }
+};
+
+describe('Skills - Timeouts', function() {
+  this.timeout(30000);
+
+  let dir;
+
+  before(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'skills-timeouts-'));
+    for (const [name, skill] of Object.entries(SKILLS)) {
+      const skillDir = path.join(dir, 'packages', name);
+      fs.mkdirSync(skillDir, { recursive: true });
+      fs.writeFileSync(path.join(skillDir, 'index.py'), skill.code);
+      fs.writeFileSync(path.join(skillDir, 'skill.json'), JSON.stringify({ name, executionMode: skill.mode }));
+    }
+  });
+
+  after(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  /**
+   * Executa corpo async Python com `executor` e retorna o JSON impresso
+   */
+  function runPython(body) {
+    const script = [
+      'import sys, json, time, asyncio',
+      `sys.path.insert(0, ${JSON.stringify(ROOT)})`,
+      'from servers.skills.executor import SkillExecutor',
+      'async def main():',
+      `    executor = SkillExecutor(skills_path=${JSON.stringify(path.join(dir, 'packages'))}, process_workers=1)`,
+      '    try:',
+      ...body.trim().split('\n').map(line => `        ${line}`),
+      '    finally:',
+      '        executor.shutdown(wait=False)',
+      'print(json.dumps(asyncio.run(main())))'
+    ].join('\n');
+
+    return new Promise((resolve, reject) => {
+      execFile(PYTHON, ['-c', script], { timeout: 25000 }, (error, stdout, stderr) => {
+        if (error) {
+          reject(new Error(stderr || error.message));
+          return;
+        }
+        resolve(JSON.parse(stdout.trim().split('\n').pop()));
+      });
+    });
+  }
+
+  it('deve matar o worker no timeout e responder sem esperar o respawn', async () => {
+    const result = await runPython(`
+first = await executor.execute_skill("pid-process", {})
+start = time.monotonic()
+timed_out = await executor.execute_skill("hang-process", {}, timeout=1)
+elapsed = time.monotonic() - start
+second = await executor.execute_skill("pid-process", {})
+return {"first": first["result"], "second": second["result"], "elapsed": elapsed,
+        "timed_out": timed_out, "pool": executor.get_stats()["pools"]["process_pool"]}
+`);
+
+    expect(result.timed_out.success).to.equal(false);
+    expect(result.timed_out.error_type).to.equal('TimeoutError');
+    expect(result.timed_out.timeout_enforced).to.equal(true);
+    expect(result.timed_out.kill_time).to.be.lessThan(1);
+    expect(result.elapsed).to.be.lessThan(2);
+
+    // O worker travado foi substituído por outro processo
+    expect(result.second).to.not.equal(result.first);
+    expect(result.pool.timeouts).to.equal(1);
+    expect(result.pool.spawned).to.equal(2);
+    // O respawn termina depois da resposta e é medido nas estatísticas
+    expect(result.pool.respawns).to.equal(1);
+    expect(result.pool.last_respawn_time).to.be.greaterThan(0);
+    expect(result.pool.avg_respawn_time).to.equal(result.pool.last_respawn_time);
+  });
+
+  it('deve registrar no log a falha do respawn em segundo plano', async () => {
+    const result = await runPython(`
+import logging
+messages = []
+handler = logging.Handler()
+handler.emit = lambda record: messages.append(record.getMessage())
+logging.getLogger().addHandler(handler)
+
+await executor.execute_skill("pid-process", {})
+pool = executor._process_pool
+async def failing_spawn():
+    raise RuntimeError("no more workers")
+pool._spawn = failing_spawn
+await executor.execute_skill("hang-process", {}, timeout=0.5)
+for _ in range(50):
+    if not pool._background:
+        break
+    await asyncio.sleep(0.05)
+return {"messages": messages, "pending": len(pool._background), "workers": pool.get_stats()["workers"]}
+`);
+
+    expect(result.pending).to.equal(0);
+    expect(result.messages.some(message => message.includes('no more workers'))).to.equal(true);
+    // A vaga do worker morto foi liberada para a próxima requisição
+    expect(result.workers).to.equal(0);
+  });
+
+  it('deve informar que o timeout em modo thread não interrompe a skill', async () => {
+    const result = await runPython(`
+timed_out = await executor.execute_skill("hang-thread", {"seconds": 1}, timeout=0.2)
+running = executor.get_stats()["pools"]["abandoned_threads"]
+await asyncio.sleep(1.2)
+return {"timed_out": timed_out, "running": running,
+        "finished": executor.get_stats()["pools"]["abandoned_threads"]}
+`);
+
+    expect(result.timed_out.error_type).to.equal('TimeoutError');
+    expect(result.timed_out.timeout_enforced).to.equal(false);
+    expect(result.timed_out.error).to.include('still running');
+    expect(result.running).to.equal(1);
+    expect(result.finished).to.equal(0);
+  });
+});
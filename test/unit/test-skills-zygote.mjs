@@ -0,0 +1,76 @@
+/**
+ * @fileoverview Testes unitários para o zygote dos workers de skills (servers/skills/zygote.py)
+ * @module test/unit/test-skills-zygote
+ */
+
+import { describe, it, before, after } from 'mocha';
+import { expect } from 'chai';
+import { spawn } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(__dirname, '..', '..');
+
+describe('Skills Bridge - Zygote dos Workers', function() {
+  this.timeout(30000);
+
+  let bridge;
+  const pending = new Map();
+  let nextId = 0;
+
+  function request(message) {
+    const requestId = `z-${nextId++}`;
+    return new Promise((resolve) => {
+      pending.set(requestId, resolve);
+      bridge.stdin.write(JSON.stringify({ ...message, requestId }) + '\n');
+    });
+  }
+
+  before(async () => {
+    bridge = spawn(process.env.PYTHON_PATH || 'python3', ['-m', 'servers.skills.bridge'], {
+      cwd: ROOT,
+      stdio: ['pipe', 'pipe', 'inherit'],
+      env: {
+        ...process.env,
+        MCP_SKILLS_PATH: path.join(ROOT, 'test', 'fixtures'),
+        MCP_SKILLS_ZYGOTE_PRELOAD: 'heavy-task-skill,no-such-skill'
+      }
+    });
+
+    const ready = new Promise((resolve) => pending.set(undefined, resolve));
+    readline.createInterface({ input: bridge.stdout }).on('line', (line) => {
+      const message = JSON.parse(line);
+      const resolve = pending.get(message.type === 'ready' ? undefined : message.requestId);
+      if (resolve) {
+        pending.delete(message.requestId);
+        resolve(message);
+      }
+    });
+    await ready;
+  });
+
+  after(() => {
+    bridge.kill();
+  });
+
+  it('deve criar workers a partir do zygote com as skills pré-carregadas', async () => {
+    const results = await Promise.all(
+      [1, 2, 3].map(() => request({ action: 'execute', skill: 'heavy-task-skill', params: { iterations: 10 } }))
+    );
+    for (const result of results) {
+      expect(result.success).to.equal(true);
+      expect(result.result.iterations).to.equal(10);
+    }
+
+    const { stats } = await request({ action: 'stats' });
+    const pool = stats.pools.process_pool;
+
+    expect(pool.start_method).to.equal('forkserver');
+    expect(pool.spawned).to.be.at.least(1);
+    expect(pool.zygote.preloaded).to.have.property('heavy-task-skill');
+    expect(pool.zygote.failed['no-such-skill']).to.include('FileNotFoundError');
+    expect(pool.zygote.frozen_objects).to.be.above(0);
+  });
+});